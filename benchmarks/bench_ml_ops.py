@@ -0,0 +1,74 @@
+"""
+benchmark of `BaseMLOp.serialize`/`BaseMLOp.load` (the model and its metadata zipped together) for each serializer
+that supports arbitrary models, on a trained scikit-learn random forest. run it with::
+
+    python benchmarks/bench_ml_ops.py --repeat 5
+"""
+import click
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+
+from chariots import versioning
+from chariots.ml import MLMode
+from chariots.ml.serializers import DillSerializer, PickleSerializer, JoblibSerializer
+from chariots.ml.sklearn import SKSupervisedOp
+
+from bench_utils import Results, format_results, measure
+
+SERIALIZERS = {
+    'dill': DillSerializer,
+    'pickle': PickleSerializer,
+    'joblib': JoblibSerializer,
+}
+
+
+def build_trained_op(serializer_cls: type, n_estimators: int) -> SKSupervisedOp:
+    """
+    builds a random forest op using a serializer and trains it
+
+    :param serializer_cls: the serializer the op should use
+    :param n_estimators: the number of trees of the forest
+    """
+    op_class = type('Forest{}'.format(serializer_cls.__name__), (SKSupervisedOp,), {
+        'model_class': RandomForestRegressor,
+        'model_parameters': versioning.VersionedFieldDict(versioning.VersionType.MAJOR,
+                                                          {'n_estimators': n_estimators, 'random_state': 0}),
+        'serializer_cls': serializer_cls,
+    })
+    random_state = np.random.RandomState(0)  # pylint: disable=no-member
+    x_train = random_state.rand(2000, 20)
+    ml_op = op_class(MLMode.FIT)
+    ml_op.fit(x_train, x_train.sum(axis=1))
+    return ml_op
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to benchmark a smaller model
+    :param repeat: the number of measures
+    """
+    results = {}
+    for serializer_name, serializer_cls in SERIALIZERS.items():
+        ml_op = build_trained_op(serializer_cls, n_estimators=5 if quick else 50)
+        serialized_op = ml_op.serialize()
+        results['forest_{}'.format(serializer_name)] = {
+            'size_mb': len(serialized_op) / 2 ** 20,
+            'serialize_s': measure(ml_op.serialize, repeat=repeat)['best_s'],
+            'load_s': measure(lambda ml_op=ml_op, serialized_op=serialized_op: ml_op.load(serialized_op),
+                              repeat=repeat)['best_s'],
+        }
+    return results
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='benchmark a smaller model')
+def main(repeat: int, quick: bool):
+    """benchmarks the serialization of the ML ops"""
+    click.echo(format_results('ml_ops', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,91 @@
+"""
+benchmark of the `Pipeline.load`/`Pipeline.save` round trips against a `TestOpStoreClient` (the op store server
+called through the flask test client with a sqlite database) seeded with a growing number of ops and versions. run it
+with::
+
+    python benchmarks/bench_op_store.py --repeat 5
+"""
+import tempfile
+
+import click
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+from chariots.ml import MLMode
+from chariots.ml.sklearn import SKSupervisedOp
+from chariots.pipelines import Pipeline
+from chariots.pipelines.nodes import Node
+from chariots.testing import TestOpStoreClient, seed_op_store
+
+from bench_runners import build_chain_nodes
+from bench_utils import Results, format_results, measure
+
+
+class LinearOp(SKSupervisedOp):
+    """the ML op of the benchmarked pipeline"""
+    model_class = LinearRegression
+
+
+def _build_pipeline() -> Pipeline:
+    """a pipeline of a few simple ops and an ML op"""
+    return Pipeline(build_chain_nodes(5, name='bench', output_node='value_5') + [
+        Node(LinearOp(MLMode.PREDICT), input_nodes=['value_5'], output_nodes='__pipeline_output__')
+    ], name='bench_pipeline')
+
+
+def _train(ml_op: SKSupervisedOp, random_state: np.random.RandomState):  # pylint: disable=no-member
+    x_train = random_state.rand(100, 1)
+    ml_op.fit(x_train, x_train.sum(axis=1))
+
+
+def build_seeded_store(n_ops: int) -> TestOpStoreClient:
+    """
+    builds an op store client with a fresh database seeded with `n_ops` ops (with ten versions and three links each)
+    and `n_ops // 100` versions of the ML op of the benchmarked pipeline
+
+    :param n_ops: the number of ops to seed the database with
+    """
+    op_store_client = TestOpStoreClient(tempfile.mkdtemp())
+    op_store_client.server.db.create_all()
+    seed_op_store(op_store_client.server, n_ops=n_ops, n_versions=10, n_links=3, seed=0)
+
+    pipeline = _build_pipeline()
+    op_store_client.register_new_pipeline(pipeline)
+    random_state = np.random.RandomState(0)  # pylint: disable=no-member
+    ml_node = pipeline.pipeline_nodes[-1]
+    for _ in range(max(1, n_ops // 100)):
+        _train(ml_node._op, random_state)  # pylint: disable=protected-access
+        pipeline.save(op_store_client)
+    return op_store_client
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to only benchmark small databases
+    :param repeat: the number of measures
+    """
+    results = {}
+    for n_ops in [0, 100] if quick else [0, 1000, 10000]:
+        op_store_client = build_seeded_store(n_ops)
+        pipeline = _build_pipeline()
+        results['store_{}_ops'.format(n_ops)] = {
+            'load_s': measure(lambda pipeline=pipeline, client=op_store_client: pipeline.load(client),
+                              repeat=repeat)['best_s'],
+            'save_s': measure(lambda pipeline=pipeline, client=op_store_client: pipeline.save(client),
+                              repeat=repeat)['best_s'],
+        }
+    return results
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='only benchmark small databases')
+def main(repeat: int, quick: bool):
+    """benchmarks the loading and saving of the pipelines"""
+    click.echo(format_results('op_store', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
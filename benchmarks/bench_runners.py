@@ -0,0 +1,86 @@
+"""
+benchmark of the overhead of the `SequentialRunner`: synthetic pipelines of N nodes (whose ops only add one to their
+input) are ran and the time spent per node is compared to calling the ops directly. run it with::
+
+    python benchmarks/bench_runners.py --repeat 5
+"""
+from typing import List
+
+import click
+
+from chariots.pipelines import Pipeline
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner
+
+from bench_utils import Results, format_results, measure
+
+
+def _add_one(self, value):  # pylint: disable=unused-argument
+    return value + 1
+
+
+def build_chain_nodes(n_nodes: int, name: str = 'chain', output_node: str = '__pipeline_output__') -> List[Node]:
+    """
+    builds `n_nodes` nodes executed one after the other (each node adds one to its input)
+
+    :param n_nodes: the number of nodes
+    :param name: the prefix of the names of the ops
+    :param output_node: the name of the output of the last node
+    """
+    chain_nodes = []
+    for i in range(n_nodes):
+        op_class = type('{}_add_one_{}'.format(name, i), (BaseOp,), {'execute': _add_one})
+        chain_nodes.append(Node(op_class(), input_nodes=['__pipeline_input__' if not i else 'value_{}'.format(i)],
+                                output_nodes='value_{}'.format(i + 1) if i < n_nodes - 1 else output_node))
+    return chain_nodes
+
+
+def build_chain_pipeline(n_nodes: int, name: str = 'chain') -> Pipeline:
+    """
+    builds a pipeline of `n_nodes` nodes executed one after the other (each node adds one to its input)
+
+    :param n_nodes: the number of nodes of the pipeline
+    :param name: the prefix of the name of the pipeline and of its ops
+    """
+    return Pipeline(build_chain_nodes(n_nodes, name), name='{}_{}'.format(name, n_nodes))
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to only benchmark small pipelines
+    :param repeat: the number of measures
+    """
+    results = {}
+    runner = SequentialRunner()
+    for n_nodes in [1, 10, 50] if quick else [1, 10, 100, 500]:
+        pipeline = build_chain_pipeline(n_nodes)
+        ops = [node._op for node in pipeline.pipeline_nodes]  # pylint: disable=protected-access
+        number = max(1, 2000 // n_nodes)
+
+        def call_ops(ops=ops):
+            value = 0
+            for chain_op in ops:
+                value = chain_op.execute(value)
+
+        run_time = measure(lambda pipeline=pipeline: runner.run(pipeline, 0), repeat=repeat, number=number)
+        ops_time = measure(call_ops, repeat=repeat, number=number)
+        results['sequential_{}_nodes'.format(n_nodes)] = {
+            'run_s': run_time['best_s'],
+            'per_node_overhead_s': (run_time['best_s'] - ops_time['best_s']) / n_nodes,
+        }
+    return results
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='only benchmark small pipelines')
+def main(repeat: int, quick: bool):
+    """benchmarks the overhead of the runners"""
+    click.echo(format_results('runners', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,165 @@
+"""
+benchmark of the serializers of `chariots.ml.serializers` on representative scikit-learn and keras models.
+
+for each model and each serializer, the benchmark measures the time to serialize the model, the time to deserialize it
+and the increase of the peak resident memory of a (fresh) process deserializing it (the serialized model itself
+included). `BaseMLOp.serialize`/`BaseMLOp.load` (the model zipped with its metadata) are benchmarked by
+`bench_ml_ops.py`. run it with::
+
+    python benchmarks/bench_serializers.py --repeat 5
+"""
+import functools
+import multiprocessing
+import resource
+from typing import Any, Callable
+
+import click
+import numpy as np
+
+from chariots.ml.serializers import DillSerializer, PickleSerializer, JoblibSerializer, NumpySerializer
+
+from bench_utils import Results, format_results, measure
+
+
+def build_random_forest(quick: bool) -> Any:
+    """a random forest (lots of medium sized arrays)"""
+    from sklearn.ensemble import RandomForestRegressor  # pylint: disable=import-outside-toplevel
+
+    random_state = np.random.RandomState(0)  # pylint: disable=no-member
+    x_train = random_state.rand(500 if quick else 5000, 20)
+    return RandomForestRegressor(n_estimators=5 if quick else 50, random_state=0).fit(x_train, x_train.sum(axis=1))
+
+
+def build_linear_model(quick: bool) -> Any:
+    """a linear model with a large coefficients matrix"""
+    from sklearn.linear_model import Ridge  # pylint: disable=import-outside-toplevel
+
+    random_state = np.random.RandomState(0)  # pylint: disable=no-member
+    n_features = 500 if quick else 5000
+    return Ridge().fit(random_state.rand(200 if quick else 2000, n_features),
+                       random_state.rand(200 if quick else 2000, 20 if quick else 200))
+
+
+def build_keras_model(quick: bool) -> Any:
+    """a dense keras network"""
+    from keras import models, layers  # pylint: disable=import-outside-toplevel
+
+    width = 256 if quick else 2048
+    model = models.Sequential([layers.Dense(width, input_shape=(width,)), layers.Dense(width), layers.Dense(10)])
+    model.compile(loss='mse', optimizer='adam')
+    return model
+
+
+def build_keras_weights(quick: bool) -> Any:
+    """the weights of a dense keras network (as saved by a data node)"""
+    return {'weights_{}'.format(i): array for i, array in enumerate(build_keras_model(quick).get_weights())}
+
+
+MODELS = {
+    'random_forest': build_random_forest,
+    'linear_model': build_linear_model,
+    'keras_model': build_keras_model,
+    'keras_weights': build_keras_weights,
+}
+
+SERIALIZERS = {
+    'dill': DillSerializer,
+    'pickle': PickleSerializer,
+    'joblib': JoblibSerializer,
+    'joblib_mmap': functools.partial(JoblibSerializer, mmap_mode='r'),
+    'numpy': NumpySerializer,
+}
+
+
+def _read_status_kb(field: str) -> int:
+    """reads a memory field (in kB) of the status of the current process (linux only)"""
+    with open('/proc/self/status') as status_file:
+        for line in status_file:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+    raise ValueError('unknown status field {}'.format(field))
+
+
+def _reset_peak_rss() -> int:
+    """
+    resets the peak resident memory of the process (so that the memory used by the imports is not taken into account)
+    and returns the current resident memory in kB
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+        return _read_status_kb('VmRSS')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _peak_rss_kb() -> int:
+    try:
+        return _read_status_kb('VmHWM')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure_load(serializer_factory: Callable, serialized_model: bytes, results: 'multiprocessing.Queue'):
+    """deserializes the model in a fresh process to measure its memory footprint"""
+    serializer = serializer_factory()
+    initial_rss = _reset_peak_rss()
+    model = serializer.deserialize_object(serialized_model)
+    results.put(_peak_rss_kb() - initial_rss)
+    del model
+
+
+def _measure_peak_rss(serializer_factory: Callable, serialized_model: bytes, repeat: int) -> float:
+    """
+    deserializes the model in fresh processes and returns the smallest increase of their peak resident memory (in MB)
+    """
+    peak_rss_increases = []
+    # spawning rather than forking as tensorflow does not support forks
+    context = multiprocessing.get_context('spawn')
+    for _ in range(repeat):
+        results = context.Queue()
+        process = context.Process(target=_measure_load, args=(serializer_factory, serialized_model, results))
+        process.start()
+        peak_rss_increases.append(results.get())
+        process.join()
+    return min(peak_rss_increases) / 2 ** 10
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to benchmark smaller models
+    :param repeat: the number of measures
+    """
+    results = {}
+    for model_name, build_model in MODELS.items():
+        model = build_model(quick)
+        for serializer_name, serializer_factory in SERIALIZERS.items():
+            serializer = serializer_factory()
+            try:
+                serialized_model = serializer.serialize_object(model)
+            except TypeError:
+                # the numpy serializer only supports arrays
+                continue
+            results['{}_{}'.format(model_name, serializer_name)] = {
+                'size_mb': len(serialized_model) / 2 ** 20,
+                'serialize_s': measure(lambda serializer=serializer, model=model: serializer.serialize_object(model),
+                                       repeat=repeat)['best_s'],
+                'load_s': measure(lambda serializer=serializer, serialized_model=serialized_model:
+                                  serializer.deserialize_object(serialized_model), repeat=repeat)['best_s'],
+                'peak_rss_mb': _measure_peak_rss(serializer_factory, serialized_model, 1 if quick else repeat),
+            }
+    return results
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='benchmark smaller models')
+def main(repeat: int, quick: bool):
+    """benchmarks the chariots serializers"""
+    click.echo(format_results('serializers', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,70 @@
+"""
+benchmark of the request throughput of the `PipelinesServer` (called through the flask test client, so the network is
+not taken into account) on synthetic pipelines of growing size, with and without a result cache. run it with::
+
+    python benchmarks/bench_server.py --repeat 5
+"""
+import json
+import tempfile
+
+import click
+
+from chariots.pipelines import PipelinesServer
+from chariots.pipelines.caches import InMemoryResultCache
+from chariots.testing import TestOpStoreClient
+
+from bench_runners import build_chain_pipeline
+from bench_utils import Results, format_results, measure
+
+
+def build_server(n_nodes: int, cached: bool) -> PipelinesServer:
+    """
+    builds a server serving a pipeline of `n_nodes` nodes
+
+    :param n_nodes: the number of nodes of the served pipeline
+    :param cached: whether the server uses a result cache
+    """
+    op_store_client = TestOpStoreClient(tempfile.mkdtemp())
+    op_store_client.server.db.create_all()
+    return PipelinesServer([build_chain_pipeline(n_nodes, name='served')], op_store_client=op_store_client,
+                           import_name='bench_server', result_cache=InMemoryResultCache() if cached else None)
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to send less requests
+    :param repeat: the number of measures
+    """
+    results = {}
+    n_requests = 50 if quick else 500
+    for n_nodes in [1, 20]:
+        for cached in [False, True]:
+            server = build_server(n_nodes, cached)
+            test_client = server.test_client()
+            route = '/pipelines/served_{}/main'.format(n_nodes)
+            payload = json.dumps({'pipeline_input': 0})
+
+            def call_pipeline(test_client=test_client, route=route, payload=payload):
+                response = test_client.post(route, data=payload, content_type='application/json')
+                assert response.status_code == 200, response.data
+
+            latency = measure(call_pipeline, repeat=repeat, number=n_requests)['best_s']
+            results['serve_{}_nodes{}'.format(n_nodes, '_cached' if cached else '')] = {
+                'latency_s': latency,
+                'throughput_rps': 1 / latency,
+            }
+    return results
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='send less requests')
+def main(repeat: int, quick: bool):
+    """benchmarks the throughput of the pipelines server"""
+    click.echo(format_results('server', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
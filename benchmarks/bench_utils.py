@@ -0,0 +1,108 @@
+"""
+helpers shared by the benchmarks of the `run_benchmarks.py` suite: timing functions, describing the environment the
+benchmarks ran in and storing/comparing the results (as JSON).
+"""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import chariots
+
+Results = Dict[str, Dict[str, float]]
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, number: int = 1,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    times a function
+
+    :param func: the function to time
+    :param repeat: the number of measures
+    :param number: the number of calls per measure (the time of a call is the time of a measure divided by `number`)
+    :param setup: a function called before each measure (not timed)
+
+    :return: the best and median times of a call (in seconds)
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return {'best_s': min(times), 'median_s': statistics.median(times)}
+
+
+def git_commit() -> str:
+    """the commit of the repository the benchmarks are ran from (`unknown` outside of a git repository)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def environment() -> Dict[str, str]:
+    """describes the environment the benchmarks are ran in"""
+    return {
+        'commit': git_commit(),
+        'chariots_version': chariots.__version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def save_results(path: str, results: Dict[str, Results]):
+    """
+    writes the results of the benchmarks (and their environment) in a JSON file
+
+    :param path: the path of the file
+    :param results: the results of each suite (suite -> benchmark -> measure -> value)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as results_file:
+        json.dump({'environment': environment(), 'results': results}, results_file, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> Dict[str, Results]:
+    """loads the results saved by `save_results`"""
+    with open(path) as results_file:
+        return json.load(results_file)['results']
+
+
+def compare(results: Dict[str, Results], baseline: Dict[str, Results],
+            tolerance: float = 0.2) -> List[Tuple[str, str, str, float, float]]:
+    """
+    compares the timings (the measures ending in `_s`) of two runs of the benchmarks
+
+    :param results: the results to check
+    :param baseline: the results to compare to
+    :param tolerance: the relative slowdown above which a measure is considered as a regression
+
+    :return: the regressions as `(suite, benchmark, measure, baseline value, value)` tuples
+    """
+    regressions = []
+    for suite, benchmarks in sorted(results.items()):
+        for benchmark, measures in sorted(benchmarks.items()):
+            for measure_name, value in sorted(measures.items()):
+                baseline_value = baseline.get(suite, {}).get(benchmark, {}).get(measure_name)
+                if not measure_name.endswith('_s') or not baseline_value:
+                    continue
+                if value > baseline_value * (1 + tolerance):
+                    regressions.append((suite, benchmark, measure_name, baseline_value, value))
+    return regressions
+
+
+def format_results(suite: str, results: Results) -> str:
+    """formats the results of a suite as a table"""
+    lines = []
+    for benchmark, measures in sorted(results.items()):
+        formatted_measures = '  '.join('{}={:.6g}'.format(name, value) for name, value in sorted(measures.items()))
+        lines.append('{:<12}{:<40}{}'.format(suite, benchmark, formatted_measures))
+    return '\n'.join(lines)
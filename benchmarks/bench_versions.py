@@ -0,0 +1,105 @@
+"""
+benchmark of the `chariots.versioning.Version` class (as used by the op store client when loading pipelines).
+
+the benchmark measures the time per version of parsing version strings (compared to the previous, `dateutil` based,
+implementation), hashing versions (in a fresh and an already hashed state), comparing them and building them. run it
+with::
+
+    python benchmarks/bench_versions.py --repeat 5
+"""
+import hashlib
+from typing import Callable, Dict, List
+
+import click
+from dateutil import parser
+
+from chariots.versioning import Version
+
+from bench_utils import Results, format_results, measure
+
+
+def _build_version_strings(n_versions: int) -> List[str]:
+    versions = []
+    for i in range(n_versions):
+        version = Version()
+        version.update_major(str(i % 10).encode('utf-8'))
+        version.update_minor(str(i % 100).encode('utf-8'))
+        version.update_patch(str(i).encode('utf-8'))
+        versions.append(str(version))
+    return versions
+
+
+def _dateutil_parse(version_string: str) -> Version:
+    """the previous implementation of `Version.parse` (as a baseline)"""
+    hash_str, creation_time = version_string.split('_')
+    major, minor, patch = hash_str.split('.')
+    return Version(major, minor, patch, parser.parse(creation_time))
+
+
+def _build_version(index: int) -> Version:
+    version = Version().update_major(b'major').update_minor(b'minor').update_patch(str(index).encode('utf-8'))
+    return version + Version().update_patch(hashlib.sha1(b'training').hexdigest().encode('utf-8'))
+
+
+def _measure_per_version(operation: Callable[[], None], n_operations: int, repeat: int) -> Dict[str, float]:
+    """times an operation over all the versions and returns the time per version"""
+    return {name: value / n_operations for name, value in measure(operation, repeat=repeat).items()}
+
+
+def run(quick: bool = False, repeat: int = 5) -> Results:
+    """
+    runs the benchmark
+
+    :param quick: whether to use fewer versions
+    :param repeat: the number of measures
+    """
+    n_versions = 1000 if quick else 10000
+    version_strings = _build_version_strings(n_versions)
+    parsed = [Version.parse(version_string) for version_string in version_strings]
+    shifted = parsed[1:] + parsed[:1]
+
+    def parse():
+        for version_string in version_strings:
+            Version.parse(version_string)
+
+    def dateutil_parse():
+        for version_string in version_strings:
+            _dateutil_parse(version_string)
+
+    def parse_and_hash():
+        for version_string in version_strings:
+            hash(Version.parse(version_string))
+
+    def cached_hash():
+        set(parsed)
+
+    def compare():
+        for left, right in zip(parsed, shifted):
+            left == right  # pylint: disable=pointless-statement
+            left > right  # pylint: disable=pointless-statement
+
+    def build_and_add():
+        for index in range(n_versions):
+            _build_version(index).major  # pylint: disable=expression-not-assigned
+
+    return {
+        'parse': _measure_per_version(parse, n_versions, repeat),
+        'parse_dateutil': _measure_per_version(dateutil_parse, n_versions, repeat),
+        'parse_and_hash': _measure_per_version(parse_and_hash, n_versions, repeat),
+        'cached_hash': _measure_per_version(cached_hash, n_versions, repeat),
+        # each pair of versions is compared twice (`==` and `>`)
+        'compare': _measure_per_version(compare, 2 * n_versions, repeat),
+        'build_and_add': _measure_per_version(build_and_add, n_versions, repeat),
+    }
+
+
+@click.command()
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='use fewer versions')
+def main(repeat: int, quick: bool):
+    """benchmarks the chariots versions"""
+    click.echo(format_results('versions', run(quick=quick, repeat=repeat)))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
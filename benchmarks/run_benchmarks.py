@@ -0,0 +1,81 @@
+"""
+runs the benchmark suite of chariots (offline, no redis or external server is needed):
+
+- `runners`: the overhead per node of the `SequentialRunner` on synthetic pipelines of N nodes
+- `ml_ops`: `BaseMLOp.serialize`/`BaseMLOp.load` for each serializer
+- `serializers`: the time to serialize and deserialize (and the memory needed to deserialize) representative
+  scikit-learn and keras models with each serializer
+- `versions`: parsing, hashing, comparing and building `Version` objects
+- `op_store`: `Pipeline.load`/`Pipeline.save` round trips against a `TestOpStoreClient` seeded with a growing number
+  of ops
+- `server`: the request throughput of the `PipelinesServer` through the flask test client
+
+the results are written as JSON (in `benchmarks/results/<commit>.json` by default) and can be compared to the results
+of a previous commit to spot regressions (the command fails if a timing is slower than the baseline by more than the
+tolerance)::
+
+    python benchmarks/run_benchmarks.py --quick
+    python benchmarks/run_benchmarks.py --baseline benchmarks/results/3c6b63d.json --tolerance 0.2
+"""
+import os
+import sys
+from typing import List, Optional
+
+import click
+
+import bench_ml_ops
+import bench_op_store
+import bench_runners
+import bench_serializers
+import bench_server
+import bench_versions
+from bench_utils import compare, format_results, git_commit, load_results, save_results
+
+SUITES = {
+    'runners': bench_runners.run,
+    'ml_ops': bench_ml_ops.run,
+    'op_store': bench_op_store.run,
+    'server': bench_server.run,
+    'serializers': bench_serializers.run,
+    'versions': bench_versions.run,
+}
+
+
+@click.command()
+@click.option('--suite', 'suite_names', multiple=True, type=click.Choice(sorted(SUITES)),
+              help='the suites to run (all of them by default)')
+@click.option('--repeat', default=5, help='number of times each measure is repeated')
+@click.option('--quick', is_flag=True, help='run smaller benchmarks (to check the suite rather than measure)')
+@click.option('--output', type=click.Path(dir_okay=False),
+              help='the file to write the results in (benchmarks/results/<commit>.json by default)')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False),
+              help='the results of a previous run to compare to')
+@click.option('--tolerance', default=0.2, help='the relative slowdown (compared to the baseline) that is reported as '
+                                               'a regression')  # pylint: disable=too-many-arguments
+def main(suite_names: List[str], repeat: int, quick: bool,
+         output: Optional[str], baseline: Optional[str], tolerance: float):
+    """runs the benchmarks and stores their results"""
+    results = {}
+    for suite_name in suite_names or SUITES:
+        results[suite_name] = SUITES[suite_name](quick=quick, repeat=repeat)
+        click.echo(format_results(suite_name, results[suite_name]))
+
+    output = output or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results',
+                                    '{}.json'.format(git_commit()))
+    save_results(output, results)
+    click.echo('results written in {}'.format(output))
+
+    if baseline is None:
+        return
+    regressions = compare(results, load_results(baseline), tolerance=tolerance)
+    for suite_name, benchmark, measure_name, baseline_value, value in regressions:
+        click.echo('REGRESSION {} {} {}: {:.6g} -> {:.6g} (+{:.0%})'.format(
+            suite_name, benchmark, measure_name, baseline_value, value, value / baseline_value - 1
+        ))
+    if regressions:
+        sys.exit(1)
+    click.echo('no regression compared to {}'.format(baseline))
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
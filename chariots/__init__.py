@@ -2,9 +2,12 @@
 
 from . import versioning
 from . import pipelines
-from . import ml
 from . import op_store
-from . import workers
+from ._helpers.lazy_imports import lazy_attributes
+
+# the machine learning integrations and the workers pull in heavy dependencies (keras, scikit-learn, rq, ...) and are
+# only imported when they are used
+__getattr__ = lazy_attributes(__name__, {'ml': '.ml', 'workers': '.workers'})
 
 
 __all__ = [
@@ -0,0 +1,243 @@
+"""
+module that implements the `chariots bench` and `chariots profile` commands: loading a pipeline from its reference,
+running it several times while recording the latency and memory of each node and profiling a run.
+"""
+import contextlib
+import cProfile
+import importlib
+import json
+import math
+import os
+import pickle
+import resource
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Text
+
+from .. import pipelines
+from ..pipelines import callbacks
+from . import metrics, profiling
+
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """
+    returns a percentile (using the nearest rank method) of sorted values (`None` if there are no values)
+
+    :param sorted_values: the values (sorted in ascending order)
+    :param percent: the percentile to compute (between 0 and 100)
+    """
+    if not sorted_values:
+        return None
+    # the smallest value such that at least `percent`% of the values are lower or equal to it
+    index = min(len(sorted_values) - 1, max(0, math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def load_pipeline_reference(reference: Text) -> 'pipelines.Pipeline':
+    """
+    imports a pipeline from its reference (`package.module:pipeline`). If the attribute is a function (rather than a
+    pipeline), it is called to build the pipeline. The current directory is added to the python path (so the modules
+    of the current project can be referenced)
+
+    :param reference: the reference of the pipeline
+
+    :raises ValueError: if the reference is not of the form `module:attribute`
+    :raises TypeError: if the reference does not point to a pipeline
+    """
+    module_name, _, attribute = reference.partition(':')
+    if not module_name or not attribute:
+        raise ValueError('the pipeline reference should be of the form `module:pipeline`, got {}'.format(reference))
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    pipeline = importlib.import_module(module_name)
+    for attribute_part in attribute.split('.'):
+        pipeline = getattr(pipeline, attribute_part)
+    if callable(pipeline) and not isinstance(pipeline, pipelines.Pipeline):
+        pipeline = pipeline()
+    if not isinstance(pipeline, pipelines.Pipeline):
+        raise TypeError('{} is not a pipeline but a {}'.format(reference, type(pipeline).__name__))
+    return pipeline
+
+
+def read_pipeline_input(path: Optional[Text]) -> Any:
+    """
+    reads the input of a pipeline from a file: a pickle file (`.pkl`, `.pickle`) or a json file (any other extension).
+    The input is `None` if no path is given.
+
+    :param path: the path of the file
+    """
+    if path is None:
+        return None
+    if os.path.splitext(path)[1] in {'.pkl', '.pickle'}:
+        with open(path, 'rb') as input_file:
+            return pickle.load(input_file)
+    with open(path) as input_file:
+        return json.load(input_file)
+
+
+def peak_rss_bytes() -> int:
+    """the peak resident memory of the process"""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macos and in kilobytes on linux
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+class _NodeTimingCallback(callbacks.PipelineCallback):
+    """records the latency and resident memory increase of each execution of the nodes and of the pipeline"""
+
+    def __init__(self):
+        self.node_latencies = {}
+        self.node_rss_increases = {}
+        self.run_latencies = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _starts(self) -> dict:
+        starts = getattr(self._local, 'starts', None)
+        if starts is None:
+            starts = self._local.starts = {}
+        return starts
+
+    def before_execution(self, pipeline: 'pipelines.Pipeline', args: List[Any]):
+        self._starts()[id(pipeline)] = time.perf_counter()
+
+    def after_execution(self, pipeline: 'pipelines.Pipeline', args: List[Any], output: Any):
+        self.run_latencies.append(time.perf_counter() - self._starts().pop(id(pipeline)))
+
+    def before_node_execution(self, pipeline: 'pipelines.Pipeline', node: 'BaseNode', args: List[Any]):
+        self._starts()[id(node)] = time.perf_counter(), metrics.current_rss_bytes()
+
+    def after_node_execution(self, pipeline: 'pipelines.Pipeline', node: 'BaseNode', args: List[Any], output: Any):
+        start_time, start_rss = self._starts().pop(id(node))
+        latency = time.perf_counter() - start_time
+        rss_increase = max(metrics.current_rss_bytes() - start_rss, 0)
+        with self._lock:
+            self.node_latencies.setdefault(node.name, []).append(latency)
+            self.node_rss_increases.setdefault(node.name, []).append(rss_increase)
+
+
+@contextlib.contextmanager
+def _attached_callback(pipeline: 'pipelines.Pipeline', callback: callbacks.PipelineCallback):
+    """attaches a callback to a pipeline for the duration of the block"""
+    pipeline.callbacks.append(callback)
+    try:
+        yield callback
+    finally:
+        pipeline.callbacks.remove(callback)
+
+
+class BenchmarkReport:
+    """
+    the report of a benchmark of a pipeline
+
+    :param run_latencies: the latencies of the runs of the pipeline (in seconds)
+    :param node_latencies: the latencies of the executions of each node (in seconds)
+    :param node_rss_increases: the increases of the resident memory during the executions of each node (in bytes)
+    :param peak_rss: the peak resident memory of the process (in bytes)
+    """
+
+    def __init__(self, run_latencies: List[float], node_latencies: Dict[Text, List[float]],
+                 node_rss_increases: Dict[Text, List[int]], peak_rss: int):
+        self.run_latencies = sorted(run_latencies)
+        self.node_latencies = {name: sorted(latencies) for name, latencies in node_latencies.items()}
+        self.node_rss_increases = node_rss_increases
+        self.peak_rss = peak_rss
+
+    @staticmethod
+    def _latency_summary(sorted_latencies: List[float]) -> Dict[Text, Optional[float]]:
+        return {
+            'p50_s': percentile(sorted_latencies, 50),
+            'p90_s': percentile(sorted_latencies, 90),
+            'p99_s': percentile(sorted_latencies, 99),
+            'max_s': sorted_latencies[-1] if sorted_latencies else None,
+        }
+
+    def summary(self) -> Dict[Text, Any]:
+        """the summary of the benchmark (as a json serializable dict)"""
+        return {
+            'pipeline': dict(self._latency_summary(self.run_latencies), iterations=len(self.run_latencies)),
+            'nodes': {
+                name: dict(self._latency_summary(latencies),
+                           max_rss_increase_bytes=max(self.node_rss_increases.get(name) or [0]))
+                for name, latencies in self.node_latencies.items()
+            },
+            'peak_rss_bytes': self.peak_rss,
+        }
+
+    def __str__(self):
+        summary = self.summary()
+        lines = ['{:<30}{:>12}{:>12}{:>12}{:>12}{:>16}'.format('node', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms',
+                                                               'rss_increase_mb')]
+        rows = [(name, node_summary, node_summary['max_rss_increase_bytes'])
+                for name, node_summary in summary['nodes'].items()]
+        rows.append(('<pipeline>', summary['pipeline'], None))
+        for name, latencies, rss_increase in rows:
+            lines.append('{:<30}{:>12.3f}{:>12.3f}{:>12.3f}{:>12.3f}{:>16}'.format(
+                name, *(latencies[key] * 1000 for key in ['p50_s', 'p90_s', 'p99_s', 'max_s']),
+                '{:.1f}'.format(rss_increase / 2 ** 20) if rss_increase is not None else ''
+            ))
+        lines.append('{} iterations, peak resident memory: {:.1f}MB'.format(
+            summary['pipeline']['iterations'], self.peak_rss / 2 ** 20
+        ))
+        return '\n'.join(lines)
+
+
+def benchmark_pipeline(pipeline: 'pipelines.Pipeline', pipeline_input: Any,
+                       runner: 'pipelines.runners.BaseRunner', iterations: int = 10,
+                       warmup: int = 1) -> BenchmarkReport:
+    """
+    runs a pipeline several times and records the latency and memory increase of each node
+
+    :param pipeline: the pipeline to benchmark
+    :param pipeline_input: the input to run the pipeline with
+    :param runner: the runner to run the pipeline with
+    :param iterations: the number of (recorded) runs
+    :param warmup: the number of runs before the recorded ones (to fill the caches, load lazy modules, ...)
+    """
+    for _ in range(warmup):
+        runner.run(pipeline, pipeline_input)
+    with _attached_callback(pipeline, _NodeTimingCallback()) as timing_callback:
+        for _ in range(iterations):
+            runner.run(pipeline, pipeline_input)
+    return BenchmarkReport(timing_callback.run_latencies, timing_callback.node_latencies,
+                           timing_callback.node_rss_increases, peak_rss_bytes())
+
+
+def cprofile_pipeline(pipeline: 'pipelines.Pipeline', pipeline_input: Any,
+                      runner: 'pipelines.runners.BaseRunner') -> cProfile.Profile:
+    """
+    profiles one run of a pipeline with the (deterministic) `cProfile` profiler
+
+    :param pipeline: the pipeline to profile
+    :param pipeline_input: the input to run the pipeline with
+    :param runner: the runner to run the pipeline with
+
+    :return: the profile of the run
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        runner.run(pipeline, pipeline_input)
+    finally:
+        profiler.disable()
+    return profiler
+
+
+def sample_pipeline(pipeline: 'pipelines.Pipeline', pipeline_input: Any, runner: 'pipelines.runners.BaseRunner',
+                    interval: float = 0.001) -> profiling.Sampler:
+    """
+    profiles one run of a pipeline with the sampling profiler of the `ProfilingCallback` (only the nodes executed in
+    the thread of the runner are sampled)
+
+    :param pipeline: the pipeline to profile
+    :param pipeline_input: the input to run the pipeline with
+    :param runner: the runner to run the pipeline with
+    :param interval: the time (in seconds) between two samples
+
+    :return: the sampler holding the samples of the run
+    """
+    sampler = profiling.Sampler(interval=interval)
+    with _attached_callback(pipeline, callbacks.ProfilingCallback(sample_rate=1., sampler=sampler)):
+        runner.run(pipeline, pipeline_input)
+    return sampler
@@ -0,0 +1,25 @@
+"""module to reassemble data that was processed in several parts (dataset parts, prediction batches, ...)"""
+import sys
+from typing import Any, List
+
+
+def concatenate(parts: List[Any]) -> Any:
+    """
+    concatenates parts of data: data frames and series (which keep their original index) and numpy arrays are
+    concatenated along their first axis and lists are chained. The list of the parts is returned for any other type.
+
+    :param parts: the parts to concatenate (in order)
+
+    :return: the concatenated data
+    """
+    if len(parts) == 1:
+        return parts[0]
+    # the parts can only be data frames (or arrays) if pandas (or numpy) was already imported by whoever built them
+    pd, np = sys.modules.get('pandas'), sys.modules.get('numpy')  # pylint: disable=invalid-name
+    if pd is not None and parts and all(isinstance(part, (pd.DataFrame, pd.Series)) for part in parts):
+        return pd.concat(parts)
+    if np is not None and parts and all(isinstance(part, np.ndarray) for part in parts):
+        return np.concatenate(parts)
+    if all(isinstance(part, list) for part in parts):
+        return [row for part in parts for row in part]
+    return parts
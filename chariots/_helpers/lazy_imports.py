@@ -0,0 +1,39 @@
+"""
+module to defer the import of the optional integrations of chariots (keras, scikit-learn, google cloud, rq, ...) until
+they are actually used, so `import chariots` stays fast for the workers and the command line tools that do not need them
+"""
+import importlib
+import sys
+from typing import Any, Callable, Mapping, Text
+
+
+def lazy_attributes(module_name: Text, attributes: Mapping[Text, Text]) -> Callable[[Text], Any]:
+    """
+    builds the `__getattr__` function (PEP 562) of a module whose attributes are only imported when they are first
+    accessed. As module level `__getattr__` is only supported from python 3.7, the attributes are imported right away
+    on older versions. In the `__init__` of a package::
+
+        __getattr__ = lazy_attributes(__name__, {'keras': '.keras', 'KerasOp': '.keras:KerasOp'})
+
+    :param module_name: the name of the module (its `__name__`)
+    :param attributes: the lazy attributes of the module mapped to where they are imported from: a module (absolute or
+                       relative to `module_name`) or a `module:attribute` reference
+
+    :return: the function to set as the `__getattr__` of the module
+    """
+
+    def __getattr__(name: Text) -> Any:  # pylint: disable=invalid-name
+        if name not in attributes:
+            raise AttributeError('module {} has no attribute {}'.format(module_name, name))
+        imported_module, _, attribute = attributes[name].partition(':')
+        value = importlib.import_module(imported_module, module_name)
+        if attribute:
+            value = getattr(value, attribute)
+        # caching the attribute on the module so `__getattr__` is not called again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    if sys.version_info < (3, 7):
+        for attribute_name in attributes:
+            __getattr__(attribute_name)
+    return __getattr__
@@ -0,0 +1,214 @@
+"""
+module that holds the (low overhead) metrics collected by chariots and renders them in the Prometheus text format.
+"""
+import bisect
+import math
+import os
+import resource
+import threading
+import time
+from typing import List, Optional, Text, Tuple
+
+from flask import Flask, Response, g, request
+
+
+Labels = Tuple[Tuple[Text, Text], ...]
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class Histogram:
+    """
+    a histogram with preallocated log-linear buckets (in the spirit of HDR histograms): each power of two between
+    `lowest` and `highest` is split in `buckets_per_octave` buckets, so recording a value is a single bisection in a
+    fixed list of bounds (values above `highest` go in the `+Inf` bucket).
+
+    :param lowest: the upper bound of the first bucket
+    :param highest: the lowest value of the `+Inf` bucket
+    :param buckets_per_octave: the number of buckets per power of two (the relative precision of the histogram)
+    """
+
+    def __init__(self, lowest: float, highest: float, buckets_per_octave: int = 1):
+        n_buckets = int(math.ceil(math.log2(highest / lowest) * buckets_per_octave)) + 1
+        self.bounds = [lowest * 2 ** (i / buckets_per_octave) for i in range(n_buckets)]
+        self.counts = [0] * (n_buckets + 1)
+        self.sum = 0.
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """
+        records a value in the histogram
+
+        :param value: the value to record
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def render(self, name: Text, labels: Labels) -> List[Text]:
+        """renders the cumulative buckets, the sum and the count of the histogram in the Prometheus text format"""
+        lines = []
+        cumulative_count = 0
+        for bound, count in zip(self.bounds + [float('inf')], self.counts):
+            cumulative_count += count
+            lines.append('{}_bucket{} {}'.format(name, _format_labels(labels + (('le', _format_bound(bound)),)),
+                                                 cumulative_count))
+        lines.append('{}_sum{} {}'.format(name, _format_labels(labels), self.sum))
+        lines.append('{}_count{} {}'.format(name, _format_labels(labels), self.count))
+        return lines
+
+
+class Counter:
+    """a monotonic counter"""
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def increment(self, amount: float = 1):
+        """
+        increments the counter
+
+        :param amount: the amount to add to the counter
+        """
+        with self._lock:
+            self.value += amount
+
+    def render(self, name: Text, labels: Labels) -> List[Text]:
+        """renders the counter in the Prometheus text format"""
+        return ['{}{} {}'.format(name, _format_labels(labels), self.value)]
+
+
+# the bounds of the different kinds of histograms (latencies in seconds, sizes in number of rows and memory in bytes)
+HISTOGRAM_BOUNDS = {
+    'seconds': (1e-5, 1e3),
+    'size': (1, 2 ** 30),
+    'bytes': (2 ** 10, 2 ** 36),
+}
+
+
+class MetricsRegistry:
+    """
+    the registry of all the metrics of a process. metrics are created the first time they are recorded (for a given
+    set of labels) and rendered together by the `/metrics` routes of the servers
+    """
+
+    def __init__(self):
+        self._metrics = {}  # name -> (type, help, unit, {labels: metric})
+        self._lock = threading.Lock()
+
+    def _get_metric(self, metric_type: Text,  # pylint: disable=too-many-arguments
+                    name: Text, help_text: Text, unit: Optional[Text], labels: Labels):
+        metrics = self._metrics.get(name)
+        if metrics is not None and labels in metrics[3]:
+            return metrics[3][labels]
+        with self._lock:
+            metrics = self._metrics.setdefault(name, (metric_type, help_text, unit, {}))
+            if labels not in metrics[3]:
+                metrics[3][labels] = Histogram(*HISTOGRAM_BOUNDS[unit]) if metric_type == 'histogram' else Counter()
+            return metrics[3][labels]
+
+    def observe(self, name: Text, value: float,  # pylint: disable=too-many-arguments
+                labels: Labels, help_text: Text = '', unit: Text = 'seconds'):
+        """
+        records a value in a histogram
+
+        :param name: the name of the histogram
+        :param value: the value to record
+        :param labels: the labels of the series (as a tuple of `(label, value)` pairs)
+        :param help_text: the description of the metric
+        :param unit: the kind of values recorded (`'seconds'`, `'size'` or `'bytes'`), this defines the bounds of the
+                     buckets of the histogram
+        """
+        self._get_metric('histogram', name, help_text, unit, labels).observe(value)
+
+    def increment(self, name: Text, labels: Labels, help_text: Text = '', amount: float = 1):
+        """
+        increments a counter
+
+        :param name: the name of the counter
+        :param labels: the labels of the series (as a tuple of `(label, value)` pairs)
+        :param help_text: the description of the metric
+        :param amount: the amount to add to the counter
+        """
+        self._get_metric('counter', name, help_text, None, labels).increment(amount)
+
+    def get(self, name: Text, labels: Labels):
+        """returns the metric (`Histogram` or `Counter`) recorded for some labels (`None` if it was never recorded)"""
+        return self._metrics.get(name, (None, None, None, {}))[3].get(labels)
+
+    def render(self) -> Text:
+        """renders all the metrics of the registry in the Prometheus text format"""
+        lines = []
+        with self._lock:
+            metrics = sorted((name, metric_type, help_text, dict(series))
+                             for name, (metric_type, help_text, _, series) in self._metrics.items())
+        for name, metric_type, help_text, series in metrics:
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} {}'.format(name, metric_type))
+            for labels, metric in sorted(series.items()):
+                lines.extend(metric.render(name, labels))
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """removes all the metrics of the registry"""
+        with self._lock:
+            self._metrics.clear()
+
+
+def _format_bound(bound: float) -> Text:
+    return '+Inf' if bound == float('inf') else '{:.6g}'.format(bound)
+
+
+def _format_labels(labels: Labels) -> Text:
+    if not labels:
+        return ''
+    formatted_labels = ('{}="{}"'.format(label, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                        for label, value in labels)
+    return '{{{}}}'.format(','.join(formatted_labels))
+
+
+def current_rss_bytes() -> int:
+    """returns the resident memory of the process (its peak resident memory on systems without `/proc`)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# the registry used by default by the metrics callback and the servers
+REGISTRY = MetricsRegistry()
+
+
+def instrument_flask_app(app: Flask, server_name: Text, registry: Optional[MetricsRegistry] = None):
+    """
+    records the latency of all the requests of a flask app (by endpoint and status) and adds a `/metrics` route to
+    the app that renders the registry in the Prometheus text format
+
+    :param app: the app to instrument
+    :param server_name: the name of the server (used as label of the request metrics)
+    :param registry: the registry to record the metrics in and to render (the default registry if `None`)
+    """
+    registry = registry or REGISTRY
+
+    def start_timer():
+        g.chariots_request_start = time.perf_counter()
+
+    def record_request(response):
+        start = getattr(g, 'chariots_request_start', None)
+        if start is not None and request.endpoint != 'metrics':
+            registry.observe('chariots_http_request_duration_seconds', time.perf_counter() - start,
+                             (('server', server_name), ('endpoint', str(request.endpoint)),
+                              ('status', str(response.status_code))),
+                             help_text='latency of the requests of the chariots servers')
+        return response
+
+    def metrics():
+        return Response(registry.render(), mimetype='text/plain; version=0.0.4')
+
+    app.before_request(start_timer)
+    app.after_request(record_request)
+    app.add_url_rule('/metrics', 'metrics', metrics, methods=['GET'])
@@ -0,0 +1,259 @@
+"""
+module that implements a (low overhead) statistical profiler: a background thread periodically samples the stacks of
+the threads being profiled (using `sys._current_frames`) and aggregates them by pipeline and node. The aggregated
+stacks can be rendered in the collapsed stack format (used by flamegraph.pl, speedscope, ...) or in the speedscope
+format.
+"""
+import collections
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+from flask import Flask, Response, request
+
+Frame = Tuple[Text, Text, int]
+Stack = Tuple[Frame, ...]
+
+# the maximum number of frames recorded per sample (the deepest frames are kept)
+MAX_DEPTH = 128
+
+
+class _ProfiledRun:  # pylint: disable=too-few-public-methods
+    """a run of a pipeline being profiled in some thread"""
+
+    def __init__(self, pipeline_name: Text, sample_after: float):
+        self.pipeline_name = pipeline_name
+        self.sample_after = sample_after
+        # the nodes being executed (nodes of sub-pipelines are stacked over the node of their parent pipeline)
+        self.node_names = []
+
+
+def _collect_stack(frame) -> Stack:
+    stack = []
+    while frame is not None and len(stack) < MAX_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+class Sampler:
+    """
+    samples the stacks of the threads running profiled pipelines every `interval` seconds. The sampling thread only
+    runs while some pipelines are being profiled and it sleeps until the first of them starts being sampled (the runs
+    that are only profiled once they are slow do not cost any sample before they reach their delay).
+
+    :param interval: the time (in seconds) between two samples
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        # (pipeline name, node name) -> stack -> number of samples
+        self.profiles = collections.defaultdict(collections.Counter)
+        self._runs = {}
+        self._lock = threading.Lock()
+        # notified when a run starts (so the sampling thread can start sampling it earlier than the other runs)
+        self._run_started = threading.Condition(self._lock)
+        self._thread = None
+
+    def start_run(self, pipeline_name: Text, delay: float = 0.):
+        """
+        starts profiling the current thread (if the thread is already profiled and executing a node, the pipeline is a
+        sub-pipeline and its samples are attributed to the pipeline that started the profiling)
+
+        :param pipeline_name: the name of the pipeline run by the thread
+        :param delay: the time (in seconds) after which the samples start to be recorded
+        """
+        with self._lock:
+            thread_id = threading.get_ident()
+            run = self._runs.get(thread_id)
+            if run is not None and run.node_names:
+                return
+            # runs of the thread that are not executing any node were interrupted by an error and are replaced
+            self._runs[thread_id] = _ProfiledRun(pipeline_name, time.perf_counter() + delay)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample_loop, name='chariots-profiler', daemon=True)
+                self._thread.start()
+            else:
+                self._run_started.notify()
+
+    def enter_node(self, node_name: Text):
+        """
+        marks the start of the execution of a node by the current thread (if it is profiled)
+
+        :param node_name: the name of the node
+        """
+        run = self._runs.get(threading.get_ident())
+        if run is not None:
+            run.node_names.append(node_name)
+
+    def exit_node(self, node_name: Text):
+        """
+        marks the end of the execution of a node by the current thread (if it is profiled)
+
+        :param node_name: the name of the node
+        """
+        run = self._runs.get(threading.get_ident())
+        if run is not None and run.node_names and run.node_names[-1] == node_name:
+            run.node_names.pop()
+
+    def end_run(self, pipeline_name: Text):
+        """
+        stops profiling the current thread (if the profiling was started by this pipeline)
+
+        :param pipeline_name: the name of the pipeline whose run ended
+        """
+        with self._lock:
+            thread_id = threading.get_ident()
+            run = self._runs.get(thread_id)
+            if run is not None and run.pipeline_name == pipeline_name:
+                del self._runs[thread_id]
+
+    def _sample_loop(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                runs = self._wait_for_sampled_runs()
+                if runs is None:
+                    self._thread = None
+                    return
+            self._sample(runs)
+
+    def _wait_for_sampled_runs(self) -> Optional[List[Tuple[int, _ProfiledRun]]]:
+        """
+        waits (holding the lock) until some runs are to be sampled and returns them (`None` once there are no more runs
+        to profile)
+        """
+        while self._runs:
+            now = time.perf_counter()
+            first_sample = min(run.sample_after for run in self._runs.values())
+            if first_sample <= now:
+                return [(thread_id, run) for thread_id, run in self._runs.items() if run.sample_after <= now]
+            self._run_started.wait(first_sample - now)
+        return None
+
+    def _sample(self, runs: List[Tuple[int, _ProfiledRun]]):
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        for thread_id, run in runs:
+            frame = frames.get(thread_id)
+            if frame is None:
+                continue
+            stack = _collect_stack(frame)
+            node_name = run.node_names[-1] if run.node_names else None
+            with self._lock:
+                self.profiles[run.pipeline_name, node_name][stack] += 1
+
+    def clear(self):
+        """removes all the recorded samples"""
+        with self._lock:
+            self.profiles.clear()
+
+    def get_samples(self, pipeline_name: Optional[Text] = None) -> Dict[Tuple[Text, Optional[Text]], Dict[Stack, int]]:
+        """
+        returns a copy of the recorded samples
+
+        :param pipeline_name: the pipeline to get the samples of (all the pipelines if `None`)
+        """
+        with self._lock:
+            return {key: dict(stacks) for key, stacks in self.profiles.items()
+                    if pipeline_name is None or key[0] == pipeline_name}
+
+
+def _format_frame(frame: Frame) -> Text:
+    name, file_name, line = frame
+    return '{} ({}:{})'.format(name, file_name, line)
+
+
+def _roots(pipeline_name: Text, node_name: Optional[Text]) -> List[Frame]:
+    """the pseudo frames used as roots of the stacks (the pipeline and the node being executed)"""
+    roots = [(pipeline_name, '<pipeline>', 0)]
+    if node_name is not None:
+        roots.append((node_name, '<node>', 0))
+    return roots
+
+
+def render_collapsed(samples: Dict[Tuple[Text, Optional[Text]], Dict[Stack, int]]) -> Text:
+    """
+    renders samples in the collapsed stack format (one `root;...;leaf count` line per stack)
+
+    :param samples: the samples to render (as returned by `Sampler.get_samples`)
+    """
+    collapsed = collections.Counter()
+    for (pipeline_name, node_name), stacks in samples.items():
+        roots = _roots(pipeline_name, node_name)
+        for stack, count in stacks.items():
+            frames = [root[0] for root in roots] + [_format_frame(frame) for frame in stack]
+            collapsed[';'.join(frame.replace(';', ':') for frame in frames)] += count
+    return ''.join('{} {}\n'.format(stack, count) for stack, count in sorted(collapsed.items()))
+
+
+def render_speedscope(samples: Dict[Tuple[Text, Optional[Text]], Dict[Stack, int]], interval: float,
+                      name: Text = 'chariots') -> Dict[Text, Any]:
+    """
+    renders samples in the speedscope file format (one sampled profile per pipeline)
+
+    :param samples: the samples to render (as returned by `Sampler.get_samples`)
+    :param interval: the sampling interval (used to weight the samples in seconds)
+    :param name: the name of the profile
+    """
+    frames = []
+    frame_indexes = {}
+    profiles = collections.OrderedDict()
+    for (pipeline_name, node_name), stacks in sorted(samples.items(), key=lambda item: (item[0][0],
+                                                                                        item[0][1] or '')):
+        profile = profiles.setdefault(pipeline_name, {
+            'type': 'sampled', 'name': pipeline_name, 'unit': 'seconds', 'startValue': 0, 'endValue': 0,
+            'samples': [], 'weights': [],
+        })
+        for stack, count in stacks.items():
+            indexes = []
+            for frame in _roots(pipeline_name, node_name) + list(stack):
+                if frame not in frame_indexes:
+                    frame_indexes[frame] = len(frames)
+                    frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                indexes.append(frame_indexes[frame])
+            profile['samples'].append(indexes)
+            profile['weights'].append(count * interval)
+            profile['endValue'] += count * interval
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'chariots',
+        'shared': {'frames': frames},
+        'profiles': list(profiles.values()),
+    }
+
+
+# the sampler used by default by the profiling callback and rendered by the `/debug/profile` route of the server
+SAMPLER = Sampler()
+
+
+def add_profile_route(app: Flask, sampler: Optional[Sampler] = None):
+    """
+    adds a `/debug/profile` route to a flask app that renders the samples of a sampler. The route accepts the
+    `format` (`collapsed`, the default, or `speedscope`) and `pipeline` (to only render the samples of a pipeline)
+    query parameters. The samples are removed with a `POST` to `/debug/profile/clear`
+
+    :param app: the app to add the route to
+    :param sampler: the sampler to render (the default sampler if `None`)
+    """
+    sampler = sampler or SAMPLER
+
+    def profile():
+        samples = sampler.get_samples(request.args.get('pipeline'))
+        output_format = request.args.get('format', 'collapsed')
+        if output_format == 'speedscope':
+            return Response(json.dumps(render_speedscope(samples, sampler.interval)), mimetype='application/json')
+        if output_format != 'collapsed':
+            return Response('unknown profile format {}'.format(output_format), status=400, mimetype='text/plain')
+        return Response(render_collapsed(samples), mimetype='text/plain')
+
+    app.add_url_rule('/debug/profile', 'profile', profile, methods=['GET'])
+
+    def clear_profile():
+        sampler.clear()
+        return Response('', status=204)
+
+    app.add_url_rule('/debug/profile/clear', 'clear_profile', clear_profile, methods=['POST'])
@@ -0,0 +1,44 @@
+"""
+helpers to exchange items between threads through bounded queues without blocking forever once the consumer (or the
+producer) stopped: every wait is done in short steps and gives up as soon as the stop event is set
+"""
+import queue
+import threading
+from typing import Any
+
+
+def put(item_queue: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+    """
+    puts an item in a queue unless the stop event gets set
+
+    :param item_queue: the queue to put the item in
+    :param item: the item to put
+    :param stop_event: the event signaling that the items are not consumed anymore
+
+    :return: whether or not the item was put
+    """
+    while not stop_event.is_set():
+        try:
+            item_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def get(item_queue: queue.Queue, stop_event: threading.Event, stopped: Any = None) -> Any:
+    """
+    gets an item from a queue unless the stop event gets set
+
+    :param item_queue: the queue to get the item from
+    :param stop_event: the event signaling that the items are not produced anymore
+    :param stopped: the value to return if the stop event got set
+
+    :return: the item (or `stopped` if the stop event got set)
+    """
+    while not stop_event.is_set():
+        try:
+            return item_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return stopped
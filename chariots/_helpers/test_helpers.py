@@ -3,6 +3,7 @@ module that provides importable and picklable ops for tests that need them
 """
 import subprocess
 import time
+from typing import List, Optional
 
 import numpy as np
 from keras import callbacks, models, layers, optimizers
@@ -29,6 +30,18 @@ class WaitOp(ops.BaseOp):
         return data
 
 
+class SlowIsPair(IsPair):
+    """`IsPair` op that takes (at least) `duration` seconds to execute"""
+
+    def __init__(self, duration=1., op_callbacks=None):
+        super().__init__(op_callbacks=op_callbacks)
+        self.duration = duration
+
+    def execute(self, data):  # pylint: disable=arguments-differ
+        time.sleep(self.duration)
+        return super().execute(data)
+
+
 class SKLROp(sklearn.SKSupervisedOp):
     """sci-kit learn linear regression op"""
     model_class = versioning.VersionedField(LinearRegression, versioning.VersionType.MINOR)
@@ -110,11 +123,13 @@ class FromArray(ops.BaseOp):
 class RQWorkerContext:
     """context helper that setups the rq workers needed for async pipeline executions"""
 
-    def __init__(self):
+    def __init__(self, queues: Optional[List[str]] = None):
         self.proc = None
+        self.queues = queues or ['chariots_workers']
 
     def __enter__(self):
-        self.proc = subprocess.Popen('rq worker chariots_workers', shell=True)
+        self.proc = subprocess.Popen('rq worker --worker-class rq.SimpleWorker {}'.format(' '.join(self.queues)),
+                                     shell=True)
         time.sleep(0.5)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,323 @@
+"""
+module that implements a minimal tracer to record the spans of the pipeline runs (and the op store calls they make)
+and export them in the Chrome trace format or to an OpenTelemetry (OTLP/HTTP) collector.
+
+spans are kept in a stack per thread: a span started while another one is active in the same thread is its child.
+The `child_span` function only records a span if a trace is active in the current thread (otherwise it does
+nothing), which allows to instrument code (such as the op store client) at no cost when tracing is not used.
+"""
+import contextlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Text
+
+import requests
+
+
+_LOCAL = threading.local()
+_FILE_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+
+TraceContext = Mapping[Text, Any]
+
+
+def _new_id(n_bytes: int) -> Text:
+    return '{:0{}x}'.format(random.getrandbits(n_bytes * 8), n_bytes * 2)
+
+
+class _Trace:  # pylint: disable=too-few-public-methods
+    """the spans of a trace recorded in the current process (exported once the local root span ends)"""
+
+    def __init__(self, trace_id: Text):
+        self.trace_id = trace_id
+        self.spans = []
+        self.lock = threading.Lock()
+
+
+class Span:  # pylint: disable=too-many-instance-attributes
+    """
+    a timed operation of a trace
+
+    :param tracer: the tracer that records the span
+    :param name: the name of the span
+    :param category: the category of the span (`pipeline`, `node`, `op_store`, ...)
+    :param trace: the trace the span belongs to
+    :param parent_id: the id of the parent span (`None` for root spans)
+    :param attributes: additional information on the span
+    """
+
+    def __init__(self, tracer: 'Tracer', name: Text, category: Text,  # pylint: disable=too-many-arguments
+                 trace: _Trace, parent_id: Optional[Text], attributes: Dict[Text, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.trace = trace
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = time.time()
+        self.end = None
+        self.process_id = os.getpid()
+        self.thread_id = threading.get_ident()
+
+    @property
+    def trace_id(self) -> Text:
+        """the id of the trace of this span"""
+        return self.trace.trace_id
+
+    @property
+    def context(self) -> Dict[Text, Any]:
+        """the context to propagate to create child spans in other processes (the workers for instance)"""
+        return {'trace_id': self.trace_id, 'span_id': self.span_id}
+
+
+def _stack() -> List[Span]:
+    stack = getattr(_LOCAL, 'stack', None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+def current_span() -> Optional[Span]:
+    """the span active in the current thread (`None` if no trace is active)"""
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def current_context() -> Optional[Dict[Text, Any]]:
+    """the context of the span active in the current thread (`None` if no trace is active)"""
+    span = current_span()
+    return span.context if span is not None else None
+
+
+class Tracer:
+    """
+    records spans and exports the traces once their (local) root span ends
+
+    :param exporters: the exporters to export the finished traces with
+    """
+
+    def __init__(self, exporters: List['BaseTraceExporter']):
+        self.exporters = exporters
+
+    def start_span(self, name: Text, category: Text = 'chariots', parent: Optional[Span] = None,
+                   parent_context: Optional[TraceContext] = None, **attributes: Any) -> Span:
+        """
+        starts a span and makes it the active span of the current thread
+
+        :param name: the name of the span
+        :param category: the category of the span
+        :param parent: the parent of the span (the span active in the current thread if `None`)
+        :param parent_context: the context of a remote parent span (created in another process)
+        :param attributes: additional information on the span
+
+        :return: the started span
+        """
+        parent = parent or current_span()
+        if parent_context is not None:
+            trace, parent_id = _Trace(parent_context['trace_id']), parent_context['span_id']
+        elif parent is not None:
+            trace, parent_id = parent.trace, parent.span_id
+        else:
+            trace, parent_id = _Trace(_new_id(16)), None
+        span = Span(self, name, category, trace, parent_id, attributes)
+        _stack().append(span)
+        return span
+
+    def end_span(self, span: Span, **attributes: Any):
+        """
+        ends a span (and all the spans that were started after it in the current thread and are still active)
+
+        :param span: the span to end
+        :param attributes: additional information to add to the span
+        """
+        stack = _stack()
+        if span in stack:
+            while stack[-1] is not span:
+                self.end_span(stack[-1], interrupted=True)
+            stack.pop()
+        span.attributes.update(attributes)
+        span.end = time.time()
+        with span.trace.lock:
+            span.trace.spans.append(span)
+        if not stack or stack[-1].trace is not span.trace:
+            # the local root of the trace ended, the trace is complete (for this process)
+            self.export(span.trace)
+
+    def record_span(self, name: Text, start: float, end: float, category: Text = 'chariots',
+                    **attributes: Any):
+        """
+        records a span that already happened as a child of the span active in the current thread
+
+        :param name: the name of the span
+        :param start: the start time of the span (as a timestamp)
+        :param end: the end time of the span (as a timestamp)
+        :param category: the category of the span
+        :param attributes: additional information on the span
+        """
+        parent = current_span()
+        if parent is None:
+            return
+        span = Span(self, name, category, parent.trace, parent.span_id, attributes)
+        span.start, span.end = start, end
+        with parent.trace.lock:
+            parent.trace.spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self, name: Text, category: Text = 'chariots', parent_context: Optional[TraceContext] = None,
+             **attributes: Any):
+        """
+        context manager that records a span around a block of code
+
+        :param name: the name of the span
+        :param category: the category of the span
+        :param parent_context: the context of a remote parent span (created in another process)
+        :param attributes: additional information on the span
+        """
+        span = self.start_span(name, category, parent_context=parent_context, **attributes)
+        try:
+            yield span
+        except Exception as error:
+            self.end_span(span, error=type(error).__name__)
+            raise
+        self.end_span(span)
+
+    def export(self, trace: _Trace):
+        """
+        exports the spans of a trace (exporting errors are logged rather than raised as tracing should never break the
+        pipelines)
+
+        :param trace: the trace to export
+        """
+        with trace.lock:
+            spans, trace.spans = trace.spans, []
+        if not spans:
+            return
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception('could not export trace %s with %s', trace.trace_id, exporter)
+
+
+@contextlib.contextmanager
+def child_span(name: Text, category: Text = 'chariots', **attributes: Any):
+    """
+    records a span around a block of code if a trace is active in the current thread (does nothing otherwise)
+
+    :param name: the name of the span
+    :param category: the category of the span
+    :param attributes: additional information on the span
+    """
+    parent = current_span()
+    if parent is None:
+        yield None
+        return
+    with parent.tracer.span(name, category, **attributes) as child:
+        yield child
+
+
+class BaseTraceExporter:  # pylint: disable=too-few-public-methods
+    """base class of the trace exporters"""
+
+    def export(self, spans: List[Span]):
+        """
+        exports the finished spans of a trace
+
+        :param spans: the spans to export
+        """
+        raise NotImplementedError()
+
+
+class ChromeTraceExporter(BaseTraceExporter):  # pylint: disable=too-few-public-methods
+    """
+    writes each trace in `{directory}/{trace_id}.json` using the (JSON array) Chrome trace event format. These files
+    can be opened with `chrome://tracing`, https://ui.perfetto.dev or speedscope to inspect the run as a flame chart.
+    The spans of a trace recorded by other processes (workers) are appended to the same file.
+
+    :param directory: the directory to write the traces in
+    """
+
+    def __init__(self, directory: Text):
+        self.directory = directory
+
+    def export(self, spans: List[Span]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, '{}.json'.format(spans[0].trace_id))
+        events = ''.join('{},\n'.format(json.dumps(self._to_event(span), default=str)) for span in spans)
+        with _FILE_LOCK:
+            with open(path, 'a') as trace_file:
+                if not trace_file.tell():
+                    # the closing bracket is optional in the JSON array format (which allows to append events)
+                    trace_file.write('[\n')
+                trace_file.write(events)
+
+    @staticmethod
+    def _to_event(span: Span) -> Dict[Text, Any]:
+        return {
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': span.start * 1e6,
+            'dur': (span.end - span.start) * 1e6,
+            'pid': span.process_id,
+            'tid': span.thread_id,
+            'args': dict(span.attributes, trace_id=span.trace_id, span_id=span.span_id, parent_id=span.parent_id),
+        }
+
+
+class OTLPExporter(BaseTraceExporter):  # pylint: disable=too-few-public-methods
+    """
+    sends the traces to an OpenTelemetry collector using the OTLP/HTTP protocol (with the JSON encoding)
+
+    :param endpoint: the url of the collector (such as `http://localhost:4318`), the spans are sent to
+                     `{endpoint}/v1/traces`
+    :param service_name: the name of the service the spans are attributed to
+    :param timeout: the timeout (in seconds) of the requests to the collector
+    """
+
+    def __init__(self, endpoint: Text, service_name: Text = 'chariots', timeout: float = 2.):
+        self.endpoint = endpoint.rstrip('/')
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]):
+        payload = {'resourceSpans': [{
+            'resource': {'attributes': [_otlp_attribute('service.name', self.service_name)]},
+            'scopeSpans': [{'scope': {'name': 'chariots'}, 'spans': [self._to_otlp(span) for span in spans]}],
+        }]}
+        response = requests.post('{}/v1/traces'.format(self.endpoint), json=payload, timeout=self.timeout)
+        response.raise_for_status()
+
+    @staticmethod
+    def _to_otlp(span: Span) -> Dict[Text, Any]:
+        otlp_span = {
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': 1,
+            'startTimeUnixNano': str(int(span.start * 1e9)),
+            'endTimeUnixNano': str(int(span.end * 1e9)),
+            'attributes': [_otlp_attribute(key, value) for key, value in sorted(span.attributes.items())] + [
+                _otlp_attribute('chariots.category', span.category)
+            ],
+        }
+        if span.parent_id is not None:
+            otlp_span['parentSpanId'] = span.parent_id
+        if 'error' in span.attributes:
+            otlp_span['status'] = {'code': 2, 'message': str(span.attributes['error'])}
+        return otlp_span
+
+
+def _otlp_attribute(key: Text, value: Any) -> Dict[Text, Any]:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
 """Console script for chariots."""
+import io
 import json
 import os
+import pstats
 import sys
 from pathlib import Path
 
@@ -10,6 +12,9 @@ import click
 from cookiecutter.main import cookiecutter
 
 import chariots
+from chariots import op_store, testing
+from chariots.pipelines import runners
+from chariots._helpers import benchmarking, profiling
 
 
 @click.group()
@@ -32,5 +37,110 @@ def new(config_file=None):
     return cookiecutter(template_path, extra_context=config, no_input=True)
 
 
+@main.command('load-test')
+@click.argument('url')
+@click.argument('pipeline_name')
+@click.option('--input', 'pipeline_input', default='null', help='the input of the pipeline (as json)')
+@click.option('--qps', default=10., help='the number of requests to send per second')
+@click.option('--duration', default=10., help='the duration of the load test (in seconds)')
+@click.option('--concurrency', default=8, help='the maximum number of requests being sent at once')
+@click.option('--json', 'as_json', is_flag=True, help='outputs the report as json')
+def load_test(url, pipeline_name, pipeline_input, qps, duration,  # pylint: disable=too-many-arguments
+              concurrency, as_json):
+    """
+    calls a pipeline of the pipelines server at URL at a constant rate and reports the latency percentiles
+    """
+    send_request = testing.pipeline_request_sender(url, pipeline_name, json.loads(pipeline_input))
+    report = testing.run_load_test(send_request, qps=qps, duration=duration, concurrency=concurrency)
+    click.echo(json.dumps(report.summary()) if as_json else str(report))
+
+
+RUNNERS = {
+    'sequential': runners.SequentialRunner,
+    'streaming': runners.StreamingRunner,
+}
+
+
+def _prepare_pipeline(pipeline_reference, input_file, op_store_url):
+    """loads the pipeline (and its ops if an op store is given) and its input"""
+    pipeline = benchmarking.load_pipeline_reference(pipeline_reference)
+    if op_store_url is not None:
+        pipeline.load(op_store.OpStoreClient(op_store_url))
+    return pipeline, benchmarking.read_pipeline_input(input_file)
+
+
+@main.command()
+@click.argument('pipeline_reference')
+@click.option('--input', 'input_file', type=click.Path(exists=True, dir_okay=False),
+              help='a json (or pickle) file holding the input of the pipeline')
+@click.option('--runner', 'runner_name', type=click.Choice(sorted(RUNNERS)), default='sequential',
+              help='the runner to run the pipeline with')
+@click.option('--iterations', default=10, help='the number of runs to record')
+@click.option('--warmup', default=1, help='the number of runs before the recorded ones')
+@click.option('--op-store-url', help='the url of an op store to load the ops of the pipeline from')
+@click.option('--json', 'as_json', is_flag=True, help='outputs the report as json')
+def bench(pipeline_reference, input_file, runner_name,  # pylint: disable=too-many-arguments
+          iterations, warmup, op_store_url, as_json):
+    """
+    runs the pipeline referenced by PIPELINE_REFERENCE (`module:pipeline`) several times and reports the latency
+    percentiles of each node and the peak memory
+    """
+    pipeline, pipeline_input = _prepare_pipeline(pipeline_reference, input_file, op_store_url)
+    report = benchmarking.benchmark_pipeline(pipeline, pipeline_input, RUNNERS[runner_name](), iterations=iterations,
+                                             warmup=warmup)
+    click.echo(json.dumps(report.summary()) if as_json else str(report))
+
+
+@main.command()
+@click.argument('pipeline_reference')
+@click.option('--input', 'input_file', type=click.Path(exists=True, dir_okay=False),
+              help='a json (or pickle) file holding the input of the pipeline')
+@click.option('--runner', 'runner_name', type=click.Choice(sorted(RUNNERS)), default='sequential',
+              help='the runner to run the pipeline with')
+@click.option('--mode', type=click.Choice(['cprofile', 'sampling']), default='cprofile',
+              help='the profiler to use: cProfile (deterministic) or the sampling profiler')
+@click.option('--output', type=click.Path(dir_okay=False),
+              help='the file to write the profile in (pstats, collapsed stacks or speedscope), printed if not set')
+@click.option('--format', 'output_format', type=click.Choice(['collapsed', 'speedscope']), default='collapsed',
+              help='the format of the sampling profile')
+@click.option('--interval', default=0.001, help='the time (in seconds) between two samples of the sampling profiler')
+@click.option('--sort', default='cumulative', help='the key to sort the printed cProfile stats by')
+@click.option('--limit', default=30, help='the number of functions to print for cProfile')
+@click.option('--op-store-url', help='the url of an op store to load the ops of the pipeline from')
+def profile(pipeline_reference, input_file, runner_name,  # pylint: disable=too-many-arguments,too-many-locals
+            mode, output, output_format, interval, sort, limit, op_store_url):
+    """
+    profiles one run of the pipeline referenced by PIPELINE_REFERENCE (`module:pipeline`)
+    """
+    pipeline, pipeline_input = _prepare_pipeline(pipeline_reference, input_file, op_store_url)
+    runner = RUNNERS[runner_name]()
+    if mode == 'cprofile':
+        profiler = benchmarking.cprofile_pipeline(pipeline, pipeline_input, runner)
+        if output is not None:
+            profiler.dump_stats(output)
+            click.echo('profile written in {}'.format(output))
+            return
+        stats_stream = io.StringIO()
+        pstats.Stats(profiler, stream=stats_stream).sort_stats(sort).print_stats(limit)
+        click.echo(stats_stream.getvalue())
+        return
+
+    samples = benchmarking.sample_pipeline(pipeline, pipeline_input, runner, interval=interval).get_samples()
+    if output_format == 'speedscope':
+        _output_profile(json.dumps(profiling.render_speedscope(samples, interval, name=pipeline.name)), output)
+    else:
+        _output_profile(profiling.render_collapsed(samples), output)
+
+
+def _output_profile(rendered_profile, output):
+    """prints a rendered profile or writes it in the output file (if any)"""
+    if output is None:
+        click.echo(rendered_profile, nl=False)
+        return
+    with open(output, 'w') as output_file:
+        output_file.write(rendered_profile)
+    click.echo('profile written in {}'.format(output))
+
+
 if __name__ == '__main__':
     sys.exit(main())  # pragma: no cover
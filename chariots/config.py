@@ -76,7 +76,8 @@ import yaml
 
 from .pipelines import runners, Pipeline, PipelinesClient, callbacks, PipelinesServer
 from .op_store import savers, OpStoreClient, OpStoreServer
-from .workers import BaseWorkerPool, RQWorkerPool
+from . import workers
+from .workers import BaseWorkerPool
 
 
 class PipelinesConfig:
@@ -87,7 +88,7 @@ class PipelinesConfig:
                  server_host: Optional[str] = None, server_port: Optional[Union[str, int]] = None,
                  pipelines: Optional[List[Pipeline]] = None,
                  pipeline_callbacks: Optional[List[callbacks.PipelineCallback]] = None,
-                 import_name: Optional[str] = None):
+                 import_name: Optional[str] = None, profile_route: bool = False):
         """
         :param runner: the runner to use to run the instance (both in the main server and in the workers. This should
                        either be A BaseRunner instance or a string describing the type of runner to use (
@@ -99,6 +100,8 @@ class PipelinesConfig:
         :param pipeline_callbacks: the callbacks to be used accross all the pipelines of the server. This parameter
                                    cannot be filled trough the config file and have to be filed programmatically.
         :param import_name: the import name of the resulting PipelinesServer
+        :param profile_route: whether or not the PipelinesServer serves the profiles of the `ProfilingCallback` on its
+                              `/debug/profile` route
         """
         self._check_runner(runner)
         self.runner = runner
@@ -107,6 +110,7 @@ class PipelinesConfig:
         self.pipelines = pipelines or []
         self.pipeline_callbacks = pipeline_callbacks or []
         self.import_name = import_name
+        self.profile_route = profile_route
 
     @classmethod
     def _check_runner(cls, runner):
@@ -140,12 +144,14 @@ class PipelinesConfig:
 class WorkersConfig:  # pylint: disable=too-few-public-methods
     """the configuration of Chariots Workerpolls"""
     _rq_workers_str = ['RQ', 'rq']
+    _local_workers_str = ['local', 'Local', 'LocalWorkerPool', 'local_worker_pool', 'local-worker-pool']
 
     def __init__(self, use_for_all: bool = False, worker_type: Optional[str] = None,
                  worker_pool_kwargs: Optional[Dict[str, Any]] = None):
         """
         :param use_for_all: whether or not all the pipelines should be executed asynchronously using workers
-        :param worker_type: the type of worker pool to use. This should be a string such as 'rq' for instance
+        :param worker_type: the type of worker pool to use. This should be a string such as 'rq' or 'local' (worker
+                            processes on the same machine as the server, that do not need a redis) for instance
         :param worker_pool_kwargs: additional keyword arguments to be passed down to the init of the WorkerPool
         """
         self.use_for_all = use_for_all
@@ -155,13 +161,15 @@ class WorkersConfig:  # pylint: disable=too-few-public-methods
 
     @classmethod
     def _check_worker_type(cls, worker_type: str):
-        if worker_type not in {*cls._rq_workers_str}:
+        if worker_type not in {*cls._rq_workers_str, *cls._local_workers_str}:
             raise ValueError('worker type {} not understood'.format(worker_type))
 
     def get_worker_pool(self) -> BaseWorkerPool:
         """get the WorkerPool corresponding to this configuration"""
         if self.worker_type in self._rq_workers_str:
-            return RQWorkerPool(**self.worker_pool_kwargs)
+            return workers.RQWorkerPool(**self.worker_pool_kwargs)
+        if self.worker_type in self._local_workers_str:
+            return workers.LocalWorkerPool(**self.worker_pool_kwargs)
         raise ValueError('worker type {} not understood'.format(self.worker_type))
 
 
@@ -290,7 +298,9 @@ class ChariotsConfig:
             worker_pool=self.pipelines_workers_config.get_worker_pool(),
             use_workers=self.pipelines_workers_config.use_for_all,
             app_pipelines=self.pipelines_config.pipelines,
-            import_name=self.pipelines_config.import_name
+            import_name=self.pipelines_config.import_name,
+            data_saver=self.op_store_config.get_saver(),
+            profile_route=self.pipelines_config.profile_route,
         )
 
     def get_op_store_server(self) -> OpStoreServer:
@@ -7,8 +7,9 @@ This modeule provides helpers for the most popular ML frameworks (sci-kit learn
 from ._ml_mode import MLMode
 from . import serializers
 from ._base_ml_op import BaseMLOp
-from . import sklearn
-from . import keras
+from .._helpers.lazy_imports import lazy_attributes
+
+__getattr__ = lazy_attributes(__name__, {'sklearn': '.sklearn', 'keras': '.keras'})
 
 __all__ = [
     'MLMode',
@@ -1,12 +1,17 @@
 """machine learning abstract Ops"""
+import collections.abc
 import io
 import json
 import time
 from abc import abstractmethod
-from typing import Optional, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Any, Tuple, Iterator, Callable
 from zipfile import ZipFile
 
+import numpy as np
+
 from .. import versioning
+from .._helpers import chunks
 from ..pipelines import callbacks, ops
 from . import serializers, MLMode
 
@@ -19,6 +24,11 @@ class BaseMLOp(ops.LoadableOp):
     - `FIT` for training the model
     - `PREDICT` to perform inference
     - `FIT_PREDICT` to do both (train and predict on the same dataset
+    - `FIT_INCREMENTAL` to update the model chunk by chunk (to train on datasets that do not fit in memory). In this
+      mode each input of the op must be an iterator of chunks (a generator reading a file chunk by chunk for instance)
+      and the version of the op is only updated once all the chunks have been consumed. The op can also be executed
+      by the `StreamingRunner`, in which case it is updated with each chunk of the stream in turn (any input that is
+      not an iterator is considered as a single chunk) and its version is updated once, at the end of the stream
 
     the usual workflow is to a have a training and a prediction pipeline. and to:
 
@@ -82,15 +92,35 @@ class BaseMLOp(ops.LoadableOp):
     - how to fit your op with the `fit` method
     - how to perform inference with your op with the `predict` method
     - define how to initialize a new model with the `_init_model` method
+    - optionally how to update your op on a stream of chunks with the `partial_fit` method (if you want to support the
+      `FIT_INCREMENTAL` mode)
 
     and eventually you can change the `serializer_cls` class attribute to change the serialization format of your model
 
+    To bound the memory used for inference on large inputs, you can set the `predict_batch_size` class attribute (a
+    `VersionedField`). Inputs with more rows than `predict_batch_size` are then predicted batch by batch. Array
+    predictions are written in a preallocated array (rather than concatenated) and the predictions of other types
+    (data frames, series, lists) are concatenated. If your model releases the GIL during inference (as most numpy based
+    scikit-learn estimators do), you can also set the `predict_n_jobs` class attribute to predict several batches at
+    once in a thread pool:
+
+    .. doctest::
+
+        >>> from chariots.versioning import VersionedField, VersionType
+        >>> class BatchedLogisticOp(LogisticOp):
+        ...     predict_batch_size = VersionedField(10000, VersionType.PATCH)
+        ...     predict_n_jobs = 4
+
     :param op_callbacks: :doc:`OpCallbacks objects<../pipelines/callbacks>` to change the behavior of the op by
                          executing some action before or after the op's execution
     """
 
     training_update_version = versioning.VersionType.PATCH
     serializer_cls = serializers.DillSerializer
+    # the maximum number of rows to predict at once (None to predict all the rows at once)
+    predict_batch_size = versioning.VersionedField(None, versioning.VersionType.PATCH)
+    # the number of threads to predict the batches with
+    predict_n_jobs = 1
 
     def __init__(self, mode: MLMode, op_callbacks: Optional[List[callbacks.OpCallBack]] = None):
         """
@@ -100,13 +130,21 @@ class BaseMLOp(ops.LoadableOp):
         self._call_mode = mode
         self.serializer = self.serializer_cls()
         self._model = self._init_model()
+        self._op_version_cache = None
         self._last_training_time = 0
+        # whether the op was trained on some chunks of the current stream (`None` outside of a stream)
+        self._trained_on_stream = None
 
     @property
     def allow_version_change(self):
         # we only want to check the version on prediction
         return self.mode != MLMode.PREDICT
 
+    @property
+    def requires_full_dataset(self):
+        # fitting the model needs the whole dataset (unless it is updated chunk by chunk)
+        return self.mode not in {MLMode.PREDICT, MLMode.FIT_INCREMENTAL}
+
     @property
     def mode(self) -> MLMode:
         """the mode this op was instantiated with"""
@@ -120,10 +158,13 @@ class BaseMLOp(ops.LoadableOp):
             self._fit(*args, **kwargs)
             return None
         if self.mode == MLMode.PREDICT:
-            return self.predict(*args, **kwargs)
+            return self._predict(*args, **kwargs)
         if self.mode == MLMode.FIT_PREDICT:
             self._fit(*args, **kwargs)
-            return self.predict(*args, **kwargs)
+            return self._predict(*args, **kwargs)
+        if self.mode == MLMode.FIT_INCREMENTAL:
+            self._partial_fit(*args, **kwargs)
+            return None
         raise ValueError('unknown mode for {}: {}'.format(type(self), self.mode))
 
     def _fit(self, *args, **kwargs):
@@ -133,6 +174,130 @@ class BaseMLOp(ops.LoadableOp):
         self.fit(*args, **kwargs)
         self._last_training_time = time.time()
 
+    def _predict(self, *args, **kwargs) -> Any:
+        """
+        method that wraps predict and splits the inputs in batches of `predict_batch_size` rows if necessary
+        """
+        n_rows = self._n_rows(args[0]) if args else None
+        if self.predict_batch_size is None or n_rows is None or n_rows <= self.predict_batch_size:
+            return self.predict(*args, **kwargs)
+
+        batches = [(start, min(start + self.predict_batch_size, n_rows))
+                   for start in range(0, n_rows, self.predict_batch_size)]
+
+        def predict_batch(batch: Tuple[int, int]) -> Any:
+            return self.predict(*[self._slice_rows(arg, *batch) for arg in args], **kwargs)
+
+        first_predictions = predict_batch(batches[0])
+        multi_output = self._is_multi_output(first_predictions, batches[0][1])
+        if not multi_output and not isinstance(first_predictions, np.ndarray):
+            # data frames, series, lists, ... are concatenated once all the batches are predicted
+            return chunks.concatenate([first_predictions] + list(self._map_batches(predict_batch, batches[1:])))
+        output = self._allocate_output(first_predictions, n_rows, multi_output)
+        self._write_predictions(output, first_predictions, batches[0], multi_output)
+        for batch, predictions in zip(batches[1:], self._map_batches(predict_batch, batches[1:])):
+            self._write_predictions(output, predictions, batch, multi_output)
+        return output
+
+    def _map_batches(self, predict_batch: Callable[[Tuple[int, int]], Any],
+                     batches: List[Tuple[int, int]]) -> Iterator[Any]:
+        """
+        iterates over the predictions of batches (in order), predicting `predict_n_jobs` batches at once
+        """
+        if self.predict_n_jobs <= 1:
+            for batch in batches:
+                yield predict_batch(batch)
+            return
+        with ThreadPoolExecutor(max_workers=self.predict_n_jobs) as executor:
+            yield from executor.map(predict_batch, batches)
+
+    @staticmethod
+    def _n_rows(data: Any) -> Optional[int]:
+        """
+        the number of rows of an input of the op (`None` if the input cannot be split in batches)
+        """
+        try:
+            return len(data)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _slice_rows(data: Any, start: int, stop: int) -> Any:
+        """
+        the rows `start` to `stop` of an input of the op
+        """
+        if hasattr(data, 'iloc'):
+            return data.iloc[start:stop]
+        return data[start:stop]
+
+    @staticmethod
+    def _is_multi_output(predictions: Any, n_rows: int) -> bool:
+        """
+        whether or not some predictions are the outputs of a model with multiple outputs (a list of arrays with a row
+        for each input row)
+        """
+        return isinstance(predictions, list) and len(predictions) != n_rows and all(
+            isinstance(output, np.ndarray) and len(output) == n_rows for output in predictions
+        )
+
+    @staticmethod
+    def _allocate_output(first_predictions: Any, n_rows: int, multi_output: bool) -> Any:
+        """
+        creates the array (or the list of arrays for multi output models) the predictions of each batch are written
+        into (using the predictions of the first batch to infer its shape and dtype)
+        """
+        if multi_output:
+            return [np.empty((n_rows,) + output.shape[1:], dtype=output.dtype) for output in first_predictions]
+        return np.empty((n_rows,) + first_predictions.shape[1:], dtype=first_predictions.dtype)
+
+    @staticmethod
+    def _write_predictions(output: Any, predictions: Any, batch: Tuple[int, int], multi_output: bool):
+        """
+        writes the predictions of a batch in the output
+        """
+        start, stop = batch
+        if multi_output:
+            for output_array, output_predictions in zip(output, predictions):
+                output_array[start:stop] = output_predictions
+            return
+        output[start:stop] = predictions
+
+    def _partial_fit(self, *args, **kwargs):
+        """
+        method that wraps partial_fit and performs necessary actions (update version once the whole stream got consumed,
+        at the end of the stream if the op is executed chunk by chunk by the `StreamingRunner`)
+        """
+        self.partial_fit(*args, **kwargs)
+        if self._trained_on_stream is not None:
+            self._trained_on_stream = True
+            return
+        self._last_training_time = time.time()
+
+    def start_stream(self):
+        self._trained_on_stream = False
+
+    def end_stream(self):
+        trained_on_stream, self._trained_on_stream = self._trained_on_stream, None
+        if trained_on_stream:
+            self._last_training_time = time.time()
+
+    @staticmethod
+    def _iter_chunks(data: Any) -> Iterator[Any]:
+        """
+        iterates over the chunks of an input of the op in the `FIT_INCREMENTAL` mode: an iterator of chunks or a single
+        chunk (as provided by the `StreamingRunner`)
+        """
+        if isinstance(data, collections.abc.Iterator):
+            return data
+        return iter([data])
+
+    def partial_fit(self, *args, **kwargs):
+        """
+        updates the inner model of the op on streams of chunks (in args and kwargs). This is only used in the
+        `FIT_INCREMENTAL` mode and must not return any data
+        """
+        raise ValueError('{} does not support the `FIT_INCREMENTAL` mode'.format(type(self).__name__))
+
     @abstractmethod
     def fit(self, *args, **kwargs):
         """
@@ -153,8 +318,31 @@ class BaseMLOp(ops.LoadableOp):
         method used to create a new (blank) model (used at initialisation)
         """
 
+    @property
+    def _last_training_time(self) -> float:
+        return self._training_time
+
+    @_last_training_time.setter
+    def _last_training_time(self, training_time: float):
+        # the version of the op changes every time it gets trained or loaded
+        self._training_time = training_time
+        self._op_version_cache = None
+
     @property
     def op_version(self):
+        # the version is requested on every call of the pipelines so it is only built (and finalized) once per training
+        # (or whenever the version of the class changes)
+        class_version = type(self).__version__
+        if self._op_version_cache is None or self._op_version_cache[0] is not class_version:
+            self._op_version_cache = class_version, self._build_op_version().finalize()
+        return self._op_version_cache[1]
+
+    def _build_op_version(self) -> versioning.Version:
+        """
+        builds the version of the op from the version of its class and its last training time. override this method
+        (rather than `op_version`) to add information to the version of your op, the result is cached by `op_version`
+        until the op is trained or loaded again
+        """
         time_version = versioning.Version().update(self.training_update_version,
                                                    str(self._last_training_time).encode('utf-8'))
         return super().op_version + time_version
@@ -9,3 +9,4 @@ class MLMode(Enum):
     FIT = 'fit'
     PREDICT = 'predict'
     FIT_PREDICT = 'fit_predict'
+    FIT_INCREMENTAL = 'fit_incremental'
@@ -1,11 +1,18 @@
 """Keras Op class"""
-from typing import Any, List, Union, Optional
+import collections.abc
+import queue
+import threading
+from typing import Any, List, Union, Optional, Iterator, Tuple
 
 import numpy as np
+from keras import utils
 
+from ..._helpers import stop_aware_queue
 from ...versioning import VersionedFieldDict
 from .. import MLMode, BaseMLOp
 
+_END_OF_CHUNKS = object()
+
 
 class KerasOp(BaseMLOp):
     """
@@ -86,20 +93,151 @@ class KerasOp(BaseMLOp):
 
         >>> shutil.rmtree(app_path)
 
+    If your training set does not fit in memory, the upstream nodes of the op can provide (instead of arrays):
+
+    - a `keras.utils.Sequence` of `(X, y)` batches (linked as the only input of the op). The model is then trained with
+      `fit_generator` and the batches are prepared by `workers` background threads (or processes if
+      `use_multiprocessing` is set) while the model trains.
+    - iterators of chunks (a generator of X chunks and a generator of y chunks or a single generator of `(X, y)`
+      chunks). The model is fitted on each chunk in turn (using the `input_params`) while the next chunks are
+      prepared in a background thread. As an iterator can only be consumed once, a stream of chunks is a single epoch
+      (the `epochs` of the `input_params` is ignored): run the training pipeline several times or provide a
+      `keras.utils.Sequence` to train for several epochs.
+
+    in both cases, at most `max_queue_size` batches or chunks are waiting in memory:
+
+    .. doctest::
+
+        >>> def chunks():
+        ...     for _ in range(3):
+        ...         X, y = IrisFullDataSet().execute()
+        ...         yield X, Categorize().execute(y)
+        >>> train_chunks = Pipeline([
+        ...     Node(KerasLinear(mode=MLMode.FIT, verbose=0, max_queue_size=2), input_nodes=['__pipeline_input__'])
+        ... ], 'train_chunks')
+        >>> runner.run(train_chunks, chunks())
+
+    the version of the op is only updated once all the chunks have been consumed. The chunks can also be provided to an
+    op in the `MLMode.FIT_INCREMENTAL` mode (the behavior is the same).
+
+    :param mode: the mode to use when instantiating the op
+    :param verbose: the verbosity level to give keras when training the model
+    :param max_queue_size: the maximum number of batches (or chunks) prefetched while the model trains
+    :param workers: the number of workers preparing the batches of a `keras.utils.Sequence`
+    :param use_multiprocessing: whether to use processes rather than threads as workers for the batches of a
+                                `keras.utils.Sequence`
     """
 
     input_params = VersionedFieldDict()
 
-    def __init__(self, mode: MLMode, verbose: Optional[int] = 1):
+    def __init__(self, mode: MLMode, verbose: Optional[int] = 1,  # pylint: disable=too-many-arguments
+                 max_queue_size: int = 10, workers: int = 1, use_multiprocessing: bool = False):
         super().__init__(mode)
         self.verbose_level = verbose
-
-    def fit(self, input_data_sets: Union[List[np.ndarray], np.ndarray],  # pylint: disable=arguments-differ
-            output_datasets: Union[List[np.ndarray], np.ndarray]):
+        self.max_queue_size = max_queue_size
+        self.workers = workers
+        self.use_multiprocessing = use_multiprocessing
+
+    def fit(self,  # pylint: disable=arguments-differ
+            input_data_sets: Union[List[np.ndarray], np.ndarray, utils.Sequence, Iterator],
+            output_datasets: Optional[Union[List[np.ndarray], np.ndarray, Iterator]] = None):
+        if isinstance(input_data_sets, utils.Sequence):
+            self._fit_sequence(input_data_sets)
+            return
+        if isinstance(input_data_sets, collections.abc.Iterator):
+            chunks = input_data_sets if output_datasets is None else zip(input_data_sets, output_datasets)
+            self._fit_chunks(chunks)
+            return
         self._model.fit(input_data_sets, output_datasets, verbose=self.verbose_level, **self.input_params)
 
+    def partial_fit(self,  # pylint: disable=arguments-differ
+                    input_chunks: Union[utils.Sequence, Iterator], output_chunks: Optional[Iterator] = None):
+        """
+        fits the model on a stream of chunks (used in the `MLMode.FIT_INCREMENTAL` mode)
+
+        :param input_chunks: a `keras.utils.Sequence` of `(X, y)` batches, an iterator of `(X, y)` chunks or an iterator
+                             of X chunks
+        :param output_chunks: an iterator of y chunks if `input_chunks` only provides the X chunks
+        """
+        self.fit(input_chunks, output_chunks)
+
+    def _fit_sequence(self, sequence: utils.Sequence):
+        """
+        fits the model on a keras `Sequence` of batches prepared in the background
+
+        :param sequence: the sequence of `(X, y)` batches to fit the model on
+        """
+        fit_params = dict(self.input_params)
+        # the batches are defined by the sequence
+        fit_params.pop('batch_size', None)
+        self._model.fit_generator(sequence, verbose=self.verbose_level, max_queue_size=self.max_queue_size,
+                                  workers=self.workers, use_multiprocessing=self.use_multiprocessing, **fit_params)
+
+    def _fit_chunks(self, chunks: Iterator[Tuple[Any, Any]]):
+        """
+        fits the model on each chunk in turn (one epoch over the stream), preparing the next chunks in a background
+        thread
+
+        :param chunks: an iterator of `(X, y)` chunks
+        """
+        fit_params = dict(self.input_params)
+        # the stream can only be consumed once: each chunk is seen once
+        fit_params.pop('epochs', None)
+        for x_chunk, y_chunk in self._prefetch(chunks):
+            self._model.fit(x_chunk, y_chunk, verbose=self.verbose_level, epochs=1, **fit_params)
+
+    def _prefetch(self, chunks: Iterator[Any]) -> Iterator[Any]:
+        """
+        iterates over chunks that are fetched in a background thread (up to `max_queue_size` chunks in advance)
+
+        :param chunks: the iterator to prefetch
+
+        :return: an iterator over the same chunks
+        """
+        chunk_queue = queue.Queue(maxsize=self.max_queue_size)
+        stop_event = threading.Event()
+
+        def fetch():
+            try:
+                for chunk in chunks:
+                    if not stop_aware_queue.put(chunk_queue, chunk, stop_event):
+                        return
+            except Exception as error:  # pylint: disable=broad-except
+                stop_aware_queue.put(chunk_queue, error, stop_event)
+                return
+            stop_aware_queue.put(chunk_queue, _END_OF_CHUNKS, stop_event)
+
+        threading.Thread(target=fetch, daemon=True).start()
+        try:
+            while True:
+                chunk = chunk_queue.get()
+                if chunk is _END_OF_CHUNKS:
+                    return
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            stop_event.set()
+
     def predict(self, input_datasets) -> Any:  # pylint: disable=arguments-differ
         return self._model.predict(input_datasets)
 
+    @staticmethod
+    def _is_multi_input(data: Any) -> bool:
+        """whether or not an input is made of the inputs of a model with multiple inputs (a list of arrays)"""
+        return isinstance(data, list) and bool(data) and all(isinstance(array, np.ndarray) for array in data)
+
+    @classmethod
+    def _n_rows(cls, data: Any) -> Optional[int]:
+        if cls._is_multi_input(data):
+            return len(data[0])
+        return super()._n_rows(data)
+
+    @classmethod
+    def _slice_rows(cls, data: Any, start: int, stop: int) -> Any:
+        if cls._is_multi_input(data):
+            return [array[start:stop] for array in data]
+        return super()._slice_rows(data, start, stop)
+
     def _init_model(self):
         raise NotImplementedError('you need to define the initialisation behavior of your NN')
@@ -25,15 +25,31 @@ there are for instance used to serialize the inner models of the machine learnin
     ...     serializer_cls = MySerializerCls
     ...
     ...     model_class = PCA
+
+for models holding large numpy arrays, the `PickleSerializer` (using the out of band buffers of the pickle protocol 5)
+and the `JoblibSerializer` (which can memory map the arrays of the model) are much faster than the default
+`DillSerializer`. For the array outputs of your nodes, the `NumpySerializer` saves them in the `.npy`/`.npz` formats
+and for data frames, the `ParquetSerializer` and `FeatherSerializer` (columnar formats) are much faster than the
+`CSVSerializer` and preserve the dtypes of the columns.
 """
 from ._base_serializer import BaseSerializer
 from ._csv_serialzer import CSVSerializer
 from ._dill_serializer import DillSerializer
 from ._json_serializer import JSONSerializer
+from ._pickle_serializer import PickleSerializer
+from ._joblib_serializer import JoblibSerializer
+from ._numpy_serializer import NumpySerializer
+from ._parquet_serializer import ParquetSerializer
+from ._feather_serializer import FeatherSerializer
 
 __all__ = [
     'BaseSerializer',
     'DillSerializer',
     'JSONSerializer',
     'CSVSerializer',
+    'PickleSerializer',
+    'JoblibSerializer',
+    'NumpySerializer',
+    'ParquetSerializer',
+    'FeatherSerializer',
 ]
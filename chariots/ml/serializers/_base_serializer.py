@@ -1,6 +1,6 @@
 """serializer's abstract classes"""
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Text
 
 
 class BaseSerializer(ABC):
@@ -32,3 +32,15 @@ class BaseSerializer(ABC):
 
         :return: the deserialized objects
         """
+
+    def deserialize_file(self, path: Text) -> Any:
+        """
+        returns the deserialized object from a file of the local file system. By default this reads the bytes of the
+        file but serializers that support memory mapping override it to avoid loading the whole file in memory
+
+        :param path: the path of the file on the local file system
+
+        :return: the deserialized objects
+        """
+        with open(path, 'rb') as file:
+            return self.deserialize_object(file.read())
@@ -0,0 +1,105 @@
+"""module to allow serializing data frames in the feather format"""
+import json
+import tempfile
+from typing import Any, List, Optional, Text
+
+from . import BaseSerializer
+from ._mmap_file import load_mmap_file
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:
+    pa = None
+
+# the key of the schema metadata holding the names of the index levels stored as columns
+_INDEX_METADATA_KEY = b'chariots_index'
+
+
+class FeatherSerializer(BaseSerializer):
+    """
+    A serializer to save a pandas data frame in the (arrow based) feather format. Feather is the fastest format to load
+    data frames from as the data is stored as it is laid out in memory (and it preserves the dtypes of the columns):
+
+    .. testsetup::
+
+        >>> import pandas as pd
+
+    .. doctest::
+
+        >>> serializer = FeatherSerializer(columns=['foo'])
+        >>> serializer.deserialize_object(serializer.serialize_object(pd.DataFrame({'foo': [1, 2], 'bar': [3, 4]})))
+           foo
+        0    1
+        1    2
+
+    As feather does not support indexes, the levels of a non default index are stored as (hidden) columns and restored
+    when the data frame is deserialized.
+
+    If `memory_map` is set, the serialized data frame is written in `mmap_directory` (once per distinct data frame,
+    only the files of the most recently loaded data frames are kept) and read from there using memory mapping. The
+    columns are then only read from the disk (or the page cache) when they are converted which makes loading large
+    datasets almost instant (and lets several processes share the same pages).
+
+    This serializer needs the `pyarrow` library to be installed.
+
+    :param columns: the columns to load when deserializing (all of them if `None`)
+    :param compression: the compression codec to use (`'lz4'`, `'zstd'`, `'uncompressed'` or `None` to use the default
+                        of pyarrow). compressed files cannot be memory mapped efficiently
+    :param memory_map: whether or not to use memory mapping to read the data frames
+    :param mmap_directory: the directory to write the memory mapped files in (the temp directory of the system if
+                           `None`)
+
+    :raises TypeError: if the node receives something other than a pandas `DataFrame`
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None,  # pylint: disable=too-many-arguments
+                 compression: Optional[str] = None, memory_map: bool = False, mmap_directory: Optional[str] = None):
+        if pa is None:
+            raise ImportError('the `FeatherSerializer` needs `pyarrow` to be installed')
+        self.columns = columns
+        self.compression = compression
+        self.memory_map = memory_map
+        self.mmap_directory = mmap_directory or tempfile.gettempdir()
+
+    def serialize_object(self, target: 'pd.DataFrame') -> bytes:
+        if not isinstance(target, pd.DataFrame):
+            raise TypeError('can only serialize pandas data frames to feather')
+        output = pa.BufferOutputStream()
+        write_kwargs = {'compression': self.compression} if self.compression is not None else {}
+        if target.index.equals(pd.RangeIndex(len(target))) and target.index.name is None:
+            feather.write_feather(target, output, **write_kwargs)
+            return output.getvalue().to_pybytes()
+        # feather does not support indexes: the levels of the index are stored as columns and restored when reading
+        index_columns = ['__index_level_{}__'.format(i) for i in range(target.index.nlevels)]
+        table = pa.Table.from_pandas(target.rename_axis(index_columns).reset_index(), preserve_index=False)
+        index_metadata = json.dumps({'columns': index_columns, 'names': list(target.index.names)})
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata[_INDEX_METADATA_KEY] = index_metadata.encode('utf-8')
+        table = table.replace_schema_metadata(schema_metadata)
+        feather.write_feather(table, output, **write_kwargs)
+        return output.getvalue().to_pybytes()
+
+    def deserialize_object(self, serialized_object: bytes) -> 'pd.DataFrame':
+        if not self.memory_map:
+            return self._read(pa.BufferReader(serialized_object))
+        return load_mmap_file(serialized_object, self.mmap_directory, 'feather', self.deserialize_file)
+
+    def deserialize_file(self, path: Text) -> 'pd.DataFrame':
+        return self._read(pa.memory_map(path) if self.memory_map else pa.OSFile(path))
+
+    def _read(self, source: Any) -> 'pd.DataFrame':
+        """reads a data frame (restoring its index) from a feather source (only reading the selected columns)"""
+        schema_metadata = pa.ipc.open_file(source).schema.metadata or {}
+        index_metadata = json.loads(schema_metadata[_INDEX_METADATA_KEY].decode('utf-8')) \
+            if _INDEX_METADATA_KEY in schema_metadata else None
+        columns = self.columns
+        if columns is not None and index_metadata is not None:
+            columns = index_metadata['columns'] + list(columns)
+        data_frame = feather.read_table(source, columns=columns).to_pandas()
+        if index_metadata is None:
+            return data_frame
+        data_frame = data_frame.set_index(index_metadata['columns'])
+        data_frame.index.names = index_metadata['names']
+        return data_frame
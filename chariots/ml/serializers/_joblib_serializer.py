@@ -0,0 +1,74 @@
+"""module for the joblib serializer"""
+import io
+import tempfile
+from typing import Any, Optional, Union, Text
+
+import joblib
+
+from . import BaseSerializer
+from ._mmap_file import load_mmap_file
+
+
+class JoblibSerializer(BaseSerializer):
+    """
+    serializes objects using joblib (which is optimized for objects holding large numpy arrays such as most
+    scikit-learn models).
+
+    .. testsetup::
+
+        >>> import numpy as np
+
+    .. doctest::
+
+        >>> serializer = JoblibSerializer()
+        >>> serializer.deserialize_object(serializer.serialize_object({'weights': np.arange(3)}))
+        {'weights': array([0, 1, 2])}
+
+    If `mmap_mode` is set, the arrays of the deserialized objects are memory mapped rather than loaded in memory: the
+    serialized object is written in `mmap_directory` (once per distinct object, only the files of the most recently
+    loaded objects are kept) and the arrays are read from there lazily. This allows several processes (the workers of
+    an app for instance) to share the same physical memory for a model. As the serializer is instantiated by the ML ops
+    without arguments, use a partial to use memory mapping for the model of an op:
+
+    .. testsetup::
+
+        >>> from sklearn.linear_model import LogisticRegression
+        >>> from chariots.ml.sklearn import SKSupervisedOp
+
+    .. doctest::
+
+        >>> from functools import partial
+        >>> class MemoryMappedLogistic(SKSupervisedOp):
+        ...     model_class = LogisticRegression
+        ...     serializer_cls = partial(JoblibSerializer, mmap_mode='r')
+
+    :param compress: the compression level to give to joblib (0 for no compression). compression is not compatible
+                     with memory mapping
+    :param mmap_mode: the memory mapping mode to load the arrays with (`'r'` for read only or `'c'` for copy on write)
+                      if `None` the objects are loaded in memory
+    :param mmap_directory: the directory to write the memory mapped files in (the temp directory of the system if
+                           `None`)
+
+    :raises ValueError: if both `compress` and `mmap_mode` are set
+    """
+
+    def __init__(self, compress: Union[int, bool] = 0, mmap_mode: Optional[str] = None,
+                 mmap_directory: Optional[str] = None):
+        if compress and mmap_mode is not None:
+            raise ValueError('compressed objects cannot be memory mapped')
+        self.compress = compress
+        self.mmap_mode = mmap_mode
+        self.mmap_directory = mmap_directory or tempfile.gettempdir()
+
+    def serialize_object(self, target: Any) -> bytes:
+        output = io.BytesIO()
+        joblib.dump(target, output, compress=self.compress)
+        return output.getvalue()
+
+    def deserialize_object(self, serialized_object: bytes) -> Any:
+        if self.mmap_mode is None:
+            return joblib.load(io.BytesIO(serialized_object))
+        return load_mmap_file(serialized_object, self.mmap_directory, 'joblib', self.deserialize_file)
+
+    def deserialize_file(self, path: Text) -> Any:
+        return joblib.load(path, mmap_mode=self.mmap_mode)
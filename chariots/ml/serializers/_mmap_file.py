@@ -0,0 +1,74 @@
+"""helper to write the serialized objects that need to be memory mapped to the disk"""
+import glob
+import hashlib
+import os
+import tempfile
+from typing import Any, Callable
+
+# the maximum number of memory mapped files kept in a directory (the least recently used ones are removed first)
+MAX_MMAP_FILES = 32
+
+
+def write_mmap_file(serialized_object: bytes, directory: str, extension: str) -> str:
+    """
+    writes serialized bytes in a file (named after their hash so that each distinct object is only written once) so
+    that they can be memory mapped. Only the `MAX_MMAP_FILES` most recently used files of the directory are kept: the
+    files of the objects that were not loaded recently are removed (the objects that still map them keep their pages,
+    the file is only removed from the directory)
+
+    :param serialized_object: the bytes to write
+    :param directory: the directory to write the file in
+    :param extension: the extension of the file
+
+    :return: the path of the file
+    """
+    path = os.path.join(directory, 'chariots_{}.{}'.format(hashlib.sha1(serialized_object).hexdigest(), extension))
+    try:
+        # marking the file as recently used
+        os.utime(path)
+        return path
+    except FileNotFoundError:
+        pass
+    # writing to a temporary file first so that concurrent loads never see a partial file
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(file_descriptor, 'wb') as file:
+        file.write(serialized_object)
+    os.replace(temp_path, path)
+    _remove_least_recently_used(directory, keep=path)
+    return path
+
+
+def load_mmap_file(serialized_object: bytes, directory: str, extension: str, load: Callable[[str], Any]) -> Any:
+    """
+    writes serialized bytes in a file (see `write_mmap_file`) and loads them from it
+
+    :param serialized_object: the bytes to write
+    :param directory: the directory to write the file in
+    :param extension: the extension of the file
+    :param load: the function that loads the object from the path of the file
+
+    :return: the loaded object
+    """
+    try:
+        return load(write_mmap_file(serialized_object, directory, extension))
+    except FileNotFoundError:
+        # another process removed the file between its write and its load
+        return load(write_mmap_file(serialized_object, directory, extension))
+
+
+def _remove_least_recently_used(directory: str, keep: str):
+    """removes the least recently used memory mapped files of a directory beyond `MAX_MMAP_FILES`"""
+    used_at = {}
+    for path in glob.glob(os.path.join(directory, 'chariots_*.*')):
+        try:
+            used_at[path] = os.path.getmtime(path)
+        except FileNotFoundError:
+            continue
+    for path in sorted(used_at, key=used_at.get, reverse=True)[MAX_MMAP_FILES:]:
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            # already removed by another process (or still opened on a platform that does not allow it)
+            continue
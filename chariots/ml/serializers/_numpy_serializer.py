@@ -0,0 +1,60 @@
+"""module to allow serializing numpy arrays in the npy and npz formats"""
+import io
+from typing import Mapping, Union, Optional, Text, Any
+
+import numpy as np
+
+from . import BaseSerializer
+
+
+class NumpySerializer(BaseSerializer):
+    """
+    A serializer to save numpy arrays (in the `.npy` format) or mappings of numpy arrays (in the `.npz` format). As
+    arrays are written as is (without pickling), this is the fastest way to save the array outputs of your nodes:
+
+    .. testsetup::
+
+        >>> import numpy as np
+
+    .. doctest::
+
+        >>> serializer = NumpySerializer()
+        >>> serializer.deserialize_object(serializer.serialize_object(np.arange(3)))
+        array([0, 1, 2])
+        >>> serializer.deserialize_object(serializer.serialize_object({'x': np.arange(2), 'y': np.ones(2)}))
+        {'x': array([0, 1]), 'y': array([1., 1.])}
+
+    :param compress: whether or not to compress the `.npz` archives (used for mappings of arrays)
+    :param mmap_mode: the memory mapping mode to use when loading `.npy` files from the local file system (through
+                      `deserialize_file`). `None` to load them in memory
+
+    :raises TypeError: if the node receives something other than a numpy array or a mapping of numpy arrays
+    """
+
+    def __init__(self, compress: bool = False, mmap_mode: Optional[str] = None):
+        self.compress = compress
+        self.mmap_mode = mmap_mode
+
+    def serialize_object(self, target: Union[np.ndarray, Mapping[str, np.ndarray]]) -> bytes:
+        output = io.BytesIO()
+        if isinstance(target, np.ndarray):
+            np.save(output, target, allow_pickle=False)
+            return output.getvalue()
+        if isinstance(target, Mapping) and all(isinstance(array, np.ndarray) for array in target.values()):
+            save_function = np.savez_compressed if self.compress else np.savez
+            save_function(output, **target)
+            return output.getvalue()
+        raise TypeError('can only serialize numpy arrays or mappings of numpy arrays, got {}'.format(type(target)))
+
+    def deserialize_object(self, serialized_object: bytes) -> Union[np.ndarray, Mapping[str, np.ndarray]]:
+        return self._unpack(np.load(io.BytesIO(serialized_object), allow_pickle=False))
+
+    def deserialize_file(self, path: Text) -> Union[np.ndarray, Mapping[str, np.ndarray]]:
+        return self._unpack(np.load(path, mmap_mode=self.mmap_mode, allow_pickle=False))
+
+    @staticmethod
+    def _unpack(loaded: Any) -> Union[np.ndarray, Mapping[str, np.ndarray]]:
+        if isinstance(loaded, np.ndarray):
+            return loaded
+        with loaded:
+            return {name: loaded[name] for name in loaded.files}
@@ -0,0 +1,59 @@
+"""module to allow serializing data frames in the parquet format"""
+from typing import List, Optional, Text
+
+from . import BaseSerializer
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import parquet
+except ImportError:
+    pa = None
+
+
+class ParquetSerializer(BaseSerializer):
+    """
+    A serializer to save a pandas data frame in the (columnar) parquet format. Unlike the `CSVSerializer`, the dtypes
+    of the columns are preserved and the data frame does not need to be parsed from text (which makes it much faster).
+    It also allows to only load some of the columns of the data frame:
+
+    .. testsetup::
+
+        >>> import pandas as pd
+
+    .. doctest::
+
+        >>> serializer = ParquetSerializer(columns=['foo'])
+        >>> serializer.deserialize_object(serializer.serialize_object(pd.DataFrame({'foo': [1, 2], 'bar': [3, 4]})))
+           foo
+        0    1
+        1    2
+
+    This serializer needs the `pyarrow` library to be installed.
+
+    :param columns: the columns to load when deserializing (all of them if `None`)
+    :param compression: the compression codec to use (`'snappy'`, `'gzip'`, `'brotli'`, ... or `None`)
+
+    :raises TypeError: if the node receives something other than a pandas `DataFrame`
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, compression: Optional[str] = 'snappy'):
+        if pa is None:
+            raise ImportError('the `ParquetSerializer` needs `pyarrow` to be installed')
+        self.columns = columns
+        self.compression = compression
+
+    def serialize_object(self, target: 'pd.DataFrame') -> bytes:
+        if not isinstance(target, pd.DataFrame):
+            raise TypeError('can only serialize pandas data frames to parquet')
+        output = pa.BufferOutputStream()
+        parquet.write_table(pa.Table.from_pandas(target), output, compression=self.compression)
+        return output.getvalue().to_pybytes()
+
+    def deserialize_object(self, serialized_object: bytes) -> 'pd.DataFrame':
+        table = parquet.read_table(pa.BufferReader(serialized_object), columns=self.columns,
+                                   use_pandas_metadata=True)
+        return table.to_pandas()
+
+    def deserialize_file(self, path: Text) -> 'pd.DataFrame':
+        return parquet.read_table(path, columns=self.columns, use_pandas_metadata=True, memory_map=True).to_pandas()
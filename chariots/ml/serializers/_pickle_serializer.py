@@ -0,0 +1,79 @@
+"""module for the pickle (protocol 5) serializer"""
+import io
+import struct
+import sys
+from typing import Any, Optional
+
+from . import BaseSerializer
+
+if sys.version_info < (3, 8):
+    try:
+        import pickle5 as pickle  # pylint: disable=import-error
+    except ImportError:
+        import pickle
+else:
+    import pickle
+
+# number of out of band buffers and length of the pickle stream
+_HEADER = struct.Struct('<IQ')
+_BUFFER_LENGTH = struct.Struct('<Q')
+
+
+class PickleSerializer(BaseSerializer):
+    """
+    serializes objects using pickle. If the protocol 5 is available (python 3.8+ or the `pickle5` backport) the large
+    buffers of the object (such as the data of numpy arrays) are serialized out of band: rather than being copied in
+    the pickle stream, they are written as is after it and loaded without having to go through the unpickler (this is
+    much faster than the `DillSerializer` for models with large arrays).
+
+    .. testsetup::
+
+        >>> import numpy as np
+
+    .. doctest::
+
+        >>> serializer = PickleSerializer()
+        >>> serializer.deserialize_object(serializer.serialize_object({'weights': np.arange(3)}))
+        {'weights': array([0, 1, 2])}
+
+    as other serializers, you can use it for the models of your ML ops using the `serializer_cls` class attribute.
+
+    :param protocol: the pickle protocol to use. If `None` the highest protocol available is used. out of band buffers
+                     are only used with the protocol 5 or higher
+    """
+
+    def __init__(self, protocol: Optional[int] = None):
+        self.protocol = protocol if protocol is not None else pickle.HIGHEST_PROTOCOL
+
+    def serialize_object(self, target: Any) -> bytes:
+        if self.protocol < 5:
+            return _HEADER.pack(0, 0) + pickle.dumps(target, protocol=self.protocol)
+        buffers = []
+        stream = pickle.dumps(target, protocol=self.protocol, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        output = io.BytesIO()
+        output.write(_HEADER.pack(len(raw_buffers), len(stream)))
+        for raw_buffer in raw_buffers:
+            output.write(_BUFFER_LENGTH.pack(raw_buffer.nbytes))
+        output.write(stream)
+        for raw_buffer in raw_buffers:
+            output.write(raw_buffer)
+        return output.getvalue()
+
+    def deserialize_object(self, serialized_object: bytes) -> Any:
+        n_buffers, stream_length = _HEADER.unpack_from(serialized_object)
+        offset = _HEADER.size
+        if not n_buffers:
+            return pickle.loads(serialized_object[offset:])
+        buffer_lengths = [_BUFFER_LENGTH.unpack_from(serialized_object, offset + i * _BUFFER_LENGTH.size)[0]
+                          for i in range(n_buffers)]
+        offset += n_buffers * _BUFFER_LENGTH.size
+        stream = memoryview(serialized_object)[offset:offset + stream_length]
+        # a single (writable) copy of all the buffers, the objects' buffers are views on it
+        buffers_data = memoryview(bytearray(memoryview(serialized_object)[offset + stream_length:]))
+        buffers = []
+        buffer_offset = 0
+        for buffer_length in buffer_lengths:
+            buffers.append(buffers_data[buffer_offset:buffer_offset + buffer_length])
+            buffer_offset += buffer_length
+        return pickle.loads(stream, buffers=buffers)
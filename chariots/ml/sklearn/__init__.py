@@ -31,13 +31,18 @@ of your operation (fit and/or predict):
 
     >>> train_pca = Pipeline([Node(IrisXDataSet(), output_nodes=["x"]), Node(PCAOp(MLMode.FIT), input_nodes=["x"])],
     ...                      'train_pca')
+
+To select the hyper parameters of a supervised model, you can subclass `SKSearchOp` which fits a grid of candidates in
+parallel and keeps the best one.
 """
 from ._base_sk_op import BaseSKOp
 from ._sk_supervised_op import SKSupervisedOp
 from ._sk_unsupervised_op import SKUnsupervisedOp
+from ._sk_search_op import SKSearchOp
 
 __all__ = [
     'SKSupervisedOp',
     'SKUnsupervisedOp',
+    'SKSearchOp',
     'BaseSKOp'
 ]
@@ -1,8 +1,9 @@
 """base class for sci-kit learn ops"""
-from typing import Any
+from typing import Any, Optional, List
 
 from ... import versioning
-from .. import BaseMLOp
+from ...pipelines import callbacks
+from .. import BaseMLOp, MLMode
 
 
 class BaseSKOp(BaseMLOp):
@@ -15,6 +16,12 @@ class BaseSKOp(BaseMLOp):
     # the parameters to use to init the model
     model_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
 
+    def __init__(self, mode: MLMode, op_callbacks: Optional[List[callbacks.OpCallBack]] = None):
+        super().__init__(mode, op_callbacks=op_callbacks)
+        if mode == MLMode.FIT_INCREMENTAL and not hasattr(self._model, 'partial_fit'):
+            raise ValueError('{} does not support `partial_fit` and cannot be used in the `FIT_INCREMENTAL` '
+                             'mode'.format(type(self._model).__name__))
+
     def _init_model(self):
         """
         initialises the model
@@ -0,0 +1,117 @@
+"""module to support hyper parameter searches over sci-kit learn supervised models"""
+from typing import Optional, List, Any, Mapping
+
+from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
+
+from ._sk_supervised_op import SKSupervisedOp
+from ... import versioning
+from ...pipelines import callbacks
+from .. import MLMode
+
+
+class SKSearchOp(SKSupervisedOp):
+    """
+    Op base class to select the hyper parameters of a scikit-learn supervised model. Rather than defining an op (and a
+    pipeline) for each set of parameters you want to try, you can define the parameters to search in the
+    `search_parameters` class attribute (a `VersionedFieldDict` mapping each parameter to the list of values to try):
+
+    .. testsetup::
+
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> from chariots.ml import MLMode
+        >>> from chariots._helpers.doc_utils import IrisFullDataSet
+
+    .. doctest::
+
+        >>> from sklearn.linear_model import LogisticRegression
+        >>> from chariots.versioning import VersionedFieldDict, VersionType
+        >>> class LogisticSearchOp(SKSearchOp):
+        ...     model_class = LogisticRegression
+        ...     model_parameters = VersionedFieldDict(VersionType.MAJOR, {'solver': 'lbfgs', 'multi_class': 'auto',
+        ...                                                               'max_iter': 1000})
+        ...     search_parameters = VersionedFieldDict(VersionType.MAJOR, {'C': [0.01, 1., 100.]})
+
+        >>> search_op = LogisticSearchOp(MLMode.FIT)
+        >>> train_logistics = Pipeline([
+        ...     Node(IrisFullDataSet(), output_nodes=["x", "y"]),
+        ...     Node(search_op, input_nodes=["x", "y"])
+        ... ], 'train_logistics')
+        >>> SequentialRunner().run(train_logistics)
+        >>> search_op.best_parameters
+        {'C': 100.0}
+
+    The candidates are fitted (and cross validated) in parallel in a pool of `n_jobs` processes. Large training sets
+    are memory mapped rather than copied to each of the worker processes. Once the search is over, the op keeps the
+    best candidate (refitted on the whole training set) as its model and the chosen parameters are incorporated in the
+    version of the op (using the `training_update_version` of the op).
+
+    Once trained (and saved), the op can be used in the `MLMode.PREDICT` mode as any `SKSupervisedOp`.
+
+    To change the behavior of the search, you can:
+
+    * change the `n_candidates` class attribute with a new `VersionedField` to only try a random sample of the
+      candidates (a randomized search) rather than all the combinations of the grid
+    * change the `search_cv` and `search_scoring` class attributes with new `VersionedField` to change how the
+      candidates are compared (using the scikit-learn `cv` and `scoring` semantics)
+    * change the `n_jobs` class attribute to change the number of worker processes (-1 to use all the cpus)
+
+    :param mode: the mode to use when instantiating the op
+    :param op_callbacks: :doc:`OpCallbacks objects<../pipelines/callbacks>` to change the behavior of the op by
+                         executing some action before or after the op's execution
+    """
+
+    # the values to try for each parameter
+    search_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
+    # the number of candidates to sample from the grid (None to try all of them)
+    n_candidates = versioning.VersionedField(None, versioning.VersionType.MAJOR)
+    search_cv = versioning.VersionedField(3, versioning.VersionType.MAJOR)
+    search_scoring = versioning.VersionedField(None, versioning.VersionType.MAJOR)
+    search_random_state = versioning.VersionedField(None, versioning.VersionType.MAJOR)
+    # the number of processes to fit the candidates with
+    n_jobs = -1
+
+    def __init__(self, mode: MLMode, op_callbacks: Optional[List[callbacks.OpCallBack]] = None):
+        if mode == MLMode.FIT_INCREMENTAL:
+            raise ValueError('hyper parameter searches cannot be used in the `FIT_INCREMENTAL` mode')
+        super().__init__(mode, op_callbacks=op_callbacks)
+
+    def _init_search(self):
+        """
+        creates the scikit-learn search object
+        """
+        search_parameters = {name: list(values) for name, values in self.search_parameters.items()}
+        if self.n_candidates is None:
+            return GridSearchCV(self._init_model(), search_parameters, scoring=self.search_scoring,
+                                cv=self.search_cv, n_jobs=self.n_jobs)
+        return RandomizedSearchCV(self._init_model(), search_parameters, n_iter=self.n_candidates,
+                                  scoring=self.search_scoring, cv=self.search_cv, n_jobs=self.n_jobs,
+                                  random_state=self.search_random_state)
+
+    def fit(self, X, y):  # pylint: disable=arguments-differ
+        """
+        method used by the operation to search for the best parameters and fit the underlying model with them
+
+        DO NOT TRY TO OVERRIDE THIS METHOD.
+
+        :param X: the input that the underlying supervised model will fit on (type must be compatible with the sklearn
+                  lib such as numpy arrays or pandas data frames)
+        :param y: the output that hte underlying supervised model will fit on (type must be compatible with the sklearn
+                  lib such as numpy arrays or pandas data frames)
+        """
+        search = self._init_search()
+        search.fit(X, y, **self.fit_extra_parameters)
+        self._model = search.best_estimator_
+
+    @property
+    def best_parameters(self) -> Mapping[str, Any]:
+        """the values of the searched parameters chosen for the current model of the op"""
+        model_parameters = self._model.get_params()
+        return {name: model_parameters[name] for name in self.search_parameters}
+
+    def _build_op_version(self) -> versioning.Version:
+        parameters_version = versioning.Version().update(
+            self.training_update_version, str(sorted(self.best_parameters.items())).encode('utf-8')
+        )
+        return super()._build_op_version() + parameters_version
@@ -1,4 +1,5 @@
 """module to support sci-kit learn supervised models"""
+import itertools
 from typing import Any
 
 from ._base_sk_op import BaseSKOp
@@ -41,10 +42,42 @@ class SKSupervisedOp(BaseSKOp):
     * change the `predict_function` class attribute with a new `VersionedField` (to use `predict_proba` for instance)
     * change the `fit_extra_parameters` class attribute with a new `VersionedFieldDict` (to pass some new parameters
       during prediction)
+    * change the `partial_fit_extra_parameters` class attribute with a new `VersionedFieldDict` (to pass some new
+      parameters to `partial_fit` such as the `classes` of a classifier)
+
+    If the underlying model supports `partial_fit` (such as `SGDClassifier` or `SGDRegressor`), you can use the
+    `MLMode.FIT_INCREMENTAL` mode to train on datasets that do not fit in memory. In this mode, the upstream nodes must
+    provide iterables of X and y chunks (the model is updated with each pair of chunks):
+
+    .. testsetup::
+
+        >>> import numpy as np
+        >>> from sklearn.linear_model import SGDRegressor
+        >>> from chariots.ml.sklearn import SKSupervisedOp
+        >>> from chariots.pipelines.ops import BaseOp
+        >>> from chariots.pipelines.runners import SequentialRunner
+
+    .. doctest::
+
+        >>> class ChunkedDataSet(BaseOp):
+        ...     def execute(self):
+        ...         x_chunks = (np.arange(i, i + 10).reshape(-1, 1) for i in range(0, 100, 10))
+        ...         y_chunks = (np.arange(i, i + 10) * 2 for i in range(0, 100, 10))
+        ...         return x_chunks, y_chunks
+
+        >>> class SGDOp(SKSupervisedOp):
+        ...     model_class = SGDRegressor
+
+        >>> train_incremental = Pipeline([
+        ...     Node(ChunkedDataSet(), output_nodes=["x", "y"]),
+        ...     Node(SGDOp(MLMode.FIT_INCREMENTAL), input_nodes=["x", "y"])
+        ... ], 'train_incremental')
+        >>> SequentialRunner().run(train_incremental)
     """
 
     predict_function = versioning.VersionedField('predict', versioning.VersionType.MAJOR)
     fit_extra_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
+    partial_fit_extra_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
 
     def fit(self, X, y):  # pylint: disable=arguments-differ
         """
@@ -59,6 +92,26 @@ class SKSupervisedOp(BaseSKOp):
         """
         self._model.fit(X, y, **self.fit_extra_parameters)
 
+    def partial_fit(self, X, y):  # pylint: disable=arguments-differ
+        """
+        method used by the operation to update the underlying model chunk by chunk (in the `FIT_INCREMENTAL` mode)
+
+        DO NOT TRY TO OVERRIDE THIS METHOD.
+
+        :param X: an iterator of input chunks or a single chunk (each chunk's type must be compatible with the sklearn
+                  lib such as numpy arrays or pandas data frames)
+        :param y: an iterator of output chunks (matching the chunks of `X`) or a single chunk
+
+        :raises ValueError: if `X` and `y` do not have the same number of chunks
+        """
+        missing_chunk = object()
+        for x_chunk, y_chunk in itertools.zip_longest(self._iter_chunks(X), self._iter_chunks(y),
+                                                      fillvalue=missing_chunk):
+            if x_chunk is missing_chunk or y_chunk is missing_chunk:
+                raise ValueError('the input and output streams of {} do not have the same number of '
+                                 'chunks'.format(self.name))
+            self._model.partial_fit(x_chunk, y_chunk, **self.partial_fit_extra_parameters)
+
     def predict(self, X) -> Any:  # pylint: disable=arguments-differ
         """
         method used internally by the op to predict with the underlying model.
@@ -30,9 +30,15 @@ class SKUnsupervisedOp(BaseSKOp):
         ...     Node(PCAOp(MLMode.PREDICT), input_nodes=["x"], output_nodes="x_transformed"),
         ...     Node(LogisticOp(MLMode.PREDICT), input_nodes=["x_transformed"], output_nodes=['__pipeline_output__'])
         ... ], 'pred')
+
+    If the underlying model supports `partial_fit` (such as `IncrementalPCA` or `MiniBatchKMeans`), you can use the
+    `MLMode.FIT_INCREMENTAL` mode to train the op on an iterable of chunks (to train on datasets that do not fit in
+    memory). You can pass extra parameters to `partial_fit` by changing the `partial_fit_extra_parameters` class
+    attribute.
     """
 
     fit_extra_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
+    partial_fit_extra_parameters = versioning.VersionedFieldDict(versioning.VersionType.MAJOR, {})
 
     def fit(self, X):  # pylint: disable=arguments-differ
         """
@@ -44,6 +50,18 @@ class SKUnsupervisedOp(BaseSKOp):
         """
         self._model.fit(X, **self.fit_extra_parameters)
 
+    def partial_fit(self, X):  # pylint: disable=arguments-differ
+        """
+        method used to update the underlying unsupervised model chunk by chunk (in the `FIT_INCREMENTAL` mode)
+
+        DO NOT TRY TO OVERRIDE THIS METHOD.
+
+        :param X: an iterator of chunks of the dataset or a single chunk (compatible type with the sklearn lib as pandas
+                  data-frames or numpy arrays).
+        """
+        for x_chunk in self._iter_chunks(X):
+            self._model.partial_fit(x_chunk, **self.partial_fit_extra_parameters)
+
     def predict(self, X) -> Any:  # pylint: disable=arguments-differ
         """
         transforms the dataset using the underlying unsupervised model
@@ -4,7 +4,6 @@
 import base64
 
 from flask import Flask, request, jsonify
-from flask_migrate import Migrate
 from sqlalchemy.orm import aliased
 
 from .models import db
@@ -13,6 +12,7 @@ from .models.op import DBOp
 from .models.validated_link import DBValidatedLink
 from .models.pipeline import DBPipeline
 from ..versioning import Version
+from .._helpers import metrics
 
 
 class OpStoreServer:
@@ -80,9 +80,12 @@ class OpStoreServer:
         self.db = db  # pylint: disable=invalid-name
         self.db.app = self.flask
         self.db.init_app(self.flask)
+        # alembic is slow to import and is only needed by the op store server (not by the clients)
+        from flask_migrate import Migrate  # pylint: disable=import-outside-toplevel
         self.migrate = Migrate(self.flask, self.db)
         self._saver = saver
         self._init_routes()
+        metrics.instrument_flask_app(self.flask, 'op_store')
 
     @property
     def _session(self):
@@ -7,6 +7,7 @@ from typing import Text, Set, Optional
 import requests
 
 from .. import versioning, pipelines  # pylint: disable=unused-import; # noqa
+from .._helpers import tracing
 
 
 class BaseOpStoreClient(abc.ABC):
@@ -16,6 +17,11 @@ class BaseOpStoreClient(abc.ABC):
     def post(self, route, arguments_json):
         """posts request the backend"""
 
+    def _traced_post(self, route, arguments_json):
+        """posts a request to the backend (recording a span if a pipeline is being traced)"""
+        with tracing.child_span(route.rsplit('/', 1)[-1], 'op_store'):
+            return self.post(route, arguments_json)
+
     def get_all_versions_of_op(self, desired_op: 'pipelines.ops.BaseOp') -> Optional[Set[versioning.Version]]:
         """
         returns all the available versions of an op ever persisted in the OpGraph (or any Opgraph using the same
@@ -23,7 +29,7 @@ class BaseOpStoreClient(abc.ABC):
 
         :param desired_op: the op to get the previous persisted versions
         """
-        response_json = self.post('/v1/get_all_versions_of_op', {'desired_op_name': desired_op.name})
+        response_json = self._traced_post('/v1/get_all_versions_of_op', {'desired_op_name': desired_op.name})
         if not response_json:
             return None
         return {versioning.Version.parse(version_string) for version_string in response_json['all_versions']}
@@ -41,7 +47,7 @@ class BaseOpStoreClient(abc.ABC):
         gets all the validated links (versions that works) between an upstream op and a downstream op (if none
         exist, `None` is returned)
         """
-        response_json = self.post('/v1/get_validated_links', {
+        response_json = self._traced_post('/v1/get_validated_links', {
             'downstream_op_name': downstream_op_name,
             'upstream_op_name': upstream_op_name
         })
@@ -61,7 +67,7 @@ class BaseOpStoreClient(abc.ABC):
         :return: the bytes of the op
         """
 
-        response_json = self.post('/v1/get_op_bytes_for_version', {
+        response_json = self._traced_post('/v1/get_op_bytes_for_version', {
             'desired_op_name': desired_op.name,
             'version': str(version)
         })
@@ -80,7 +86,7 @@ class BaseOpStoreClient(abc.ABC):
         :param op_bytes: the bytes of the op to save that will be persisted
         """
 
-        self.post('/v1/save_op_bytes', {
+        self._traced_post('/v1/save_op_bytes', {
             'op_name': op_to_save.name,
             'version': str(version),
             'bytes': base64.b64encode(op_bytes).decode('utf-8'),
@@ -98,7 +104,7 @@ class BaseOpStoreClient(abc.ABC):
         :return:
         """
 
-        self.post('/v1/register_valid_link', {
+        self._traced_post('/v1/register_valid_link', {
             'downstream_op_name': downstream_op_name,
             'upstream_op_name': upstream_op_name,
             'upstream_op_version': str(upstream_op_version)
@@ -116,7 +122,7 @@ class BaseOpStoreClient(abc.ABC):
         :return: a boolean (True if the pipeline exists)
         """
 
-        return self.post('/v1/pipeline_exists', {'pipeline_name': pipeline_name})['exists']
+        return self._traced_post('/v1/pipeline_exists', {'pipeline_name': pipeline_name})['exists']
 
     def register_new_pipeline(self, pipeline: 'pipelines.Pipeline'):
         """
@@ -128,7 +134,7 @@ class BaseOpStoreClient(abc.ABC):
 
         for upstream_node, downstream_node in pipeline.get_all_op_links():
             if downstream_node is None:
-                self.post('/v1/register_new_pipeline', {
+                self._traced_post('/v1/register_new_pipeline', {
                     'pipeline_name': pipeline.name,
                     'last_op_name': upstream_node.name
                 })
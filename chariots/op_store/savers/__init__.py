@@ -35,10 +35,12 @@ to create your own saver, you can subclass the :doc:`BaseSaver class<./chariots.
 """
 from ._base_saver import BaseSaver
 from ._file_saver import FileSaver
-from ._google_storage_saver import GoogleStorageSaver
+from ..._helpers.lazy_imports import lazy_attributes
+
+__getattr__ = lazy_attributes(__name__, {'GoogleStorageSaver': '._google_storage_saver:GoogleStorageSaver'})
 
 __all__ = [
     'FileSaver',
-    'GoogleStorageSaver',
+    'GoogleStorageSaver',  # pylint: disable=undefined-all-variable
     'BaseSaver'
 ]
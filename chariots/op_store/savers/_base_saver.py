@@ -1,6 +1,6 @@
 """abstract saver module"""
 from abc import ABC
-from typing import Text
+from typing import Text, Optional
 
 
 class BaseSaver(ABC):
@@ -39,5 +39,17 @@ class BaseSaver(ABC):
 
         :return: saved bytes
 
-        :raises FileNotFoundError: if the file does not exist
+        :raises FileNotFoundError: if the file does not exist (whatever the storage behind the saver, the callers rely
+                                   on this error to detect missing objects)
         """
+
+    def get_local_path(self, path: Text) -> Optional[Text]:  # pylint: disable=unused-argument,no-self-use
+        """
+        the path of a saved object on the local file system (if the saver persists to it). This allows serializers to
+        memory map the saved files rather than loading their bytes. `None` for savers that persist remotely
+
+        :param path: the path of the object in the saver
+
+        :return: the path of the object on the local file system or `None`
+        """
+        return None
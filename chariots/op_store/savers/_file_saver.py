@@ -1,6 +1,6 @@
 """file saver module"""
 import os
-from typing import Text
+from typing import Text, Optional
 
 from . import BaseSaver
 
@@ -33,3 +33,6 @@ class FileSaver(BaseSaver):
         object_path = self._build_path(path)
         with open(object_path, 'rb') as file:
             return file.read()
+
+    def get_local_path(self, path: Text) -> Optional[Text]:
+        return self._build_path(path)
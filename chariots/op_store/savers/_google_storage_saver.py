@@ -2,6 +2,7 @@
 
 from typing import Text, Optional, Mapping
 
+from google.api_core import exceptions
 from google.cloud import storage
 from . import BaseSaver
 
@@ -31,7 +32,11 @@ class GoogleStorageSaver(BaseSaver):
         blob = self.bucket.get_blob(path)
         if blob is None:
             raise FileNotFoundError('{} does not exist'.format(path))
-        return blob.download_as_string()
+        try:
+            return blob.download_as_string()
+        except exceptions.NotFound:
+            # the blob was deleted between the metadata request and the download
+            raise FileNotFoundError('{} does not exist'.format(path))
 
     def __getstate__(self):
         self.bucket = None
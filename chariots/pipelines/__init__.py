@@ -5,6 +5,7 @@ module that allows you to create chariots pipelines. Chariots pipelines are cons
 from . import ops
 from . import runners
 from . import nodes
+from . import caches
 from ._pipeline import Pipeline
 from . import callbacks
 from .pipelines_server import PipelinesServer, PipelineResponse
@@ -19,5 +20,6 @@ __all__ = [
     'ops',
     'nodes',
     'callbacks',
-    'runners'
+    'runners',
+    'caches',
 ]
@@ -1,9 +1,9 @@
 """module for the `Pipeline` class"""
-from typing import List, Optional, Set, Dict, Any, Mapping, Text, Tuple
+from typing import List, Optional, Set, Dict, Any, Mapping, Text, Tuple, Union
 
 from .. import op_store
 from ..versioning import Version
-from . import nodes, callbacks, ops, runners  # pylint: disable=unused-import; # noqa
+from . import nodes, callbacks, ops, runners, caches  # pylint: disable=unused-import; # noqa
 from .nodes._base_nodes import NodeReference
 from .._helpers.typing import SymbolicToRealMapping, ResultDict
 
@@ -78,17 +78,20 @@ class Pipeline(ops.BaseOp):
     :param use_worker: whether or not to execute this pipeline in a separate worker (rather than in the main server) by
                        default. If set to `False`, the setting can still be overridden on an execution per execution
                        basis using the client.
+    :param result_cache: an optional :doc:`result cache<./caches>` used by the `PipelinesServer` to avoid re-executing
+                         this pipeline on inputs it has already seen. Only use this with deterministic pipelines.
     """
 
-    def __init__(self, pipeline_nodes: List['nodes.BaseNode'], name: str,
+    def __init__(self, pipeline_nodes: List['nodes.BaseNode'], name: str,  # pylint: disable=too-many-arguments
                  pipeline_callbacks: Optional[List[callbacks.PipelineCallback]] = None,
-                 use_worker: Optional[bool] = None):
+                 use_worker: Optional[bool] = None, result_cache: Optional['caches.BaseResultCache'] = None):
         """
         """
         super().__init__(pipeline_callbacks)
         self._graph = self._resolve_graph(pipeline_nodes)
         self._name = name
         self.use_worker = use_worker
+        self.result_cache = result_cache
 
     @property
     def name(self) -> str:
@@ -164,6 +167,53 @@ class Pipeline(ops.BaseOp):
         raise ValueError('pipelines cannot be executed through the `execute`method. use a runner with '
                          '`runner.run(this_pipeline)`')
 
+    def resolve_output_references(self, outputs: List[Union[Text, NodeReference, 'nodes.BaseNode']]
+                                  ) -> List[NodeReference]:
+        """
+        transforms the outputs requested by the user (symbolic names, nodes or references) into the `NodeReference`s of
+        this pipeline
+
+        :param outputs: the requested outputs
+
+        :raises ValueError: if one of the outputs cannot be found in the pipeline
+
+        :return: the corresponding references
+        """
+        symbolic_to_real_node_map = {output_ref.reference: output_ref
+                                     for node in self._graph for output_ref in node.output_references}
+        references = []
+        for output in outputs:
+            if isinstance(output, NodeReference):
+                output = output.reference
+            if isinstance(output, nodes.BaseNode):
+                if len(output.output_references) != 1:
+                    raise ValueError('cannot use {} as output reference as it has {} output '
+                                     'references'.format(output.name, len(output.output_references)))
+                output = output.output_references[0].reference
+            if output not in symbolic_to_real_node_map:
+                raise ValueError('cannot find output {} in pipeline {}'.format(output, self.name))
+            references.append(symbolic_to_real_node_map[output])
+        return references
+
+    def get_required_nodes(self, output_references: List[NodeReference]) -> List['nodes.BaseNode']:
+        """
+        walks back the graph from some outputs and returns the nodes that need to be executed to compute those outputs
+        (the nodes producing them and all their ancestors). This is used by the runners to only execute a sub graph of
+        the pipeline when only some intermediate outputs are requested.
+
+        :param output_references: the references of the outputs to compute
+
+        :return: the required nodes (in the order they need to be executed in)
+        """
+        needed_references = set(output_references)
+        required_nodes = []
+        for node in reversed(self._graph):
+            if not needed_references.intersection(node.output_references):
+                continue
+            required_nodes.append(node)
+            needed_references.update(node.input_nodes)
+        return list(reversed(required_nodes))
+
     @staticmethod
     def extract_results(results: Dict[NodeReference, Any]) -> Any:
         """
@@ -189,7 +239,9 @@ class Pipeline(ops.BaseOp):
 
         :param node: the node to be executed
         :param intermediate_results: the intermediate result to look in in order to fin the node's inputs
-        :param runner: a runner to be used in case the node needs a runner to be executed (internal pipeline)
+        :param runner: a runner to be used in case the node needs a runner to be executed (internal pipeline). If the
+                       runner has a `memoizer` and the node can be memoized, the memoizer is consulted before executing
+                       the node
 
         :raises ValueError: if the output of the node does not correspond to the length of it's output references
 
@@ -201,7 +253,16 @@ class Pipeline(ops.BaseOp):
             callback.before_node_execution(self, node, inputs)
 
         # we are providing a runner just in case one is needed
-        res = node.execute(inputs, runner)
+        memoizer = runner.memoizer if runner is not None else None
+        try:
+            if memoizer is not None and node.memoize:
+                res = memoizer.execute_node(node, inputs, runner)
+            else:
+                res = node.execute(inputs, runner)
+        except Exception as error:
+            for callback in self.callbacks:
+                callback.on_node_error(self, node, inputs, error)
+            raise
 
         for callback in self.callbacks:
             callback.after_node_execution(self, node, inputs, res)
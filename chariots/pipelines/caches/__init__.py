@@ -0,0 +1,40 @@
+"""
+caches allow a `PipelinesServer` to answer repeated requests without executing the same pipeline over and over again.
+Caching is opt-in: you can either set a cache on a specific pipeline or give the server a default cache that will be
+used by all the pipelines that do not define their own:
+
+.. testsetup::
+
+    >>> from chariots.pipelines import Pipeline
+    >>> from chariots.pipelines.nodes import Node
+    >>> from chariots._helpers.doc_utils import IsOddOp
+
+.. doctest::
+
+    >>> from chariots.pipelines.caches import InMemoryResultCache
+    >>> cached_pipeline = Pipeline([
+    ...     Node(IsOddOp(), input_nodes=['__pipeline_input__'], output_nodes=['__pipeline_output__'])
+    ... ], 'cached_pipeline', result_cache=InMemoryResultCache(max_entries=10000, ttl=3600))
+
+the entries of the cache are keyed on the pipeline input and the versions of all the nodes of the pipeline so reloading
+a pipeline (with a newly trained model for instance) invalidates its previous entries.
+
+Only use caches with deterministic pipelines (inference pipelines for instance): a cached training pipeline would not
+retrain its models.
+
+At a finer grain, the `NodeMemoizer` allows runners to persist the outputs of single nodes across runs (to avoid
+reloading and preprocessing the same dataset every time a training pipeline is executed for instance).
+"""
+from ._base_result_cache import BaseResultCache
+from ._in_memory_result_cache import InMemoryResultCache
+from ..._helpers.lazy_imports import lazy_attributes
+
+__getattr__ = lazy_attributes(__name__, {'RedisResultCache': '._redis_result_cache:RedisResultCache'})
+from ._node_memoizer import NodeMemoizer
+
+__all__ = [
+    'BaseResultCache',
+    'InMemoryResultCache',
+    'RedisResultCache',  # pylint: disable=undefined-all-variable
+    'NodeMemoizer',
+]
@@ -0,0 +1,105 @@
+"""module for the abstract result cache class"""
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Tuple, Mapping
+
+import dill
+
+from ... import pipelines  # pylint: disable=unused-import; # noqa
+
+
+class BaseResultCache(ABC):
+    """
+    a result cache stores the outputs of previous executions of a pipeline so that identical requests can be answered
+    without running the pipeline again. Result caches are opt-in and should only be used with deterministic pipelines
+    (inference pipelines for instance, never training ones).
+
+    the key of each entry is built from a stable hash of the pipeline input, the name of the pipeline and the current
+    versions of all of its nodes. This means that any reload of the pipeline that changes one of its node (a newly
+    trained model for instance) will automatically invalidate the previous entries.
+
+    The cache keeps track of the number of hits and misses it received. Those counters are available to the
+    :doc:`pipeline callbacks<./callbacks>` through the `after_cache_lookup` method.
+
+    to create your own cache backend, you need to define the `_get`, `_set` and `clear` methods.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        """
+        looks up a key in the underlying storage
+
+        :param key: the key to look up
+
+        :return: a tuple with whether or not the key was found and the value (None if not found)
+        """
+
+    @abstractmethod
+    def _set(self, key: str, value: Any):
+        """
+        stores a value in the underlying storage
+
+        :param key: the key to store the value at
+        :param value: the value to store
+        """
+
+    @abstractmethod
+    def clear(self):
+        """removes all the entries of the cache"""
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        looks up a key in the cache and updates the hit/miss counters
+
+        :param key: the key to look up (as built by `build_key`)
+
+        :return: a tuple with whether or not the key was found and the cached value (None if not found)
+        """
+        is_hit, value = self._get(key)
+        if is_hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return is_hit, value
+
+    def set(self, key: str, value: Any):
+        """
+        stores the result of a pipeline execution in the cache
+
+        :param key: the key to store the value at (as built by `build_key`)
+        :param value: the result of the pipeline
+        """
+        self._set(key, value)
+
+    @property
+    def stats(self) -> Mapping[str, int]:
+        """the hit and miss counters of this cache"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def build_key(pipeline: 'pipelines.Pipeline', pipeline_input: Any) -> str:
+        """
+        builds the key of a pipeline execution. the key depends on the name of the pipeline, the versions of all its
+        nodes and the input of the execution.
+
+        :param pipeline: the pipeline that is being executed
+        :param pipeline_input: the input the pipeline is executed with
+
+        :return: the hex digest representing this execution
+        """
+        key_hash = hashlib.sha1(pipeline.name.encode('utf-8'))
+        for node, version in pipeline.get_pipeline_versions().items():
+            # the creation time of a version is not stable across calls so we only use the subversions
+            key_hash.update('{}:{}.{}.{}'.format(node.name, version.major, version.minor,
+                                                 version.patch).encode('utf-8'))
+        try:
+            input_bytes = json.dumps(pipeline_input, sort_keys=True).encode('utf-8')
+        except TypeError:
+            input_bytes = dill.dumps(pipeline_input)
+        key_hash.update(input_bytes)
+        return key_hash.hexdigest()
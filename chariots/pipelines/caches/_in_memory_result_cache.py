@@ -0,0 +1,97 @@
+"""in memory LRU result cache module"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple, Optional
+
+from ._base_result_cache import BaseResultCache
+
+
+class InMemoryResultCache(BaseResultCache):
+    """
+    result cache that keeps the results in the memory of the server process. Entries are evicted following a least
+    recently used policy once the cache holds `max_entries` results and expire `ttl` seconds after they were stored.
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> import shutil
+        >>> from chariots.pipelines import PipelinesServer
+        >>> from chariots.testing import TestOpStoreClient, TestPipelinesClient
+        >>> from chariots._helpers.doc_utils import is_odd_pipeline
+
+        >>> app_path = tempfile.mkdtemp()
+        >>> op_store_client = TestOpStoreClient(app_path)
+        >>> op_store_client.server.db.create_all()
+
+    .. doctest::
+
+        >>> cache = InMemoryResultCache(max_entries=1000, ttl=60)
+        >>> app = PipelinesServer([is_odd_pipeline], op_store_client=op_store_client, result_cache=cache,
+        ...                       import_name='cached_app')
+
+    .. testsetup::
+
+        >>> client = TestPipelinesClient(app)
+
+    .. doctest::
+
+        >>> client.call_pipeline(is_odd_pipeline, 3).value
+        True
+        >>> client.call_pipeline(is_odd_pipeline, 3).value
+        True
+        >>> cache.stats
+        {'hits': 1, 'misses': 1}
+
+    .. testsetup::
+
+        >>> shutil.rmtree(app_path)
+
+    :param max_entries: the maximum number of results to keep in the cache
+    :param ttl: the number of seconds after which a result expires. If `None` results never expire
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        super().__init__()
+        if max_entries <= 0:
+            raise ValueError('max_entries must be strictly positive, got {}'.format(max_entries))
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expiry_time, value = entry
+            if expiry_time is not None and expiry_time < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def _set(self, key: str, value: Any):
+        expiry_time = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expiry_time, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        self._lock = threading.Lock()
@@ -0,0 +1,143 @@
+"""module for the node memoizer that allows to skip the re-execution of nodes across runs"""
+import hashlib
+import pickle
+from typing import Any, List, Optional, Tuple
+
+import dill
+
+from ... import op_store, pipelines  # pylint: disable=unused-import; # noqa
+
+
+class NodeMemoizer:
+    """
+    a node memoizer persists the outputs of the nodes of a pipeline so that subsequent runs can skip re-executing
+    nodes when neither their version nor their inputs have changed (make-style incremental execution). This is useful
+    for expensive preprocessing nodes (dataset loading, feature engineering, ...) in training pipelines where only a
+    downstream model changes.
+
+    The memoizer is used by the runners and only applies to the nodes that were created with `memoize=True`:
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> import shutil
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots.ml import MLMode
+        >>> from chariots._helpers.doc_utils import IrisFullDataSet, PCAOp, LogisticOp
+        >>> cache_path = tempfile.mkdtemp()
+
+    .. doctest::
+
+        >>> from chariots.op_store.savers import FileSaver
+        >>> from chariots.pipelines.caches import NodeMemoizer
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> train_logistics = Pipeline([
+        ...     Node(IrisFullDataSet(), output_nodes=["x", "y"], memoize=True),
+        ...     Node(LogisticOp(MLMode.FIT), input_nodes=["x", "y"])
+        ... ], 'train_logistics')
+        >>> runner = SequentialRunner(memoizer=NodeMemoizer(FileSaver(cache_path)))
+        >>> runner.run(train_logistics)
+        >>> runner.run(train_logistics)
+        >>> runner.memoizer.hits, runner.memoizer.misses
+        (1, 1)
+
+    .. testsetup::
+
+        >>> shutil.rmtree(cache_path)
+
+    the outputs are keyed on the name of the node, its version and a hash of its inputs. Only memoize nodes that do not
+    have side effects (never memoize a node training a model for instance). The executions whose inputs or outputs
+    cannot be pickled (such as the chunk generators of the `FIT_INCREMENTAL` mode) are not memoized.
+
+    :param saver: the saver to persist the memoized outputs with (a `FileSaver` to use a local disk cache for instance)
+    :param serializer: the serializer to transform the outputs of the nodes into bytes. If `None` the
+                       `DillSerializer` is used
+    """
+
+    def __init__(self, saver: 'op_store.savers.BaseSaver',
+                 serializer: Optional['chariots.ml.serializers.BaseSerializer'] = None):
+        # importing here to resolve the circular import between pipelines and ml
+        from ...ml import serializers  # pylint: disable=import-outside-toplevel
+
+        self.saver = saver
+        self.serializer = serializer or serializers.DillSerializer()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def build_key(node: 'pipelines.nodes.BaseNode', inputs: List[Any]) -> Optional[str]:
+        """
+        builds the key of a node execution from the name of the node, its version and its inputs
+
+        :param node: the node that is being executed
+        :param inputs: the inputs the node is executed with
+
+        :return: the hex digest representing this execution (`None` if the inputs cannot be pickled)
+        """
+        try:
+            serialized_inputs = dill.dumps(inputs)
+        except (TypeError, pickle.PicklingError):
+            return None
+        version = node.node_version
+        key_hash = hashlib.sha1('{}:{}.{}.{}'.format(node.name, version.major, version.minor,
+                                                     version.patch).encode('utf-8'))
+        key_hash.update(serialized_inputs)
+        return key_hash.hexdigest()
+
+    @staticmethod
+    def _build_path(node: 'pipelines.nodes.BaseNode', key: str) -> str:
+        return '/memoized_nodes/{}/{}'.format(node.name, key)
+
+    def get(self, node: 'pipelines.nodes.BaseNode', key: str) -> Tuple[bool, Any]:
+        """
+        looks for a memoized output of a node
+
+        :param node: the node to look the output of
+        :param key: the key of the execution (as built by `build_key`)
+
+        :return: a tuple with whether or not the output was found and the output itself (None if not found)
+        """
+        try:
+            serialized_output = self.saver.load(self._build_path(node, key))
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, self.serializer.deserialize_object(serialized_output)
+
+    def set(self, node: 'pipelines.nodes.BaseNode', key: str, output: Any):
+        """
+        memoizes the output of a node (nothing is memoized if the output cannot be serialized)
+
+        :param node: the node that produced the output
+        :param key: the key of the execution (as built by `build_key`)
+        :param output: the output of the node
+        """
+        try:
+            serialized_output = self.serializer.serialize_object(output)
+        except (TypeError, pickle.PicklingError):
+            return
+        self.saver.save(serialized_output, self._build_path(node, key))
+
+    def execute_node(self, node: 'pipelines.nodes.BaseNode', inputs: List[Any],
+                     runner: Optional['pipelines.runners.BaseRunner'] = None) -> Any:
+        """
+        returns the memoized output of a node if it exists, otherwise executes the node and memoizes its output (the
+        node is executed without memoization if its inputs or its output cannot be pickled)
+
+        :param node: the node to execute
+        :param inputs: the inputs of the node
+        :param runner: the runner to provide to the node if it needs one
+
+        :return: the output of the node
+        """
+        key = self.build_key(node, inputs)
+        if key is None:
+            return node.execute(inputs, runner)
+        is_hit, output = self.get(node, key)
+        if is_hit:
+            return output
+        output = node.execute(inputs, runner)
+        self.set(node, key, output)
+        return output
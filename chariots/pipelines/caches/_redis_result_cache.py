@@ -0,0 +1,113 @@
+"""redis backed result cache module"""
+import time
+from typing import Any, Tuple, Optional, Dict
+
+import dill
+from redis import Redis
+
+from ._base_result_cache import BaseResultCache
+
+
+class RedisResultCache(BaseResultCache):
+    """
+    result cache that stores the results in redis. This allows several server processes (or several replicas of the
+    same server) to share their cached results.
+
+    Entries expire `ttl` seconds after they were stored (using the native redis expiry) and, if `max_entries` is set,
+    the least recently used entries are evicted once the cache holds more than `max_entries` results. The hit and miss
+    counters are local to each process.
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> import shutil
+        >>> from chariots.pipelines import PipelinesServer
+        >>> from chariots.testing import TestOpStoreClient
+        >>> from chariots._helpers.doc_utils import is_odd_pipeline
+
+        >>> app_path = tempfile.mkdtemp()
+        >>> op_store_client = TestOpStoreClient(app_path)
+        >>> op_store_client.server.db.create_all()
+
+    .. doctest::
+
+        >>> from redis import Redis
+        >>> app = PipelinesServer([is_odd_pipeline], op_store_client=op_store_client,
+        ...                       result_cache=RedisResultCache(redis=Redis(), ttl=3600), import_name='cached_app')
+
+    .. testsetup::
+
+        >>> shutil.rmtree(app_path)
+
+    :param redis: the redis connection to use. overrides any `redis_kwargs` argument if present
+    :param redis_kwargs: keyword arguments to be passed to the `Redis` class constructor. this will only be used if the
+                         redis argument is unset
+    :param ttl: the number of seconds after which a result expires. If `None` results never expire
+    :param max_entries: the maximum number of results to keep in the cache. If `None` the number of entries is only
+                        bounded by the memory policy of the redis server
+    :param key_prefix: the prefix of all the keys created by this cache in redis
+    """
+
+    def __init__(self, redis: Optional[Redis] = None,  # pylint: disable=too-many-arguments
+                 redis_kwargs: Optional[Dict[str, Any]] = None, ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None, key_prefix: str = 'chariots_result_cache'):
+        super().__init__()
+        self._redis_kwargs = redis_kwargs or {}
+        self._redis = redis or Redis(**self._redis_kwargs)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+
+    @property
+    def _lru_key(self) -> str:
+        """the key of the sorted set used to keep track of the last access of each entry"""
+        return '{}:__lru__'.format(self.key_prefix)
+
+    def _entry_key(self, key: str) -> str:
+        return '{}:{}'.format(self.key_prefix, key)
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        serialized_value = self._redis.get(self._entry_key(key))
+        if serialized_value is None:
+            return False, None
+        if self.max_entries is not None:
+            self._redis.zadd(self._lru_key, {key: time.time()})
+        return True, dill.loads(serialized_value)
+
+    def _set(self, key: str, value: Any):
+        redis_pipeline = self._redis.pipeline()
+        redis_pipeline.set(self._entry_key(key), dill.dumps(value),
+                           px=int(self.ttl * 1000) if self.ttl is not None else None)
+        if self.max_entries is not None:
+            redis_pipeline.zadd(self._lru_key, {key: time.time()})
+        redis_pipeline.execute()
+        if self.max_entries is not None:
+            self._evict()
+
+    def _evict(self):
+        """evicts the least recently used entries if the cache holds more than `max_entries` results"""
+        n_excess = self._redis.zcard(self._lru_key) - self.max_entries
+        if n_excess <= 0:
+            return
+        evicted_keys = [key.decode('utf-8') if isinstance(key, bytes) else key
+                        for key in self._redis.zrange(self._lru_key, 0, n_excess - 1)]
+        redis_pipeline = self._redis.pipeline()
+        redis_pipeline.delete(*[self._entry_key(key) for key in evicted_keys])
+        redis_pipeline.zrem(self._lru_key, *evicted_keys)
+        redis_pipeline.execute()
+
+    def clear(self):
+        keys = list(self._redis.scan_iter(match='{}:*'.format(self.key_prefix)))
+        if keys:
+            self._redis.delete(*keys)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if not self._redis_kwargs:
+            state['_redis_kwargs'] = self._redis.connection_pool.connection_kwargs
+        state['_redis'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        self._redis = Redis(**self._redis_kwargs)
@@ -9,6 +9,7 @@ There are two main types of callbacks:
 
 the order of execution of the callbacks are as follows:
 
+- pipeline callbacks' `after_cache_lookup` (only if the pipeline is served with a result cache)
 - pipeline callbacks' `before_execution`
 - pipeline callbacks' `before_node_execution` (for each node)
 - op callbacks' `before_execution`
@@ -16,15 +17,27 @@ the order of execution of the callbacks are as follows:
 - op's execute method
 - op's `after_execution` method
 - op  callbacks' `after_execution`
-- pipeline callbacks' `after_node_execution`
+- pipeline callbacks' `after_node_execution` (or `on_node_error` if the node raised an error)
 
 During the pipeline's execution, the inputs and outputs of the execution are being provided (when applicable), these are
 provided for information, DO NOT TRY TO MODIFY those (this is undefined behavior)
+
+Chariots ships with the `MetricsCallback` that records the latency, the input/output sizes, the errors and the memory
+usage of each node (served in the Prometheus format by the `/metrics` route of the `PipelinesServer`) and the
+`TracingCallback` that records the spans of the pipeline runs in the Chrome trace format (or sends them to an
+OpenTelemetry collector) as well as the `ProfilingCallback` that samples the stacks of a fraction of the runs (or of
+the slow runs) to serve their profile by node from the `/debug/profile` route of the `PipelinesServer`.
 """
 from ._op_callback import OpCallBack
 from ._pipeline_callback import PipelineCallback
+from ._metrics_callback import MetricsCallback
+from ._profiling_callback import ProfilingCallback
+from ._tracing_callback import TracingCallback
 
 __all__ = [
     'OpCallBack',
-    'PipelineCallback'
+    'PipelineCallback',
+    'MetricsCallback',
+    'ProfilingCallback',
+    'TracingCallback',
 ]
@@ -0,0 +1,136 @@
+"""module for the callback that records the metrics of the pipelines"""
+import threading
+import time
+from typing import List, Any, Optional
+
+from ..._helpers import metrics
+from ._pipeline_callback import PipelineCallback
+
+
+class MetricsCallback(PipelineCallback):
+    """
+    a pipeline callback that records (with a low overhead) the performance metrics of the pipelines and their nodes:
+
+    - `chariots_pipeline_duration_seconds`: the latency of each pipeline run
+    - `chariots_node_duration_seconds`: the latency of each node
+    - `chariots_node_input_size`/`chariots_node_output_size`: the number of rows (the `len`) of the inputs/outputs of
+      each node (inputs and outputs without length are ignored)
+    - `chariots_node_errors_total`: the number of errors raised by each node (by type of error)
+    - `chariots_node_rss_increase_bytes`: the increase of the resident memory of the process during the execution of
+      each node (only if `track_memory` is set)
+
+    the metrics are kept in histograms with preallocated buckets and are served (in the Prometheus text format) by the
+    `/metrics` route of the `PipelinesServer`:
+
+    .. testsetup::
+
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> from chariots._helpers.doc_utils import IsOddOp, AddOneOp
+        >>> from chariots._helpers.metrics import MetricsRegistry
+        >>> runner = SequentialRunner()
+
+    .. doctest::
+
+        >>> metrics_callback = MetricsCallback(registry=MetricsRegistry())
+        >>> is_even_pipeline = Pipeline([
+        ...     Node(AddOneOp(), input_nodes=['__pipeline_input__'], output_nodes='modified'),
+        ...     Node(IsOddOp(), input_nodes=['modified'], output_nodes=['__pipeline_output__'])
+        ... ], 'simple_pipeline', pipeline_callbacks=[metrics_callback])
+        >>> runner.run(is_even_pipeline, 3)
+        False
+        >>> [line for line in metrics_callback.registry.render().splitlines() if '_count' in line]
+        ... # doctest: +NORMALIZE_WHITESPACE
+        ['chariots_node_duration_seconds_count{node="addoneop",pipeline="simple_pipeline"} 1',
+         'chariots_node_duration_seconds_count{node="isoddop",pipeline="simple_pipeline"} 1',
+         'chariots_pipeline_duration_seconds_count{pipeline="simple_pipeline"} 1']
+
+    pipelines executed by workers record their metrics in the default registry of the process of the worker (not the one
+    of the server).
+
+    :param track_memory: whether or not to record the increase of the resident memory for each node (this needs to
+                         read the memory of the process before and after each node)
+    :param registry: the registry to record the metrics in (the registry of the process served by the servers if
+                     `None`)
+    """
+
+    def __init__(self, track_memory: bool = False, registry: Optional[metrics.MetricsRegistry] = None):
+        self.track_memory = track_memory
+        self.registry = registry or metrics.REGISTRY
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # the callback is pickled alongside its pipeline when the pipeline is executed by workers, workers record the
+        # metrics in the registry of their own process
+        state = self.__dict__.copy()
+        del state['_local']
+        del state['registry']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.registry = metrics.REGISTRY
+        self._local = threading.local()
+
+    def _starts(self) -> dict:
+        """the start times (and memory) of the pipelines and nodes being executed by the current thread"""
+        starts = getattr(self._local, 'starts', None)
+        if starts is None:
+            starts = self._local.starts = {}
+        return starts
+
+    def before_execution(self, pipeline: 'chariots.Pipeline', args: List[Any]):
+        self._starts()[id(pipeline)] = time.perf_counter()
+
+    def after_execution(self, pipeline: 'chariots.Pipeline', args: List[Any], output: Any):
+        start = self._starts().pop(id(pipeline), None)
+        if start is None:
+            return
+        self.registry.observe('chariots_pipeline_duration_seconds', time.perf_counter() - start,
+                              (('pipeline', pipeline.name),), help_text='latency of the runs of the pipelines')
+
+    def before_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any]):
+        labels = (('node', node.name), ('pipeline', pipeline.name))
+        for arg in args:
+            self._observe_size('chariots_node_input_size', arg, labels, 'number of rows of the inputs of the nodes')
+        rss = metrics.current_rss_bytes() if self.track_memory else None
+        self._starts()[(id(pipeline), id(node))] = time.perf_counter(), rss
+
+    def after_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], output: Any):
+        labels = self._record_node_end(pipeline, node)
+        if labels is None:
+            return
+        for node_output in output if isinstance(output, tuple) else (output,):
+            self._observe_size('chariots_node_output_size', node_output, labels,
+                               'number of rows of the outputs of the nodes')
+
+    def on_node_error(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], error: Exception):
+        labels = self._record_node_end(pipeline, node)
+        if labels is None:
+            return
+        self.registry.increment('chariots_node_errors_total', labels + (('error', type(error).__name__),),
+                                help_text='number of errors raised by the nodes')
+
+    def _record_node_end(self, pipeline: 'chariots.Pipeline', node: 'BaseNode'):
+        """records the latency (and memory increase) of a node, returns the labels of the node"""
+        start = self._starts().pop((id(pipeline), id(node)), None)
+        if start is None:
+            return None
+        start_time, start_rss = start
+        labels = (('node', node.name), ('pipeline', pipeline.name))
+        self.registry.observe('chariots_node_duration_seconds', time.perf_counter() - start_time, labels,
+                              help_text='latency of the nodes')
+        if start_rss is not None:
+            self.registry.observe('chariots_node_rss_increase_bytes',
+                                  max(metrics.current_rss_bytes() - start_rss, 0), labels,
+                                  help_text='increase of the resident memory during the execution of the nodes',
+                                  unit='bytes')
+        return labels
+
+    def _observe_size(self, name: str, value: Any, labels: metrics.Labels, help_text: str):
+        try:
+            size = len(value)
+        except TypeError:
+            return
+        self.registry.observe(name, size, labels, help_text=help_text, unit='size')
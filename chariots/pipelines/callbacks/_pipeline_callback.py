@@ -89,3 +89,27 @@ class PipelineCallback:
         :param output: the output the node produced. . DO NOT MODIFY those references as this might cause some
                        undefined behavior
         """
+
+    def on_node_error(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], error: Exception):
+        """
+        called when a node raises an error (instead of `after_node_execution`), the error is then raised again by the
+        pipeline
+
+        :param pipeline: the pipeline being run
+        :param node: the node that raised the error
+        :param args: the arguments that were given to the node
+        :param error: the error raised by the node
+        """
+
+    def after_cache_lookup(self, pipeline: 'chariots.Pipeline', args: List[Any],
+                           cache: 'chariots.pipelines.caches.BaseResultCache', is_hit: bool):
+        """
+        called when the pipeline is served with a :doc:`result cache<./caches>`, after the result of the execution has
+        been looked up in the cache (and before the pipeline gets executed in case of a miss). the hit and miss
+        counters of the cache are available through `cache.hits` and `cache.misses`
+
+        :param pipeline: the pipeline being served
+        :param args: the pipeline input. DO NOT MODIFY those references as this might cause some undefined behavior
+        :param cache: the cache the result was looked up in
+        :param is_hit: whether or not the result was found in the cache
+        """
@@ -0,0 +1,92 @@
+"""module for the callback that profiles the runs of the pipelines"""
+import random
+from typing import List, Any, Optional
+
+from ..._helpers import profiling
+from ._pipeline_callback import PipelineCallback
+
+
+class ProfilingCallback(PipelineCallback):
+    """
+    a pipeline callback that profiles (with a statistical sampler) a fraction of the runs of the pipeline and/or the
+    runs that are slower than a threshold. While a run is profiled, its stack is sampled at a regular interval by a
+    background thread and the samples are aggregated by node. This allows to profile the pipelines in production at a
+    low cost (unlike a deterministic profiler that slows down every function call).
+
+    the profiles are served by the `/debug/profile` route of the `PipelinesServer` (if it was created with
+    `profile_route=True`) in the collapsed stack format (for flamegraph.pl or speedscope) or in the speedscope format
+    (`/debug/profile?format=speedscope`):
+
+    .. testsetup::
+
+        >>> import time
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots.pipelines.ops import BaseOp
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> from chariots._helpers.profiling import Sampler
+        >>> runner = SequentialRunner()
+        >>> class SlowOp(BaseOp):
+        ...     def execute(self, value):
+        ...         time.sleep(0.05)
+        ...         return value
+
+    .. doctest::
+
+        >>> profiling_callback = ProfilingCallback(sample_rate=1., sampler=Sampler(interval=0.001))
+        >>> slow_pipeline = Pipeline([
+        ...     Node(SlowOp(), input_nodes=['__pipeline_input__'], output_nodes=['__pipeline_output__'])
+        ... ], 'slow_pipeline', pipeline_callbacks=[profiling_callback])
+        >>> runner.run(slow_pipeline, 3)
+        3
+        >>> ('slow_pipeline', 'slowop') in profiling_callback.sampler.get_samples()
+        True
+
+    runs are profiled in the thread that executes the pipeline (the nodes executed in other threads by the
+    `StreamingRunner` are not sampled). Pipelines executed by workers record their samples in the default sampler of the
+    process of the worker.
+
+    :param sample_rate: the fraction of the runs to profile entirely
+    :param slow_threshold: if set, the runs that are not sampled start being profiled once they last longer than this
+                           threshold (in seconds), which allows to only profile the slow runs
+    :param sampler: the sampler to record the stacks with (the sampler of the process served by the server if `None`)
+    """
+
+    def __init__(self, sample_rate: float = 0.01, slow_threshold: Optional[float] = None,
+                 sampler: Optional[profiling.Sampler] = None):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('the sample rate should be between 0 and 1, got {}'.format(sample_rate))
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.sampler = sampler or profiling.SAMPLER
+
+    def __getstate__(self):
+        # the callback is pickled alongside its pipeline when the pipeline is executed by workers, workers record the
+        # samples in the sampler of their own process
+        state = self.__dict__.copy()
+        del state['sampler']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.sampler = profiling.SAMPLER
+
+    def before_execution(self, pipeline: 'chariots.Pipeline', args: List[Any]):
+        if self.sample_rate and random.random() < self.sample_rate:
+            self.sampler.start_run(pipeline.name)
+        elif self.slow_threshold is not None:
+            self.sampler.start_run(pipeline.name, delay=self.slow_threshold)
+
+    def after_execution(self, pipeline: 'chariots.Pipeline', args: List[Any], output: Any):
+        self.sampler.end_run(pipeline.name)
+
+    def before_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any]):
+        self.sampler.enter_node(node.name)
+
+    def after_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], output: Any):
+        self.sampler.exit_node(node.name)
+
+    def on_node_error(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], error: Exception):
+        self.sampler.exit_node(node.name)
+        # the error interrupts the run of the pipeline
+        self.sampler.end_run(pipeline.name)
@@ -0,0 +1,135 @@
+"""module for the callback that traces the runs of the pipelines"""
+import contextlib
+import threading
+from typing import List, Any, Optional, Text
+
+from ..._helpers import tracing
+from ._pipeline_callback import PipelineCallback
+
+
+class TracingCallback(PipelineCallback):
+    """
+    a pipeline callback that records a span for each run of the pipeline and for each of its nodes. The calls to the op
+    store made during the run (and during the loading and saving of the pipeline by the `PipelinesServer`) are recorded
+    as child spans as well as the time spent encoding the response or waiting in the queue of the workers (the trace
+    context is carried along with the jobs of the `RQWorkerPool`).
+
+    the traces are written in the Chrome trace format in `trace_directory` (one file per trace, that can be opened with
+    `chrome://tracing`, https://ui.perfetto.dev or speedscope to view the run as a flame chart) and/or sent to an
+    OpenTelemetry collector (using OTLP over HTTP) if `otlp_endpoint` is set:
+
+    .. testsetup::
+
+        >>> import os
+        >>> import tempfile
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> from chariots._helpers.doc_utils import IsOddOp, AddOneOp
+        >>> runner = SequentialRunner()
+        >>> trace_directory = tempfile.mkdtemp()
+
+    .. doctest::
+
+        >>> is_even_pipeline = Pipeline([
+        ...     Node(AddOneOp(), input_nodes=['__pipeline_input__'], output_nodes='modified'),
+        ...     Node(IsOddOp(), input_nodes=['modified'], output_nodes=['__pipeline_output__'])
+        ... ], 'simple_pipeline', pipeline_callbacks=[TracingCallback(trace_directory=trace_directory)])
+        >>> runner.run(is_even_pipeline, 3)
+        False
+        >>> len(os.listdir(trace_directory))
+        1
+
+    :param trace_directory: the directory to write the traces in (in the Chrome trace format)
+    :param otlp_endpoint: the url of an OpenTelemetry collector to send the traces to (such as `http://localhost:4318`)
+    :param service_name: the name of the service the spans are attributed to (for OTLP)
+
+    :raises ValueError: if neither `trace_directory` nor `otlp_endpoint` are set
+    """
+
+    def __init__(self, trace_directory: Optional[Text] = None, otlp_endpoint: Optional[Text] = None,
+                 service_name: Text = 'chariots'):
+        exporters = []
+        if trace_directory is not None:
+            exporters.append(tracing.ChromeTraceExporter(trace_directory))
+        if otlp_endpoint is not None:
+            exporters.append(tracing.OTLPExporter(otlp_endpoint, service_name=service_name))
+        if not exporters:
+            raise ValueError('the tracing callback needs a `trace_directory` or an `otlp_endpoint`')
+        self.tracer = tracing.Tracer(exporters)
+        self._pipeline_spans = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the callback is pickled alongside its pipeline when the pipeline is executed by workers
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_pipeline_spans'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    @contextlib.contextmanager
+    def trace_pipeline(cls, pipeline: 'chariots.Pipeline', name: Text, category: Text = 'server',
+                       parent_context: Optional[tracing.TraceContext] = None, **attributes: Any):
+        """
+        records a span around a block of code (the serving, loading or saving of a pipeline by the server for instance)
+        if the pipeline is traced by a `TracingCallback` (and does nothing otherwise)
+
+        :param pipeline: the pipeline to look for a tracing callback in
+        :param name: the name of the span
+        :param category: the category of the span
+        :param parent_context: the context of a remote parent span (created in another process)
+        :param attributes: additional information on the span
+        """
+        tracing_callback = next((callback for callback in pipeline.callbacks if isinstance(callback, cls)), None)
+        if tracing_callback is None:
+            yield None
+            return
+        with tracing_callback.tracer.span(name, category, parent_context=parent_context, pipeline=pipeline.name,
+                                          **attributes) as span:
+            yield span
+
+    def before_execution(self, pipeline: 'chariots.Pipeline', args: List[Any]):
+        # cleaning the span of a previous run of the pipeline that was interrupted by an error in this thread
+        current_span = tracing.current_span()
+        if current_span is not None and (current_span.category, current_span.name) == ('pipeline', pipeline.name):
+            self.tracer.end_span(current_span, interrupted=True)
+        span = self.tracer.start_span(pipeline.name, 'pipeline')
+        with self._lock:
+            self._pipeline_spans[threading.get_ident(), id(pipeline)] = span
+
+    def after_execution(self, pipeline: 'chariots.Pipeline', args: List[Any], output: Any):
+        self._end_pipeline_span(pipeline)
+
+    def _end_pipeline_span(self, pipeline: 'chariots.Pipeline', **attributes: Any):
+        with self._lock:
+            span = self._pipeline_spans.pop((threading.get_ident(), id(pipeline)), None)
+        if span is not None:
+            self.tracer.end_span(span, **attributes)
+
+    def before_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any]):
+        parent = tracing.current_span()
+        if parent is None:
+            # nodes executed in other threads than the pipeline (by the `StreamingRunner`) are attached to the last
+            # run of the pipeline
+            with self._lock:
+                parent = next((span for (_, pipeline_id), span in reversed(list(self._pipeline_spans.items()))
+                               if pipeline_id == id(pipeline)), None)
+        self.tracer.start_span(node.name, 'node', parent=parent, pipeline=pipeline.name)
+
+    def after_node_execution(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], output: Any):
+        self._end_node_span(node)
+
+    def on_node_error(self, pipeline: 'chariots.Pipeline', node: 'BaseNode', args: List[Any], error: Exception):
+        self._end_node_span(node, error=type(error).__name__)
+        # the error interrupts the run of the pipeline
+        self._end_pipeline_span(pipeline, error=type(error).__name__)
+
+    def _end_node_span(self, node: 'BaseNode', **attributes: Any):
+        span = tracing.current_span()
+        if span is not None and (span.category, span.name) == ('node', node.name):
+            self.tracer.end_span(span, **attributes)
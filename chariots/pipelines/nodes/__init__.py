@@ -25,14 +25,23 @@ you can also link the first and/or the last node of your pipeline  to the pipeli
     ...     Node(PCAOp(MLMode.PREDICT), input_nodes=["x"], output_nodes="x_transformed"),
     ...     Node(LogisticOp(MLMode.PREDICT), input_nodes=["x_transformed"], output_nodes=['__pipeline_output__'])
     ... ], 'pred')
+
+datasets can be saved and loaded (through a :doc:`saver<../op_store/savers>`) using the `DataSavingNode` and
+`DataLoadingNode`. The version of these nodes changes every time the dataset is saved again.
 """
 from ._base_nodes import ReservedNodes, BaseNode
 
 from ._node import Node
+from ._base_data_node import BaseDataNode
+from ._data_loading_node import DataLoadingNode
+from ._data_saving_node import DataSavingNode
 
 
 __all__ = [
     'Node',
     'ReservedNodes',
     'BaseNode',
+    'BaseDataNode',
+    'DataLoadingNode',
+    'DataSavingNode',
 ]
@@ -0,0 +1,131 @@
+"""base module for the nodes that load and save datasets"""
+import json
+from abc import ABC
+from typing import Optional, List, Union, Text, Any, Mapping
+
+from ... import versioning, op_store  # pylint: disable=unused-import; # noqa
+from . import BaseNode
+
+# the manifest of a node that did not read it yet
+_NOT_LOADED = object()
+
+
+class BaseDataNode(BaseNode, ABC):  # pylint: disable=abstract-method
+    """
+    base class of the nodes that load and save datasets through a :doc:`saver<../op_store/savers>`.
+
+    A dataset is stored as one or several parts (each serialized with the `serializer` of the node) in a directory of
+    `path` for each write of the dataset and a `_manifest.json` file that lists the parts of the current version of the
+    dataset (and their partition if the dataset is partitioned):
+
+    .. code-block:: text
+
+        /datasets/iris/_manifest.json
+        /datasets/iris/writes/6f1ed002ab5595859014ebf0951522d9/part-00000.bin
+        /datasets/iris/writes/6f1ed002ab5595859014ebf0951522d9/part-00001.bin
+
+    the version of the dataset (used as the version of the nodes) is built from the hashes of all its parts, this
+    means that downstream nodes (and :doc:`memoizers<./caches>`) see a new version every time the dataset changes.
+
+    Like the ops, the data nodes stick to the version of the dataset they loaded: the manifest is read the first time
+    the node is used and then only when the node is reloaded with `load_latest_version` (when its pipeline is loaded
+    by the `PipelinesServer` for instance) or when the node saves a new version of the dataset itself.
+
+    If the saver is not given when creating the node, it can be attached later with `attach_saver` (the
+    `PipelinesServer` attaches its `data_saver` to all the data nodes of its pipelines that do not have one).
+
+    :param path: the path of the dataset in the saver
+    :param saver: the saver to read/write the dataset with
+    :param serializer: the serializer to (de)serialize each part of the dataset with. If `None` the `DillSerializer`
+                       is used
+    :param name: the name of the node. If `None` the name is built from the path of the dataset
+    :param input_nodes: the input nodes of the node
+    :param output_nodes: the output nodes of the node
+    :param memoize: whether or not the outputs of this node can be memoized across runs by the runner's
+                    :doc:`NodeMemoizer<./caches>`
+    """
+
+    # the subversion of the node affected when the dataset changes
+    dataset_version_type = versioning.VersionType.MINOR
+    manifest_file = '_manifest.json'
+
+    def __init__(self, path: Text,  # pylint: disable=too-many-arguments
+                 saver: Optional['op_store.savers.BaseSaver'] = None,
+                 serializer: Optional['chariots.ml.serializers.BaseSerializer'] = None, name: Optional[Text] = None,
+                 input_nodes: Optional[List[Union[Text, BaseNode]]] = None,
+                 output_nodes: Union[List[Text], Text] = None, memoize: bool = False):
+        # importing here to resolve the circular import between pipelines and ml
+        from ...ml import serializers  # pylint: disable=import-outside-toplevel
+
+        self.path = path.rstrip('/')
+        self.saver = saver
+        self.serializer = serializer or serializers.DillSerializer()
+        self._name = name or 'dataset{}'.format(self.path.replace('/', '_'))
+        self._manifest = _NOT_LOADED
+        super().__init__(input_nodes=input_nodes, output_nodes=output_nodes, memoize=memoize)
+
+    def attach_saver(self, saver: 'op_store.savers.BaseSaver'):
+        """
+        attaches a saver to this node (to use the same saver as the op store for instance)
+
+        :param saver: the saver to read/write the dataset with
+        """
+        self.saver = saver
+        self._manifest = _NOT_LOADED
+
+    def _get_saver(self) -> 'op_store.savers.BaseSaver':
+        if self.saver is None:
+            raise ValueError('no saver attached to {}, give a saver to the node or use `attach_saver`'.format(
+                self.name))
+        return self.saver
+
+    @property
+    def _manifest_path(self) -> Text:
+        return '{}/{}'.format(self.path, self.manifest_file)
+
+    def _load_manifest(self) -> Optional[Mapping[Text, Any]]:
+        """loads the manifest of the dataset (`None` if the dataset was never saved)"""
+        try:
+            return json.loads(self._get_saver().load(self._manifest_path).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+
+    def _save_manifest(self, manifest: Mapping[Text, Any]):
+        self._get_saver().save(json.dumps(manifest, sort_keys=True).encode('utf-8'), self._manifest_path)
+        self._manifest = manifest
+
+    def _current_manifest(self) -> Optional[Mapping[Text, Any]]:
+        """the manifest of the version of the dataset this node uses (read from the saver on the first call only)"""
+        if self._manifest is _NOT_LOADED:
+            self._manifest = self._load_manifest()
+        return self._manifest
+
+    @property
+    def node_version(self) -> versioning.Version:
+        version = versioning.Version().update_major(self.name.encode('utf-8'))
+        manifest = self._current_manifest() if self.saver is not None else None
+        if manifest is None:
+            return version
+        return version.update(self.dataset_version_type, manifest['version'].encode('utf-8'))
+
+    def _reload_manifest(self) -> Optional[Mapping[Text, Any]]:
+        """reads the manifest of the latest version of the dataset from the saver"""
+        self._manifest = _NOT_LOADED if self.saver is None else self._load_manifest()
+        return None if self._manifest is _NOT_LOADED else self._manifest
+
+    def load_latest_version(self, store_to_look_in: 'op_store.OpStoreClient') -> BaseNode:
+        # the dataset itself is read from the saver at execution time, only its manifest is reloaded
+        self._reload_manifest()
+        return self
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def require_saver(self) -> bool:
+        return True
+
+    def __repr__(self):
+        return '<{} of {} with inputs {} and output {}>'.format(type(self).__name__, self.path, self.input_nodes,
+                                                                self.output_nodes)
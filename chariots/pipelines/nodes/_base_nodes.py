@@ -75,10 +75,13 @@ class BaseNode(ABC):
                          pipeline. If this node is the output of the pipeline use `__pipeline_output__` or
                          `ReservedNodes.pipeline_output`. If the output of the node should be split (for different
                          downstream nodes to consume) use a list
+    :param memoize: whether or not the outputs of this node can be memoized across runs by the runner's
+                    :doc:`NodeMemoizer<./caches>` (if any). Only memoize nodes that do not have side effects.
     """
 
     def __init__(self, input_nodes: Optional[List[Union[Text, 'BaseNode']]] = None,
-                 output_nodes: Union[List[Text], Text] = None):
+                 output_nodes: Union[List[Text], Text] = None, memoize: bool = False):
+        self.memoize = memoize
         self.input_nodes = input_nodes or []
         if not isinstance(output_nodes, list):
             output_nodes = [output_nodes]
@@ -197,6 +200,17 @@ class BaseNode(ABC):
         """whether or not this node requires a runner to be executed (typically if the inner op is a pipelines)"""
         return False
 
+    @property
+    def requires_full_dataset(self) -> bool:
+        """whether or not this node needs its whole input at once (and cannot be executed on chunks of its input)"""
+        return False
+
+    def start_stream(self):
+        """called by the `StreamingRunner` before this node is executed on the chunks of a stream"""
+
+    def end_stream(self):
+        """called by the `StreamingRunner` once this node is done with the chunks of a stream"""
+
     @property
     def require_saver(self) -> bool:
         """whether or not this node requires a saver to be executed this is usualy `True` by data nodes"""
@@ -0,0 +1,86 @@
+"""module for the node that loads datasets"""
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Union, Text, Any, Mapping
+
+from ... import op_store  # pylint: disable=unused-import; # noqa
+from ..._helpers import chunks
+from .. import runners  # pylint: disable=unused-import; # noqa
+from ._base_data_node import BaseDataNode
+
+
+class DataLoadingNode(BaseDataNode):
+    """
+    a node that loads a dataset saved by a `DataSavingNode` (see the `DataSavingNode` for an example).
+
+    the parts of the dataset are loaded (in parallel if `n_jobs` is more than 1) and concatenated: data frames (which
+    keep their original index) and numpy arrays are concatenated along their first axis and lists are chained (the node
+    outputs the list of the parts otherwise).
+
+    if the saver persists the dataset on the local file system (such as the `FileSaver`), the parts are deserialized
+    directly from their files (using `BaseSerializer.deserialize_file`). Serializers that support it (the
+    `FeatherSerializer` with `memory_map`, the `NumpySerializer` and `JoblibSerializer` with `mmap_mode`, the
+    `ParquetSerializer`) then memory map the files rather than loading their bytes first.
+
+    :param path: the path of the dataset in the saver
+    :param saver: the saver to read the dataset with
+    :param serializer: the serializer to deserialize each part of the dataset with. If `None` the `DillSerializer` is
+                       used
+    :param output_nodes: the output nodes of the node
+    :param name: the name of the node. If `None` the name is built from the path of the dataset
+    :param columns: the columns to load (only for serializers that support column projection such as the
+                    `ParquetSerializer` and the `FeatherSerializer`). all of them if `None`
+    :param partitions: the partitions of the dataset to load (all of them if `None`)
+    :param n_jobs: the number of parts to load in parallel
+    :param memoize: whether or not the outputs of this node can be memoized across runs by the runner's
+                    :doc:`NodeMemoizer<./caches>` (the key of the memoizer includes the version of the dataset)
+
+    :raises ValueError: if `columns` is set and the serializer does not support column projection
+    """
+
+    def __init__(self, path: Text,  # pylint: disable=too-many-arguments
+                 saver: Optional['op_store.savers.BaseSaver'] = None,
+                 serializer: Optional['chariots.ml.serializers.BaseSerializer'] = None,
+                 output_nodes: Union[List[Text], Text] = None, name: Optional[Text] = None,
+                 columns: Optional[List[Text]] = None, partitions: Optional[List[Any]] = None, n_jobs: int = 1,
+                 memoize: bool = False):
+        super().__init__(path, saver=saver, serializer=serializer, name=name, output_nodes=output_nodes,
+                         memoize=memoize)
+        if columns is not None:
+            if not hasattr(self.serializer, 'columns'):
+                raise ValueError('{} does not support loading only some columns'.format(type(self.serializer).__name__))
+            self.serializer = copy.copy(self.serializer)
+            self.serializer.columns = columns
+        self.partitions = None if partitions is None else {str(partition) for partition in partitions}
+        self.n_jobs = n_jobs
+
+    def execute(self, params: List[Any],  # pylint: disable=arguments-differ,unused-argument
+                runner: Optional['runners.BaseRunner'] = None) -> Any:  # pylint: disable=unused-argument
+        """
+        loads the dataset (the node does not have any inputs)
+
+        :raises FileNotFoundError: if the dataset was never saved
+
+        :return: the loaded dataset
+        """
+        manifest = self._current_manifest()
+        if manifest is None:
+            # the dataset might have been saved since the node last looked for it
+            manifest = self._reload_manifest()
+        if manifest is None:
+            raise FileNotFoundError('dataset {} was never saved'.format(self.path))
+        parts = [part for part in manifest['parts']
+                 if self.partitions is None or part['partition'] in self.partitions]
+        if self.n_jobs > 1 and len(parts) > 1:
+            with ThreadPoolExecutor(self.n_jobs) as executor:
+                loaded_parts = list(executor.map(self._load_part, parts))
+        else:
+            loaded_parts = [self._load_part(part) for part in parts]
+        return chunks.concatenate(loaded_parts)
+
+    def _load_part(self, part: Mapping[Text, Any]) -> Any:
+        saver = self._get_saver()
+        local_path = saver.get_local_path(part['path'])
+        if local_path is not None:
+            return self.serializer.deserialize_file(local_path)
+        return self.serializer.deserialize_object(saver.load(part['path']))
@@ -0,0 +1,151 @@
+"""module for the node that saves datasets"""
+import collections
+import collections.abc
+import hashlib
+import json
+import uuid
+from typing import Optional, List, Union, Text, Any, Iterator, Tuple
+
+from ... import op_store  # pylint: disable=unused-import; # noqa
+from .. import runners  # pylint: disable=unused-import; # noqa
+from . import BaseNode
+from ._base_data_node import BaseDataNode
+
+
+class DataSavingNode(BaseDataNode):
+    """
+    a node that saves its (single) input as a dataset through a saver:
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> import pandas as pd
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import DataSavingNode, DataLoadingNode
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> from chariots.op_store.savers import FileSaver
+        >>> from chariots.ml.serializers import ParquetSerializer
+        >>> saver = FileSaver(tempfile.mkdtemp())
+        >>> runner = SequentialRunner()
+
+    .. doctest::
+
+        >>> save = Pipeline([
+        ...     DataSavingNode('/datasets/sales', saver=saver, serializer=ParquetSerializer(), chunk_size=2,
+        ...                    partition_by='country', input_nodes=['__pipeline_input__'])
+        ... ], 'save')
+        >>> runner.run(save, pd.DataFrame({'country': ['fr', 'us', 'fr'], 'amount': [1, 2, 3]}))
+        >>> load = Pipeline([
+        ...     DataLoadingNode('/datasets/sales', saver=saver, serializer=ParquetSerializer(), partitions=['fr'],
+        ...                     columns=['amount'], output_nodes='__pipeline_output__')
+        ... ], 'load')
+        >>> runner.run(load)
+           amount
+        0       1
+        2       3
+
+    the input of the node can either be a whole dataset (a pandas `DataFrame`, a numpy array, a list, ...) or an
+    iterator of chunks of the dataset (which allows to save datasets that do not fit in memory). Each chunk is written
+    as a separate part as soon as it is received. If `chunk_size` is set, the whole datasets (and the chunks) are
+    further split in parts of at most `chunk_size` rows.
+
+    If `partition_by` is set (only for data frames), the rows are grouped by the value of this column and each group is
+    written in its own directory (`{path}/writes/{write_id}/{partition_by}={value}/part-xxxxx.bin`) allowing the
+    `DataLoadingNode` to only read some of the partitions.
+
+    Each write of the dataset puts its parts in a new directory and, once all the parts are written, the manifest of
+    the dataset (which holds its version and lists its parts) is replaced. The readers therefore switch from the
+    previous version to the new one at once (and never see a mix of both). The parts of the previous versions are kept
+    (their manifests can be found in the directory of their write) and can be removed once no reader uses them.
+
+    :param path: the path of the dataset in the saver
+    :param saver: the saver to write the dataset with
+    :param serializer: the serializer to serialize each part of the dataset with. If `None` the `DillSerializer` is
+                       used
+    :param input_nodes: the input node of the node (which outputs the dataset or an iterator of chunks)
+    :param name: the name of the node. If `None` the name is built from the path of the dataset
+    :param chunk_size: the maximum number of rows of each part (no limit if `None`)
+    :param partition_by: the column of the data frame to partition the dataset by
+    :param extension: the extension of the files of the parts
+
+    :raises ValueError: if the node does not get exactly one input
+    :raises TypeError: if `partition_by` is set and the dataset is not a data frame
+    """
+
+    def __init__(self, path: Text,  # pylint: disable=too-many-arguments
+                 saver: Optional['op_store.savers.BaseSaver'] = None,
+                 serializer: Optional['chariots.ml.serializers.BaseSerializer'] = None,
+                 input_nodes: Optional[List[Union[Text, BaseNode]]] = None, name: Optional[Text] = None,
+                 chunk_size: Optional[int] = None, partition_by: Optional[Text] = None, extension: Text = 'bin'):
+        self.chunk_size = chunk_size
+        self.partition_by = partition_by
+        self.extension = extension
+        super().__init__(path, saver=saver, serializer=serializer, name=name, input_nodes=input_nodes)
+
+    def execute(self, params: List[Any],  # pylint: disable=arguments-differ
+                runner: Optional['runners.BaseRunner'] = None) -> Any:  # pylint: disable=unused-argument
+        """
+        saves the dataset (or the chunks of the dataset) it receives
+
+        :param params: the inputs of the node (only the dataset)
+        """
+        if len(params) != 1:
+            raise ValueError('{} expects exactly one input (the dataset), got {}'.format(self.name, len(params)))
+        saver = self._get_saver()
+        write_directory = '{}/writes/{}'.format(self.path, uuid.uuid4().hex)
+        parts = []
+        part_counts = collections.Counter()
+        for partition, part in self._iter_parts(params[0]):
+            part_path = self._part_path(write_directory, partition, part_counts[partition])
+            part_counts[partition] += 1
+            serialized_part = self.serializer.serialize_object(part)
+            saver.save(serialized_part, part_path)
+            parts.append({'path': part_path, 'partition': partition,
+                          'hash': hashlib.sha1(serialized_part).hexdigest()})
+        dataset_hash = hashlib.sha1()
+        for part in parts:
+            dataset_hash.update(part['hash'].encode('utf-8'))
+        manifest = {
+            'version': dataset_hash.hexdigest(),
+            'partition_by': self.partition_by,
+            'directory': write_directory,
+            'parts': parts,
+        }
+        # a copy of the manifest is kept with the parts so that previous versions can be found
+        saver.save(json.dumps(manifest, sort_keys=True).encode('utf-8'),
+                   '{}/{}'.format(write_directory, self.manifest_file))
+        self._save_manifest(manifest)
+
+    def _part_path(self, write_directory: Text, partition: Optional[Text], index: int) -> Text:
+        partition_directory = '' if partition is None else '{}={}/'.format(self.partition_by, partition)
+        return '{}/{}part-{:05d}.{}'.format(write_directory, partition_directory, index, self.extension)
+
+    def _iter_parts(self, dataset: Any) -> Iterator[Tuple[Optional[Text], Any]]:
+        """yields the partition and the data of all the parts to write"""
+        chunks = dataset if isinstance(dataset, collections.abc.Iterator) else [dataset]
+        for chunk in chunks:
+            for partition, partition_chunk in self._partition(chunk):
+                for part in self._split(partition_chunk):
+                    yield partition, part
+
+    def _partition(self, chunk: Any) -> Iterator[Tuple[Optional[Text], Any]]:
+        if self.partition_by is None:
+            yield None, chunk
+            return
+        if not hasattr(chunk, 'groupby'):
+            raise TypeError('can only partition data frames, got {}'.format(type(chunk)))
+        for value, group in chunk.groupby(self.partition_by, sort=True):
+            yield str(value), group
+
+    def _split(self, chunk: Any) -> Iterator[Any]:
+        if self.chunk_size is None or len(chunk) <= self.chunk_size:
+            yield chunk
+            return
+        rows = chunk.iloc if hasattr(chunk, 'iloc') else chunk
+        for start in range(0, len(chunk), self.chunk_size):
+            yield rows[start: start + self.chunk_size]
+
+    @property
+    def requires_full_dataset(self) -> bool:
+        # the manifest must be written once all the chunks have been received
+        return True
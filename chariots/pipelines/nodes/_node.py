@@ -43,12 +43,15 @@ class Node(BaseNode):
                         be given to the op in the order they are defined in this argument.
     :param output_nodes: a symbolic name for the the output(s) of the op, if the op returns a tuple `output_noes`
                          should be the same length as said tuple
+    :param memoize: whether or not the outputs of the op can be memoized across runs by the runner's
+                    :doc:`NodeMemoizer<./caches>` (if any). Only use this with ops that do not have side effects (
+                    never with an ML op that is being fitted for instance)
     """
 
     def __init__(self, op: ops.BaseOp, input_nodes: Optional[List[Union[Text, BaseNode]]] = None,
-                 output_nodes: Union[List[Union[Text, BaseNode]], Text, BaseNode] = None):
+                 output_nodes: Union[List[Union[Text, BaseNode]], Text, BaseNode] = None, memoize: bool = False):
         self._op = op
-        super().__init__(input_nodes=input_nodes, output_nodes=output_nodes)
+        super().__init__(input_nodes=input_nodes, output_nodes=output_nodes, memoize=memoize)
 
     @property
     def node_version(self) -> versioning.Version:
@@ -135,5 +138,15 @@ class Node(BaseNode):
         # protected access needed to solve circular imports
         return isinstance(self._op, pipelines.Pipeline)  # pylint: disable=protected-access
 
+    @property
+    def requires_full_dataset(self) -> bool:
+        return self._op.requires_full_dataset
+
+    def start_stream(self):
+        self._op.start_stream()
+
+    def end_stream(self):
+        self._op.end_stream()
+
     def __repr__(self):
         return '<Node of {} with inputs {} and output {}>'.format(self._op.name, self.input_nodes, self.output_nodes)
@@ -142,6 +142,26 @@ class BaseOp(metaclass=versioning.VersionableMeta):  # pylint: disable=no-member
         """
         return False
 
+    @property
+    def requires_full_dataset(self) -> bool:
+        """
+        whether or not this op needs its whole input at once (and cannot be executed chunk by chunk by the
+        `StreamingRunner`). this is usually False but is True for ML ops that are being fitted for instance
+        """
+        return False
+
+    def start_stream(self):
+        """
+        called by the `StreamingRunner` before this op is executed on the chunks of a stream. this does nothing by
+        default but ops that change with each chunk can use it (with `end_stream`) to only update once per stream
+        """
+
+    def end_stream(self):
+        """
+        called by the `StreamingRunner` once this op is done with the chunks of a stream (whether the stream was
+        exhausted or interrupted). this does nothing by default
+        """
+
     @property
     def name(self) -> str:
         """
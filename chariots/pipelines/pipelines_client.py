@@ -88,8 +88,7 @@ class AbstractPipelinesClient(ABC):
             >>> with RQWorkerContext():
             ...     response = client.call_pipeline(is_odd_pipeline, 4, use_worker=True)
             ...     print(response.job_status)
-            ...     time.sleep(5)
-            ...     response = client.fetch_job(response.job_id, is_odd_pipeline)
+            ...     response = client.wait_for_job(response.job_id, is_odd_pipeline)
             ...     print(response.job_status)
             ...     print(response.value)
             JobStatus.queued
@@ -131,6 +130,22 @@ class AbstractPipelinesClient(ABC):
         response_json = self._send_request_to_backend(fetch_route, data={'job_id': job_id})
         return PipelineResponse.from_request(response_json, pipeline)
 
+    def wait_for_job(self, job_id: str, pipeline: Pipeline, timeout: float = 30.) -> PipelineResponse:
+        """
+        waits for a job launched previously to be over (done or failed) and fetches it. The server answers as soon as
+        the job is over (rather than the client polling `fetch_job`)
+
+        :param job_id: the job id that can be found in `PipelineResponse.job_id`
+        :param pipeline: the pipeline object to fetch
+        :param timeout: the maximum time (in seconds) to wait for (the server waits for at most a minute)
+
+        :return: the updated Pipeline response (with the current status of the job if it is not over after `timeout`
+                 seconds)
+        """
+        wait_route = '/jobs/wait'
+        response_json = self._send_request_to_backend(wait_route, data={'job_id': job_id, 'timeout': timeout})
+        return PipelineResponse.from_request(response_json, pipeline)
+
     def save_pipeline(self, pipeline: Pipeline):
         """
         persists the state of the pipeline on the remote `Chariots` server (usually used for saving the nodes that were
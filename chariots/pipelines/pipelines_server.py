@@ -1,14 +1,19 @@
 """class that handles the backend setup of the Chariots app, to deploy the pipelines in a Flask server"""
 import json
-from typing import Mapping, Any, List, Optional, Union
+import time
+from typing import Mapping, Any, List, Optional, Union, Iterator
 
-from flask import Flask, request
+from flask import Flask, Response, request, stream_with_context
 
 
 import chariots
 from .. import errors, versioning
+from .._helpers import metrics, profiling, tracing
 from . import Pipeline
-from . import runners, nodes, callbacks
+from . import runners, nodes, callbacks, caches
+
+# the maximum time (in seconds) a `/jobs/wait` request (or a `/jobs/events` stream) can hold a thread of the server
+MAX_JOB_WAIT = 60.
 
 
 class PipelineResponse:
@@ -120,12 +125,17 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
 
     - `/health_check`
     - `/available_pipelines`
+    - `/jobs/fetch/` (the current response of a job executed in a worker)
+    - `/jobs/wait` (blocks until a job executed in a worker is over or until a timeout, at most `MAX_JOB_WAIT` seconds)
+    - `/jobs/events/<job_id>` (a server-sent events stream of the responses of a job each time its status changes,
+      closed after `MAX_JOB_WAIT` seconds, the clients can reconnect to follow the job further)
+    - `/metrics` (the latency of the requests and the metrics recorded by the `MetricsCallback` in the Prometheus text
+      format)
+    - `/debug/profile` (the stacks sampled by the `ProfilingCallback` in the collapsed stack or speedscope format) and
+      `/debug/profile/clear` (`POST`, removes the samples), only if `profile_route` is set
 
     :param app_pipelines: the pipelines this app will serve
-    :param path: the path to mount the app on (whether on local or remote saver). for isntance using a `LocalFileSaver`
-                 and '/chariots' will mean all the information persisted by the `Chariots` server (past versions,
-                 trained models, datasets) will be persisted there
-    :param saver_cls: the saver class to use. if None the `FileSaver` class will be used as default
+    :param op_store_client: the client to the op store the server should load and save its pipelines' ops with
     :param runner: the runner to use to run the pipelines. If None the `SequentialRunner` will be used
                   as default
     :param default_pipeline_callbacks: pipeline callbacks to be added to every pipeline this app will serve.
@@ -133,6 +143,12 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
                         config)
     :param use_workers: whether or not to use workers to execute all pipeline execution requests (if set to false, you
                         can still choose to use workers on pipeline to pipeline basis)
+    :param result_cache: a :doc:`result cache<./caches>` to be used by every pipeline of this app that does not define
+                         its own. Only use this if all the pipelines of the app are deterministic.
+    :param data_saver: a saver to attach to all the data nodes (`DataLoadingNode`, `DataSavingNode`) of the pipelines
+                       of this app that do not have one
+    :param profile_route: whether or not to serve the profiles recorded by the `ProfilingCallback` (the stacks of the
+                          profiled runs expose the code of the app, only enable this on servers that are not public)
     :param args: additional positional arguments to be passed to the Flask app
     :param kwargs: additional keywords arguments to be added to the Flask app
 
@@ -145,15 +161,23 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
                  default_pipeline_callbacks: Optional[List[callbacks.PipelineCallback]] = None,
                  worker_pool: 'Optional[chariots.workers.BaseWorkerPool]' = None,
                  use_workers: Optional[bool] = None,
+                 result_cache: Optional[caches.BaseResultCache] = None,
+                 data_saver: 'Optional[chariots.op_store.savers.BaseSaver]' = None,
+                 profile_route: bool = False,
                  **kwargs):
         super().__init__(*args, **kwargs)
 
         self.runner = runner or runners.SequentialRunner()
         self.op_store_client = op_store_client
 
-        # adding the default pipeline callbacks to all the pipelines of the app
+        # adding the default pipeline callbacks (and cache) to all the pipelines of the app
         for pipeline in app_pipelines:
             pipeline.callbacks.extend(default_pipeline_callbacks or [])
+            if pipeline.result_cache is None:
+                pipeline.result_cache = result_cache
+            for node in pipeline.pipeline_nodes:
+                if data_saver is not None and isinstance(node, nodes.BaseDataNode) and node.saver is None:
+                    node.attach_saver(data_saver)
 
         self._pipelines = {
             pipe.name: pipe for pipe in app_pipelines
@@ -165,6 +189,9 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
 
         self._init_pipelines()
         self._build_route()
+        metrics.instrument_flask_app(self, 'pipelines')
+        if profile_route:
+            profiling.add_profile_route(self)
         self._build_error_handlers()
         self._worker_pool = worker_pool
         self.use_workers = use_workers
@@ -207,17 +234,21 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
                 raise ValueError('pipeline not loaded, load before execution')
             pipeline = self._pipelines[pipeline_name]
             pipeline_input = request.json.get('pipeline_input') if request.json else None
-            if self._should_execute_pipeline_async(app_worker_config=self.use_workers,
-                                                   pipeline_worker_config=pipeline.use_worker,
-                                                   request_worker_config=request.json.get('use_worker')):
-                if self._worker_pool is None:
-                    raise ValueError('execution requested using workers, however no WorkerPool was provided at init')
-                job_id = self._worker_pool.execute_pipeline_async(pipeline, pipeline_input, self)
-                return self._worker_pool.get_pipeline_response_json_for_id(job_id)
-            response = PipelineResponse(self.runner.run(pipeline, pipeline_input),
-                                        pipeline.get_pipeline_versions(), job_id=None,
-                                        job_status=chariots.workers.JobStatus.done)
-            return json.dumps(response.json())
+            with callbacks.TracingCallback.trace_pipeline(pipeline, 'serve_pipeline'):
+                if self._should_execute_pipeline_async(app_worker_config=self.use_workers,
+                                                       pipeline_worker_config=pipeline.use_worker,
+                                                       request_worker_config=request.json.get('use_worker')):
+                    if self._worker_pool is None:
+                        raise ValueError('execution requested using workers, however no WorkerPool was provided at '
+                                         'init')
+                    with tracing.child_span('enqueue', 'server'):
+                        job_id = self._worker_pool.execute_pipeline_async(pipeline, pipeline_input, self)
+                    return self._worker_pool.get_pipeline_response_json_for_id(job_id)
+                response = PipelineResponse(self._run_pipeline(pipeline, pipeline_input),
+                                            pipeline.get_pipeline_versions(), job_id=None,
+                                            job_status=chariots.workers.JobStatus.done)
+                with tracing.child_span('json_encode', 'server'):
+                    return json.dumps(response.json())
         self.add_url_rule('/pipelines/<pipeline_name>/main', 'serve_pipeline', serve_pipeline, methods=['POST'])
 
         def load_pipeline(pipeline_name):
@@ -233,7 +264,8 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
 
         def save_pipeline(pipeline_name):
             pipeline = self._pipelines[pipeline_name]
-            pipeline.save(self.op_store_client)
+            with callbacks.TracingCallback.trace_pipeline(pipeline, 'save_pipeline'):
+                pipeline.save(self.op_store_client)
             return json.dumps({})
         self.add_url_rule('/pipelines/<pipeline_name>/save', 'save_pipeline', save_pipeline, methods=['POST'])
 
@@ -254,10 +286,69 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
             return self._worker_pool.get_pipeline_response_json_for_id(job_id)
         self.add_url_rule('/jobs/fetch/', 'fetch_job', fetch_job, methods=['POST'])
 
+        def wait_for_job():
+            job_id = request.json['job_id']
+            if job_id is None:
+                raise ValueError('job id is None, results are probably already present')
+            timeout = request.json.get('timeout')
+            timeout = MAX_JOB_WAIT if timeout is None else min(float(timeout), MAX_JOB_WAIT)
+            return self._worker_pool.wait_for_job(job_id, timeout)
+        self.add_url_rule('/jobs/wait', 'wait_for_job', wait_for_job, methods=['POST'])
+
+        def job_events(job_id):
+            return Response(stream_with_context(self._job_events(job_id)), mimetype='text/event-stream')
+        self.add_url_rule('/jobs/events/<job_id>', 'job_events', job_events, methods=['GET'])
+
         def all_pipelines():
             return json.dumps(list(self._pipelines.keys()))
         self.add_url_rule('/available_pipelines', 'all_pipelines', all_pipelines, methods=['GET'])
 
+    def _job_events(self, job_id: str, status_check_interval: float = 1.) -> Iterator[str]:
+        """
+        the server-sent events of a job: the response of the job each time its status changes, until it is over or
+        until the stream has been open for `MAX_JOB_WAIT` seconds (so a job that never ends does not hold a thread of
+        the server forever)
+
+        :param job_id: the id of the job
+        :param status_check_interval: the maximum time (in seconds) between two checks of the status of the job (the
+                                      end of the job is sent as soon as the worker pool notifies it)
+        """
+        deadline = time.time() + MAX_JOB_WAIT
+        response_json = self._worker_pool.get_pipeline_response_json_for_id(job_id)
+        last_status = None
+        while True:
+            job_status = chariots.workers.JobStatus(json.loads(response_json)['job_status'])
+            if job_status is not last_status:
+                yield 'data: {}\n\n'.format(response_json)
+                last_status = job_status
+            remaining_time = deadline - time.time()
+            if job_status.is_finished or remaining_time <= 0:
+                return
+            response_json = self._worker_pool.wait_for_job(job_id,
+                                                           timeout=min(status_check_interval, remaining_time))
+
+    def _run_pipeline(self, pipeline: Pipeline, pipeline_input: Any) -> Any:
+        """
+        runs a pipeline synchronously, using its result cache (if any) to avoid executing the same request twice
+
+        :param pipeline: the pipeline to run
+        :param pipeline_input: the input to run the pipeline with
+
+        :return: the output of the pipeline
+        """
+        cache = pipeline.result_cache
+        if cache is None:
+            return self.runner.run(pipeline, pipeline_input)
+        cache_key = cache.build_key(pipeline, pipeline_input)
+        is_hit, result = cache.get(cache_key)
+        for callback in pipeline.callbacks:
+            callback.after_cache_lookup(pipeline, [pipeline_input], cache, is_hit)
+        if is_hit:
+            return result
+        result = self.runner.run(pipeline, pipeline_input)
+        cache.set(cache_key, result)
+        return result
+
     def _load_pipelines(self):
         for pipeline in self._pipelines.values():
             try:
@@ -266,5 +357,7 @@ class PipelinesServer(Flask):  # pylint: disable=too-many-instance-attributes
                 continue
 
     def _load_single_pipeline(self, pipeline_name):
-        self._pipelines[pipeline_name].load(self.op_store_client)
+        pipeline = self._pipelines[pipeline_name]
+        with callbacks.TracingCallback.trace_pipeline(pipeline, 'load_pipeline'):
+            pipeline.load(self.op_store_client)
         self._loaded_pipelines[pipeline_name] = True
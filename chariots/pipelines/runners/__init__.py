@@ -1,9 +1,10 @@
 """
 runners are used to execute Pipelines: they define in what order and how each node of the pipeline should be executed.
 
-For the moment Chariots only provides a basic sequential runner that executes each operation of a pipeline one after the
-other in a single threat however we have plans to introduce new runners (process and thread based ones as well as some
-cluster computing one) in future releases.
+For the moment Chariots provides a basic sequential runner that executes each operation of a pipeline one after the
+other in a single threat and a streaming runner that executes a pipeline on a stream of chunks (to score datasets that
+do not fit in memory for instance). We have plans to introduce new runners (process based ones as well as some cluster
+computing one) in future releases.
 
 You can use runners directly if you want to execute your pipeline manually:
 
@@ -42,9 +43,11 @@ or you can set the default runner of your app and it will be used every time a p
 """
 from ._base_runner import BaseRunner
 from ._sequential_runner import SequentialRunner
+from ._streaming_runner import StreamingRunner
 
 
 __all__ = [
     'SequentialRunner',
+    'StreamingRunner',
     'BaseRunner'
 ]
@@ -1,6 +1,6 @@
 """module for the abstract runner classes"""
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from typing import Optional, Any, List, Union, Text
 
 
 class BaseRunner(ABC):  # pylint: disable=too-few-public-methods
@@ -23,17 +23,45 @@ class BaseRunner(ABC):  # pylint: disable=too-few-public-methods
         >>> runner.run(is_odd_pipeline, 3)
         True
 
+    you can also ask the runner for intermediate outputs of a pipeline. In this case only the nodes needed to compute
+    those outputs are executed:
+
+    .. testsetup::
+
+        >>> from chariots._helpers.doc_utils import AddOneOp
+        >>> add_one_is_odd = Pipeline([
+        ...     Node(AddOneOp(), input_nodes=["__pipeline_input__"], output_nodes=["added_number"]),
+        ...     Node(IsOddOp(), input_nodes=["added_number"], output_nodes=["__pipeline_output__"])
+        ... ], "add_one_is_odd")
+
+    .. doctest::
+
+        >>> runner.run(add_one_is_odd, 3, outputs=["added_number"])
+        {'added_number': 4}
+
     To create a new runner (for instance to execute your pipeline on a cluster) you only have to override `run` method
     and use the `Pipeline`'s class methods (for instance you might want to look at `extract_results`, `execute_node`)
+
+    :param memoizer: a :doc:`NodeMemoizer<./caches>` to persist the outputs of the nodes created with `memoize=True`
+                     across runs. if set, those nodes are only re-executed when their version or their inputs change
     """
 
+    memoizer = None
+
+    def __init__(self, memoizer: Optional['chariots.pipelines.caches.NodeMemoizer'] = None):
+        self.memoizer = memoizer
+
     @abstractmethod
-    def run(self, pipeline: 'chariots.pipelines.Pipeline', pipeline_input: Optional[Any] = None):
+    def run(self, pipeline: 'chariots.pipelines.Pipeline', pipeline_input: Optional[Any] = None,
+            outputs: Optional[List[Union[Text, 'chariots.pipelines.nodes.BaseNode']]] = None):
         """
         runs a pipeline, provides it with the correct input and extracts the results if any
 
         :param pipeline: the pipeline to run
         :param pipeline_input: the input to be given to the pipeline
+        :param outputs: some (intermediate) outputs of the pipeline to compute instead of the pipeline output. If
+                        provided, only the nodes needed to compute those outputs are executed
 
-        :return: the output of the graph called on the input if applicable
+        :return: the output of the graph called on the input if applicable. If `outputs` was provided, a dict with the
+                 name of each requested output as key and the output as value
         """
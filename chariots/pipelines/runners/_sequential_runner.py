@@ -1,5 +1,5 @@
 """sequential runner op module"""
-from typing import Optional, Any
+from typing import Optional, Any, List, Union, Text, Mapping
 
 from ... import pipelines
 from . import BaseRunner
@@ -10,7 +10,8 @@ class SequentialRunner(BaseRunner):  # pylint: disable=too-few-public-methods
     runner that executes every node in a pipeline sequentially in a single thread.
     """
 
-    def run(self, pipeline: 'pipelines.Pipeline', pipeline_input: Optional[Any] = None):
+    def run(self, pipeline: 'pipelines.Pipeline', pipeline_input: Optional[Any] = None,
+            outputs: Optional[List[Union[Text, 'pipelines.nodes.BaseNode']]] = None):
 
         for callback in pipeline.callbacks:
             callback.before_execution(pipeline, [pipeline_input])
@@ -18,6 +19,12 @@ class SequentialRunner(BaseRunner):  # pylint: disable=too-few-public-methods
             pipelines.nodes.ReservedNodes.pipeline_input.reference: pipeline_input
         } if pipeline_input is not None else {}
 
+        if outputs is not None:
+            results = self._run_partial(pipeline, temp_results, outputs)
+            for callback in pipeline.callbacks:
+                callback.after_execution(pipeline, [pipeline_input], results)
+            return results
+
         for node in pipeline.pipeline_nodes:
             temp_results = pipeline.execute_node(node, temp_results, self)
 
@@ -29,3 +36,23 @@ class SequentialRunner(BaseRunner):  # pylint: disable=too-few-public-methods
         for callback in pipeline.callbacks:
             callback.after_execution(pipeline, [pipeline_input], temp_results)
         return temp_results
+
+    def _run_partial(self, pipeline: 'pipelines.Pipeline', temp_results: Mapping,
+                     outputs: List[Union[Text, 'pipelines.nodes.BaseNode']]) -> Mapping[Text, Any]:
+        """
+        only executes the nodes of the pipeline that are needed to compute some of its outputs
+
+        :param pipeline: the pipeline to run
+        :param temp_results: the initial intermediate results (containing the pipeline input if any)
+        :param outputs: the outputs requested
+
+        :return: a mapping with the name of the requested outputs as keys and the outputs as values
+        """
+        output_references = pipeline.resolve_output_references(outputs)
+        results = {}
+        for node in pipeline.get_required_nodes(output_references):
+            temp_results = pipeline.execute_node(node, temp_results, self)
+            # the requested outputs might be consumed by downstream nodes so we get them as soon as they are computed
+            results.update({reference.reference: temp_results[reference]
+                            for reference in node.output_references if reference in output_references})
+        return results
@@ -0,0 +1,212 @@
+"""streaming runner module"""
+import queue
+import threading
+from typing import Optional, Any, List, Union, Text, Iterable, Iterator, Tuple, Mapping
+
+from ... import pipelines
+from ..._helpers import stop_aware_queue
+from ..._helpers.typing import ResultDict
+from . import BaseRunner
+
+_END_OF_STREAM = object()
+
+
+class _StageError:  # pylint: disable=too-few-public-methods
+    """wraps an error raised in one of the stages so that it can be propagated down the stream"""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class StreamingRunner(BaseRunner):  # pylint: disable=too-few-public-methods
+    """
+    runner that executes a pipeline on a stream of chunks rather than on a single input. The pipeline input must be an
+    iterable of chunks (a generator reading a large file chunk by chunk for instance) and the runner returns an iterator
+    over the output of the pipeline for each chunk.
+
+    Each node of the pipeline runs in its own thread and the nodes are linked by bounded queues. This means that only a
+    few chunks are in memory at any given time (whatever the size of the whole stream) and that the nodes overlap (the
+    second node processes the first chunk while the first node processes the second one).
+
+    .. testsetup::
+
+        >>> from chariots.pipelines import Pipeline
+        >>> from chariots.pipelines.nodes import Node
+        >>> from chariots._helpers.doc_utils import AddOneOp, IsOddOp
+
+    .. doctest::
+
+        >>> pipeline = Pipeline([
+        ...     Node(AddOneOp(), input_nodes=["__pipeline_input__"], output_nodes=["added_number"]),
+        ...     Node(IsOddOp(), input_nodes=["added_number"], output_nodes=["__pipeline_output__"])
+        ... ], "simple_pipeline")
+        >>> runner = StreamingRunner(queue_size=2)
+        >>> list(runner.run(pipeline, iter(range(5))))
+        [True, False, True, False, True]
+
+    Only the nodes that depend on the pipeline input are executed for each chunk. The other nodes (loading a look-up
+    table for instance) are executed once before the stream starts and their outputs are provided to every chunk.
+
+    Nodes that need the whole dataset at once (such as ML ops in the `FIT` or `FIT_PREDICT` modes) cannot be executed
+    on chunks, the runner will raise a `ValueError` if one of those depends on the pipeline input. ML ops in the
+    `FIT_INCREMENTAL` mode are updated with each chunk in turn (and their version is only updated once the stream is
+    over).
+
+    The node callbacks of the pipeline are called from the threads of the different nodes and the `after_execution`
+    pipeline callbacks are called with a `None` output once the stream is exhausted.
+
+    :param queue_size: the maximum number of chunks waiting between two consecutive nodes
+    :param memoizer: a :doc:`NodeMemoizer<./caches>` to persist the outputs of the nodes created with `memoize=True`
+    """
+
+    def __init__(self, queue_size: int = 2, memoizer: Optional['pipelines.caches.NodeMemoizer'] = None):
+        super().__init__(memoizer=memoizer)
+        if queue_size <= 0:
+            raise ValueError('queue_size must be strictly positive, got {}'.format(queue_size))
+        self.queue_size = queue_size
+
+    def run(self, pipeline: 'pipelines.Pipeline', pipeline_input: Optional[Iterable[Any]] = None,
+            outputs: Optional[List[Union[Text, 'pipelines.nodes.BaseNode']]] = None) -> Iterator[Any]:
+        if pipeline_input is None:
+            raise ValueError('the streaming runner needs an iterable of chunks as pipeline input')
+        output_references = None
+        pipeline_nodes = pipeline.pipeline_nodes
+        if outputs is not None:
+            output_references = pipeline.resolve_output_references(outputs)
+            pipeline_nodes = pipeline.get_required_nodes(output_references)
+        static_nodes, streamed_nodes = self._split_nodes(pipeline_nodes)
+        self._check_streamed_nodes(streamed_nodes)
+
+        for callback in pipeline.callbacks:
+            callback.before_execution(pipeline, [pipeline_input])
+
+        static_results = {}
+        static_requested = {}
+        for node in static_nodes:
+            static_results = pipeline.execute_node(node, static_results, self)
+            self._capture_requested(node, static_results, output_references, static_requested)
+        return self._stream(pipeline, pipeline_input, static_results, static_requested, streamed_nodes,
+                            output_references)
+
+    @staticmethod
+    def _split_nodes(pipeline_nodes: List['pipelines.nodes.BaseNode']
+                     ) -> Tuple[List['pipelines.nodes.BaseNode'], List['pipelines.nodes.BaseNode']]:
+        """
+        splits the nodes between the static ones (that do not depend on the pipeline input) and the streamed ones
+
+        :param pipeline_nodes: the nodes to split
+
+        :return: the static nodes and the streamed nodes
+        """
+        streamed_references = {pipelines.nodes.ReservedNodes.pipeline_input.reference}
+        static_nodes, streamed_nodes = [], []
+        for node in pipeline_nodes:
+            if not streamed_references.intersection(node.input_nodes):
+                static_nodes.append(node)
+                continue
+            streamed_nodes.append(node)
+            streamed_references.update(node.output_references)
+        return static_nodes, streamed_nodes
+
+    @staticmethod
+    def _check_streamed_nodes(streamed_nodes: List['pipelines.nodes.BaseNode']):
+        """
+        checks that all the nodes that depend on the pipeline input can be executed chunk by chunk
+
+        :raises ValueError: if one of the nodes cannot be streamed
+        """
+        for node in streamed_nodes:
+            if node.requires_runner:
+                raise ValueError('node {} is a pipeline and cannot be streamed'.format(node.name))
+            if node.requires_full_dataset:
+                raise ValueError('node {} needs the whole dataset at once and cannot be executed on chunks (use the '
+                                 '`PREDICT` or `FIT_INCREMENTAL` modes or the `SequentialRunner`)'.format(node.name))
+
+    @staticmethod
+    def _capture_requested(node: 'pipelines.nodes.BaseNode', temp_results: ResultDict,
+                           output_references: Optional[List['pipelines.nodes.NodeReference']],
+                           requested: dict):
+        """saves the requested outputs of a node before they get consumed by downstream nodes"""
+        if output_references is None:
+            return
+        requested.update({reference.reference: temp_results[reference]
+                          for reference in node.output_references if reference in output_references})
+
+    @staticmethod
+    def _feed(chunks: Iterable[Any], static_results: ResultDict, output_queue: queue.Queue,
+              stop_event: threading.Event):
+        """feeds the chunks of the pipeline input to the first stage of the stream"""
+        input_reference = pipelines.nodes.ReservedNodes.pipeline_input.reference
+        try:
+            for chunk in chunks:
+                chunk_results = dict(static_results)
+                chunk_results[input_reference] = chunk
+                if not stop_aware_queue.put(output_queue, (chunk_results, {}), stop_event):
+                    return
+        except Exception as error:  # pylint: disable=broad-except
+            stop_aware_queue.put(output_queue, _StageError(error), stop_event)
+            return
+        stop_aware_queue.put(output_queue, _END_OF_STREAM, stop_event)
+
+    def _run_stage(self, pipeline: 'pipelines.Pipeline',  # pylint: disable=too-many-arguments
+                   node: 'pipelines.nodes.BaseNode', input_queue: queue.Queue, output_queue: queue.Queue,
+                   output_references: Optional[List['pipelines.nodes.NodeReference']], stop_event: threading.Event):
+        """executes a node on every chunk that comes in its input queue"""
+        while True:
+            item = stop_aware_queue.get(input_queue, stop_event, stopped=_END_OF_STREAM)
+            if item is _END_OF_STREAM or isinstance(item, _StageError):
+                stop_aware_queue.put(output_queue, item, stop_event)
+                return
+            chunk_results, requested = item
+            try:
+                chunk_results = pipeline.execute_node(node, chunk_results, self)
+                self._capture_requested(node, chunk_results, output_references, requested)
+            except Exception as error:  # pylint: disable=broad-except
+                stop_aware_queue.put(output_queue, _StageError(error), stop_event)
+                return
+            if not stop_aware_queue.put(output_queue, (chunk_results, requested), stop_event):
+                return
+
+    def _stream(self, pipeline: 'pipelines.Pipeline',  # pylint: disable=too-many-arguments,too-many-locals
+                pipeline_input: Iterable[Any], static_results: ResultDict, static_requested: Mapping[Text, Any],
+                streamed_nodes: List['pipelines.nodes.BaseNode'],
+                output_references: Optional[List['pipelines.nodes.NodeReference']]) -> Iterator[Any]:
+        """starts the threads of all the stages and yields the output of the pipeline for each chunk"""
+        stop_event = threading.Event()
+        for node in streamed_nodes:
+            node.start_stream()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(streamed_nodes) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(pipeline_input, static_results, queues[0], stop_event),
+                                    daemon=True)]
+        threads.extend(
+            threading.Thread(target=self._run_stage, daemon=True,
+                             args=(pipeline, node, queues[i], queues[i + 1], output_references, stop_event))
+            for i, node in enumerate(streamed_nodes)
+        )
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, _StageError):
+                    raise item.error
+                chunk_results, requested = item
+                if output_references is not None:
+                    chunk_output = dict(static_requested)
+                    chunk_output.update(requested)
+                    yield chunk_output
+                    continue
+                if len({key: value for key, value in chunk_results.items() if value is not None}) > 1:
+                    raise ValueError('multiple pipeline outputs cases not handled, got {}'.format(chunk_results))
+                yield pipeline.extract_results(chunk_results)
+        finally:
+            # stopping all the stages in case the stream was interrupted
+            stop_event.set()
+            for node in streamed_nodes:
+                node.end_stream()
+
+        for callback in pipeline.callbacks:
+            callback.after_execution(pipeline, [pipeline_input], None)
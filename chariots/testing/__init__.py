@@ -1,11 +1,24 @@
 """
 module that provides some testing utils. There are two Testing clients that allow you to test your servers (pipelines
 and op_store) without having to actually start the servers in the test.
+
+To test the scaling of your apps, the module also provides generators of synthetic pipelines (random DAGs of
+`SyntheticOp`) and op store histories (`seed_op_store`) as well as a load generator (`run_load_test`, also available
+with the `chariots load-test` command) that calls a pipelines server at a constant rate and reports the latency
+percentiles.
 """
 from ._test_pipelines_client import TestPipelinesClient
 from ._test_op_store_client import TestOpStoreClient
+from ._synthetic import SyntheticOp, build_synthetic_pipeline, seed_op_store
+from ._load_generator import LoadTestReport, run_load_test, pipeline_request_sender
 
 __all__ = [
     'TestPipelinesClient',
-    'TestOpStoreClient'
+    'TestOpStoreClient',
+    'SyntheticOp',
+    'build_synthetic_pipeline',
+    'seed_op_store',
+    'LoadTestReport',
+    'run_load_test',
+    'pipeline_request_sender',
 ]
@@ -0,0 +1,140 @@
+"""module to generate load on a pipelines server and measure its latency"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from .._helpers import benchmarking
+
+
+class LoadTestReport:
+    """
+    the report of a load test: the latencies of the successful requests and the number of errors
+
+    :param latencies: the latencies (in seconds) of the successful requests
+    :param n_errors: the number of requests that failed
+    :param duration: the duration of the load test (in seconds)
+    :param target_qps: the requested rate of the load test
+    """
+
+    def __init__(self, latencies: List[float], n_errors: int, duration: float, target_qps: float):
+        self.latencies = sorted(latencies)
+        self.n_errors = n_errors
+        self.duration = duration
+        self.target_qps = target_qps
+
+    @property
+    def n_requests(self) -> int:
+        """the number of requests sent"""
+        return len(self.latencies) + self.n_errors
+
+    @property
+    def achieved_qps(self) -> float:
+        """the rate at which the requests were completed"""
+        return self.n_requests / self.duration if self.duration else 0.
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        returns a percentile of the latencies of the successful requests (`None` if no request succeeded)
+
+        :param percent: the percentile to compute (between 0 and 100)
+        """
+        return benchmarking.percentile(self.latencies, percent)
+
+    def summary(self) -> Dict[str, Any]:
+        """the summary of the load test (as a json serializable dict)"""
+        return {
+            'n_requests': self.n_requests,
+            'n_errors': self.n_errors,
+            'target_qps': self.target_qps,
+            'achieved_qps': self.achieved_qps,
+            'p50_s': self.percentile(50),
+            'p90_s': self.percentile(90),
+            'p99_s': self.percentile(99),
+            'max_s': self.latencies[-1] if self.latencies else None,
+        }
+
+    def __str__(self):
+        summary = self.summary()
+        latencies = '  '.join('{}={}'.format(name, '{:.2f}ms'.format(summary[name] * 1000)
+                                             if summary[name] is not None else '-')
+                              for name in ['p50_s', 'p90_s', 'p99_s', 'max_s'])
+        return '{n_requests} requests ({n_errors} errors) at {achieved_qps:.1f} qps (target {target_qps:.1f} qps)' \
+               '\n{latencies}'.format(latencies=latencies, **summary)
+
+
+def run_load_test(send_request: Callable[[], Any], qps: float, duration: float,
+                  concurrency: int = 8) -> LoadTestReport:
+    """
+    sends requests at a constant rate for some time and measures their latencies. The requests are scheduled
+    regardless of the responses (open loop) and their latency is measured from the time they were scheduled at, so
+    requests delayed because all the senders were busy (the server being too slow) are accounted for:
+
+    .. doctest::
+
+        >>> report = run_load_test(lambda: time.sleep(0.001), qps=200, duration=0.1)
+        >>> report.n_requests, report.n_errors
+        (20, 0)
+
+    :param send_request: the function that sends a request (and raises an error if the request failed)
+    :param qps: the number of requests to send per second
+    :param duration: the duration (in seconds) of the load test
+    :param concurrency: the maximum number of requests being sent at once
+
+    :return: the report of the load test
+    """
+    if qps <= 0:
+        raise ValueError('the rate of the load test should be positive, got {}'.format(qps))
+    n_requests = int(qps * duration)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def timed_request(scheduled_time: float):
+        try:
+            send_request()
+        except Exception:  # pylint: disable=broad-except
+            with lock:
+                errors.append(scheduled_time)
+            return
+        latency = time.perf_counter() - scheduled_time
+        with lock:
+            latencies.append(latency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i in range(n_requests):
+            scheduled_time = start + i / qps
+            delay = scheduled_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(timed_request, scheduled_time)
+    return LoadTestReport(latencies, len(errors), time.perf_counter() - start, qps)
+
+
+def pipeline_request_sender(url: str, pipeline_name: str, pipeline_input: Any = None,
+                            timeout: float = 30.) -> Callable[[], Any]:
+    """
+    builds a function that calls a pipeline of a pipelines server (to be used with `run_load_test`)
+
+    :param url: the url of the server
+    :param pipeline_name: the name of the pipeline to call
+    :param pipeline_input: the input to call the pipeline with
+    :param timeout: the timeout of the requests (in seconds)
+    """
+    route = '{}/pipelines/{}/main'.format(url.rstrip('/'), pipeline_name)
+    payload = json.dumps({'pipeline_input': pipeline_input})
+    local = threading.local()
+
+    def send_request():
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+        response = session.post(route, data=payload, headers={'Content-Type': 'application/json'}, timeout=timeout)
+        response.raise_for_status()
+        return response
+
+    return send_request
@@ -0,0 +1,174 @@
+"""module to generate synthetic pipelines and op store histories (to test the scaling of chariots)"""
+import datetime
+import hashlib
+import random
+import time
+from typing import List, Optional
+
+from .. import op_store, pipelines
+from ..pipelines import nodes, ops
+from ..op_store.models import DBOp, DBValidatedLink, DBVersion
+
+
+class SyntheticOp(ops.LoadableOp):
+    """
+    a dummy op used to build synthetic pipelines: it returns the sum of its inputs plus one (modulo a large prime so the
+    outputs stay small in deep pipelines) and can simulate some work and some state to load and save.
+
+    :param op_name: the name of the op (synthetic ops are distinguished by their name rather than by their class)
+    :param work_seconds: the time (in seconds) the op spends busy waiting at each execution
+    :param state_size: the size (in bytes) of the state of the op (that is saved in and loaded from the op store)
+    """
+
+    def __init__(self, op_name: str, work_seconds: float = 0., state_size: int = 0):
+        super().__init__()
+        self._op_name = op_name
+        self.work_seconds = work_seconds
+        self.state = bytes(state_size)
+
+    @property
+    def name(self) -> str:
+        return self._op_name
+
+    def execute(self, *args):  # pylint: disable=arguments-differ
+        if self.work_seconds:
+            end = time.perf_counter() + self.work_seconds
+            while time.perf_counter() < end:
+                pass
+        return (sum(arg for arg in args if isinstance(arg, int)) + 1) % 1000003
+
+    def load(self, serialized_object: bytes):
+        self.state = serialized_object
+
+    def serialize(self) -> bytes:
+        return self.state
+
+
+def build_synthetic_pipeline(n_nodes: int, name: str = 'synthetic_pipeline',  # pylint: disable=too-many-arguments
+                             max_inputs: int = 3, work_seconds: float = 0., state_size: int = 0,
+                             seed: Optional[int] = None) -> pipelines.Pipeline:
+    """
+    builds a random (but valid) DAG pipeline of `SyntheticOp`. As the output of a node can only be used by one node in a
+    chariots pipeline, each node takes between zero (it is then a source node) and `max_inputs` inputs among the outputs
+    that were not used yet (the first node takes the input of the pipeline) and the last node joins all the outputs that
+    were not used by any other node (so every node contributes to the output of the pipeline):
+
+    .. doctest::
+
+        >>> from chariots.pipelines.runners import SequentialRunner
+        >>> pipeline = build_synthetic_pipeline(100, seed=42)
+        >>> len(pipeline.pipeline_nodes)
+        100
+        >>> SequentialRunner().run(pipeline, 1)  # each node adds one to the sum of its inputs
+        101
+
+    :param n_nodes: the number of nodes of the pipeline
+    :param name: the name of the pipeline (the ops are named `<name>_op_<i>`)
+    :param max_inputs: the maximum number of inputs of the nodes (but the last one)
+    :param work_seconds: the time each op spends busy waiting at each execution
+    :param state_size: the size (in bytes) of the state of each op
+    :param seed: the seed of the random generator (to build the same pipeline several times)
+
+    :return: the generated pipeline
+    """
+    if n_nodes < 1:
+        raise ValueError('a pipeline needs at least one node, got {}'.format(n_nodes))
+    random_generator = random.Random(seed)
+    unused_outputs = ['__pipeline_input__']
+    pipeline_nodes = []
+    for i in range(n_nodes):
+        if i == n_nodes - 1:
+            input_nodes, output_node = unused_outputs, '__pipeline_output__'
+        elif i == 0:
+            input_nodes, output_node = unused_outputs, 'output_0'
+        else:
+            input_nodes = random_generator.sample(unused_outputs,
+                                                  random_generator.randint(0, min(max_inputs, len(unused_outputs))))
+            output_node = 'output_{}'.format(i)
+        unused_outputs = [output for output in unused_outputs if output not in input_nodes] + [output_node]
+        pipeline_nodes.append(nodes.Node(SyntheticOp('{}_op_{}'.format(name, i), work_seconds, state_size),
+                                         input_nodes=input_nodes, output_nodes=output_node))
+    return pipelines.Pipeline(pipeline_nodes, name=name)
+
+
+def _hash(*parts) -> str:
+    return hashlib.sha1('_'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def seed_op_store(server: op_store.OpStoreServer, n_ops: int,  # pylint: disable=too-many-arguments,too-many-locals
+                  n_versions: int, n_links: int, op_names: Optional[List[str]] = None, history_days: float = 3 * 365,
+                  seed: Optional[int] = None) -> List[str]:
+    """
+    seeds the database of an op store with `n_ops` ops that have `n_versions` versions each (spread over the last
+    `history_days` days, a new minor version every 10 versions and a new major version every 100 versions) and
+    `n_links` validated links each (to random versions of random upstream ops). The rows are inserted in bulk
+    (directly in the database) so large histories can be built quickly:
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> from chariots.testing import TestOpStoreClient
+        >>> op_store_client = TestOpStoreClient(tempfile.mkdtemp())
+        >>> op_store_client.server.db.create_all()
+
+    .. doctest::
+
+        >>> op_names = seed_op_store(op_store_client.server, n_ops=20, n_versions=50, n_links=3, seed=0)
+        >>> len(op_store_client.get_all_versions_of_op(SyntheticOp(op_names[0])))
+        50
+
+    :param server: the server whose database to seed
+    :param n_ops: the number of ops to create (only used if `op_names` is not set)
+    :param n_versions: the number of versions of each op
+    :param n_links: the number of validated links of each op (as the downstream op)
+    :param op_names: the names of the ops to create (`seeded_op_<i>` for `n_ops` ops if `None`), you can use the names
+                     of the ops of a (synthetic) pipeline to load it against a large history
+    :param history_days: the number of days the versions are spread over
+    :param seed: the seed of the random generator
+
+    :return: the names of the seeded ops
+    """
+    random_generator = random.Random(seed)
+    op_names = list(op_names) if op_names is not None else ['seeded_op_{}'.format(i) for i in range(n_ops)]
+    session = server.db.session
+    db_ops = [DBOp(op_name=op_name) for op_name in op_names]
+    session.add_all(db_ops)
+    session.flush()
+
+    now = datetime.datetime.utcnow()
+    version_mappings = []
+    for db_op in db_ops:
+        for i in range(n_versions):
+            major, minor = i // 100, i // 10
+            version_mappings.append({
+                'op_id': db_op.id,
+                'version_time': now - datetime.timedelta(days=history_days * (n_versions - i) / n_versions),
+                'major_hash': _hash(db_op.op_name, 'major', major),
+                'major_version_number': major + 1,
+                'minor_hash': _hash(db_op.op_name, 'minor', minor),
+                'minor_version_number': minor + 1,
+                'patch_hash': _hash(db_op.op_name, 'patch', i),
+                'patch_version_number': i + 1,
+            })
+    session.bulk_insert_mappings(DBVersion, version_mappings)
+    session.flush()
+
+    op_ids = [db_op.id for db_op in db_ops]
+    version_ids = {op_id: [] for op_id in op_ids}
+    for version_id, op_id in session.query(DBVersion.id, DBVersion.op_id):
+        if op_id in version_ids:
+            version_ids[op_id].append(version_id)
+    link_mappings = []
+    for downstream_op_id in op_ids if len(op_ids) > 1 and n_versions else []:
+        for _ in range(n_links):
+            upstream_op_id = downstream_op_id
+            while upstream_op_id == downstream_op_id:
+                upstream_op_id = random_generator.choice(op_ids)
+            link_mappings.append({
+                'upstream_op_id': upstream_op_id,
+                'downstream_op_id': downstream_op_id,
+                'upstream_op_version_id': random_generator.choice(version_ids[upstream_op_id]),
+            })
+    session.bulk_insert_mappings(DBValidatedLink, link_mappings)
+    session.commit()
+    return op_names
@@ -1,7 +1,7 @@
 """module for the version class"""
 import hashlib
 import datetime as dt
-from typing import Optional
+from typing import Optional, Text
 
 from dateutil import parser
 
@@ -9,6 +9,25 @@ from .._helpers.typing import Hash
 from ._version_type import VersionType
 
 
+def _parse_creation_time(time_string: Text) -> dt.datetime:
+    """
+    parses the creation time of a version string (written with `str(datetime)` which is the iso format with a space
+    separator). `datetime.fromisoformat` is only available from python 3.7 on, older pythons use `strptime` and
+    `dateutil` is only used as a last resort for other formats
+    """
+    if hasattr(dt.datetime, 'fromisoformat'):
+        try:
+            return dt.datetime.fromisoformat(time_string)
+        except ValueError:
+            return parser.parse(time_string)
+    for time_format in ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S'):
+        try:
+            return dt.datetime.strptime(time_string, time_format)
+        except ValueError:
+            continue
+    return parser.parse(time_string)
+
+
 class Version:
     """
     Type of all the different versions used throughout the Chariots framework.
@@ -23,8 +42,22 @@ class Version:
     you can use the `+` operation between two version to create a new version. this new version will NOT be the same as
     creating the new version from the same VersionedFields as the two versions:
     `version(foo) + version(bar) != version(foo, bar)`
+
+    A version is built by updating its subversions (with the `update` methods) and gets finalized the first time one of
+    its subversions is read (or when it is compared, hashed or serialized): its hex digests are computed once and the
+    version becomes immutable (updating a finalized version raises a `ValueError`).
+
+    .. doctest::
+
+        >>> version = Version().update_major(b'foo')
+        >>> version.major
+        '0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33'
+        >>> Version.parse(str(version)) == version
+        True
     """
 
+    __slots__ = ('_major', '_minor', '_patch', '_creation_time', '_hash')
+
     def __init__(self, major: Optional[Hash] = None, minor: Optional[Hash] = None,
                  patch: Optional[Hash] = None, creation_time: Optional[float] = None):
         """
@@ -39,6 +72,27 @@ class Version:
         self._minor = minor or hashlib.sha1()
         self._patch = patch or hashlib.sha1()
         self._creation_time = creation_time or dt.datetime.utcnow()
+        self._hash = None
+
+    @property
+    def is_finalized(self) -> bool:
+        """whether or not the hex digests of this version are computed (and the version can no longer be updated)"""
+        return isinstance(self._major, str) and isinstance(self._minor, str) and isinstance(self._patch, str)
+
+    def finalize(self) -> 'Version':
+        """
+        computes the hex digests of all the subversions of this version. Once finalized, the version can no longer be
+        updated
+
+        :return: this version
+        """
+        if not isinstance(self._major, str):
+            self._major = self._major.hexdigest()
+        if not isinstance(self._minor, str):
+            self._minor = self._minor.hexdigest()
+        if not isinstance(self._patch, str):
+            self._patch = self._patch.hexdigest()
+        return self
 
     def __add__(self, other):
         if not isinstance(other, Version):
@@ -53,7 +107,9 @@ class Version:
         return result
 
     def __hash__(self):
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
 
     @property
     def creation_time(self) -> float:
@@ -66,29 +122,35 @@ class Version:
         return self.creation_time > other.creation_time
 
     def __eq__(self, other: 'Version') -> bool:
+        if self is other:
+            return True
         return (self.major == other.major and self.minor == other.minor and
                 self.patch == other.patch)
 
     @property
     def major(self) -> str:
         """the hash of the major subversion"""
-        if isinstance(self._major, str):
-            return self._major
-        return self._major.hexdigest()
+        if not isinstance(self._major, str):
+            self.finalize()
+        return self._major
 
     @property
     def minor(self) -> str:
         """the hash of the minor subversion"""
-        if isinstance(self._minor, str):
-            return self._minor
-        return self._minor.hexdigest()
+        if not isinstance(self._minor, str):
+            self.finalize()
+        return self._minor
 
     @property
     def patch(self) -> str:
         """the hash of the patch subversion"""
-        if isinstance(self._patch, str):
-            return self._patch
-        return self._patch.hexdigest()
+        if not isinstance(self._patch, str):
+            self.finalize()
+        return self._patch
+
+    @staticmethod
+    def _finalized_error() -> ValueError:
+        return ValueError('cannot update a finalized version (its hashes have already been read)')
 
     def update_major(self, input_bytes: bytes) -> 'Version':
         """
@@ -97,6 +159,8 @@ class Version:
         :param input_bytes: bytes to update the major subversion with
         :return: the updated version
         """
+        if isinstance(self._major, str):
+            raise self._finalized_error()
         self._major.update(input_bytes)
         return self
 
@@ -107,6 +171,8 @@ class Version:
         :param input_bytes: bytes to update the minor subversion with
         :return: the updated version
         """
+        if isinstance(self._minor, str):
+            raise self._finalized_error()
         self._minor.update(input_bytes)
         return self
 
@@ -117,6 +183,8 @@ class Version:
         :param input_bytes: bytes to update the patch subversion with
         :return: the updated version
         """
+        if isinstance(self._patch, str):
+            raise self._finalized_error()
         self._patch.update(input_bytes)
         return self
 
@@ -144,10 +212,15 @@ class Version:
         return '_'.join((hash_str, str(self._creation_time)))
 
     def __getstate__(self):
-        self._major = self.major
-        self._minor = self.minor
-        self._patch = self.patch
-        return self.__dict__
+        self.finalize()
+        return self._major, self._minor, self._patch, self._creation_time
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # versions pickled before `Version` used slots
+            state = state['_major'], state['_minor'], state['_patch'], state['_creation_time']
+        self._major, self._minor, self._patch, self._creation_time = state
+        self._hash = None
 
     @classmethod
     def parse(cls, version_string: str) -> 'Version':
@@ -160,4 +233,4 @@ class Version:
         """
         hash_str, creation_time = version_string.split('_')
         major, minor, patch = hash_str.split('.')
-        return cls(major, minor, patch, parser.parse(creation_time))
+        return cls(major, minor, patch, _parse_creation_time(creation_time))
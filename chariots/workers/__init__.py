@@ -3,13 +3,18 @@ module that handles Workers in your Chariots. those allow you to:
 * execute pipelines in parallel
 * execute pipelines asynchronously (not blocking the main server process)
 
-This module also provides a default implementation using RQ
+This module also provides a default implementation using RQ and a local implementation (using worker processes on the
+same machine as the server) that does not need a redis
 """
 from ._base_worker_pool import BaseWorkerPool, JobStatus
-from ._rq_worker_pool import RQWorkerPool
+from ._local_worker_pool import LocalWorkerPool
+from .._helpers.lazy_imports import lazy_attributes
+
+__getattr__ = lazy_attributes(__name__, {'RQWorkerPool': '._rq_worker_pool:RQWorkerPool'})
 
 __all__ = [
     'BaseWorkerPool',
-    'RQWorkerPool',
+    'RQWorkerPool',  # pylint: disable=undefined-all-variable
+    'LocalWorkerPool',
     'JobStatus'
 ]
@@ -1,10 +1,10 @@
 """module that provides base classes for the worker API"""
+import json
+import time
 from abc import abstractmethod, ABC
 from enum import Enum
 from typing import Any
 
-import rq
-
 
 class JobStatus(Enum):
     """
@@ -17,10 +17,11 @@ class JobStatus(Enum):
     deferred = 'deferred'
 
     @classmethod
-    def from_rq(cls, status: rq.job.JobStatus) -> 'JobStatus':
+    def from_rq(cls, status: 'rq.job.JobStatus') -> 'JobStatus':
         """
         Translates an RQ Job status into a Chariots JobStatus
         """
+        import rq  # pylint: disable=import-outside-toplevel
         if status == rq.job.JobStatus.QUEUED:  # pylint: disable = no-member
             return cls.queued
         if status == rq.job.JobStatus.FINISHED:  # pylint: disable = no-member
@@ -33,6 +34,11 @@ class JobStatus(Enum):
             return cls.deferred
         raise ValueError('unknown job status: {}'.format(status))
 
+    @property
+    def is_finished(self) -> bool:
+        """whether the job is over (done or failed)"""
+        return self in {JobStatus.done, JobStatus.failed}
+
 
 class BaseWorkerPool(ABC):
     """
@@ -45,6 +51,9 @@ class BaseWorkerPool(ABC):
     * spawn_worker: a method that creates a new worker
     * execute_pipeline_async: a method that executes a pipeline inside one of this Pool's workers.
     * get_pipeline_response_json_for_id: a method that to retreieve the json of the `PipelineResponse` if available
+
+    you can also override `wait_for_job` (that polls `get_pipeline_response_json_for_id` by default) if your job queue
+    can notify the end of the jobs.
     """
 
     @property
@@ -81,3 +90,20 @@ class BaseWorkerPool(ABC):
 
         :return: a jsonified version of the corresponding `PipelineResponse`
         """
+
+    def wait_for_job(self, job_id: str, timeout: float) -> str:
+        """
+        waits for a job to be over (done or failed) and returns its response (as `get_pipeline_response_json_for_id`
+        does). The response returned has the current status of the job if it is still not over after `timeout` seconds
+
+        :param job_id: the id of the job to wait for
+        :param timeout: the maximum time (in seconds) to wait for
+
+        :return: a jsonified version of the corresponding `PipelineResponse`
+        """
+        deadline = time.time() + timeout
+        while True:
+            response_json = self.get_pipeline_response_json_for_id(job_id)
+            if JobStatus(json.loads(response_json)['job_status']).is_finished or time.time() >= deadline:
+                return response_json
+            time.sleep(min(0.1, max(deadline - time.time(), 0)))
@@ -0,0 +1,218 @@
+"""local (multiprocessing) implementation of the Workers API"""
+import atexit
+import json
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
+import tempfile
+import time
+import traceback
+import uuid
+from typing import Any, Dict, Optional
+
+from .. import pipelines
+from .._helpers import tracing
+from . import BaseWorkerPool, JobStatus, _warm_pipelines
+
+
+def _write_json(path: str, content: Dict[str, Any]):
+    """writes a json file atomically (so the file is never read half written)"""
+    temp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temp_path, 'w') as json_file:
+        json.dump(content, json_file)
+    os.replace(temp_path, path)
+
+
+def _read_bytes(path: str) -> Optional[bytes]:
+    try:
+        with open(path, 'rb') as bytes_file:
+            return bytes_file.read()
+    except FileNotFoundError:
+        return None
+
+
+def _work(task_queue: 'multiprocessing.Queue', job_directory: str, parent_pid: int,
+          job_done: 'multiprocessing.Condition'):
+    """the loop of a worker process: executes the jobs of the queue until it receives `None` or its parent dies"""
+    while True:
+        try:
+            task = task_queue.get(timeout=1)
+        except queue.Empty:
+            if os.getppid() != parent_pid:
+                return
+            continue
+        if task is None:
+            return
+        job_id, pipeline_file, job_kwargs = task
+        job_path = os.path.join(job_directory, 'jobs', '{}.json'.format(job_id))
+        _write_json(job_path, {'job_status': JobStatus.running.value})
+        try:
+            result = _warm_pipelines.execute_warm_pipeline(
+                load_serialized_pipeline=lambda pipeline_file=pipeline_file: _read_bytes(pipeline_file), **job_kwargs
+            )
+        except Exception:  # pylint: disable=broad-except
+            _write_json(job_path, {'job_status': JobStatus.failed.value, 'error': traceback.format_exc()})
+        else:
+            _write_json(job_path, {'job_status': JobStatus.done.value, 'result': result})
+        with job_done:
+            job_done.notify_all()
+
+
+class LocalWorkerPool(BaseWorkerPool):  # pylint: disable=too-many-instance-attributes
+    """
+    a worker pool that executes the pipelines in local processes (on the same machine as the server), for single box
+    deployments and tests that do not want to depend on a redis. The workers are persistent processes that keep the
+    pipelines they loaded warm (like the `RQWorkerPool` workers do) and the jobs (and their results) are stored on the
+    local disk.
+
+    .. testsetup::
+
+        >>> import tempfile
+        >>> from chariots.testing import TestOpStoreClient
+        >>> op_store_client = TestOpStoreClient(tempfile.mkdtemp())
+        >>> op_store_client.server.db.create_all()
+
+    .. doctest::
+
+        >>> from chariots import workers
+        >>> from chariots.pipelines import PipelinesServer
+        >>> worker_pool = workers.LocalWorkerPool(n_workers=2)
+        >>> app = PipelinesServer([], op_store_client=op_store_client, worker_pool=worker_pool, use_workers=True,
+        ...                       import_name='app')
+        >>> worker_pool.n_workers
+        2
+
+    .. testsetup::
+
+        >>> worker_pool.close()
+
+    :param n_workers: the number of worker processes started with the pool
+    :param job_directory: the directory the jobs, their results and the pipelines sent to the workers are stored in (a
+                          temporary directory, removed when the pool is closed, by default)
+    :param job_ttl: the time (in seconds) the jobs, their results and the pipelines that were not used since are kept
+    :param start_method: the multiprocessing start method of the workers (`'fork'`, `'spawn'` or `'forkserver'`, the
+                         default start method of the platform if `None`)
+    """
+
+    def __init__(self, n_workers: int = 2, job_directory: Optional[str] = None, job_ttl: int = 24 * 3600,
+                 start_method: Optional[str] = None):
+        self._owns_job_directory = job_directory is None
+        self._job_directory = job_directory or tempfile.mkdtemp(prefix='chariots_jobs_')
+        for sub_directory in ['jobs', 'pipelines']:
+            os.makedirs(os.path.join(self._job_directory, sub_directory), exist_ok=True)
+        self._job_ttl = job_ttl
+        self._last_cleanup = time.time()
+        self._context = multiprocessing.get_context(start_method)
+        self._task_queue = self._context.Queue()
+        # notified by the workers each time they finish a job
+        self._job_done = self._context.Condition()
+        self._workers = []
+        for _ in range(n_workers):
+            self.spawn_worker()
+        atexit.register(self.close)
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self._job_directory, 'jobs', '{}.json'.format(job_id))
+
+    @property
+    def n_workers(self):
+        return sum(worker.is_alive() for worker in self._workers)
+
+    def spawn_worker(self):
+        # the workers are not daemonic so the ops can start their own processes (they stop with the pool)
+        worker = self._context.Process(target=_work,
+                                       args=(self._task_queue, self._job_directory, os.getpid(), self._job_done))
+        worker.start()
+        self._workers.append(worker)
+
+    def execute_pipeline_async(self, pipeline: 'pipelines.Pipeline', pipeline_input: Any,
+                               app: 'pipelines.PipelinesServer') -> str:
+        if not self.n_workers:
+            raise ValueError('async job requested but it seems no workers are available')
+        self._remove_expired_jobs()
+        trace_context = tracing.current_context()
+        if trace_context is not None:
+            trace_context['enqueued_at'] = time.time()
+        versions_key = _warm_pipelines.versions_key(pipeline)
+        pipeline_file = os.path.join(self._job_directory, 'pipelines', '{}_{}.pkl'.format(pipeline.name, versions_key))
+        # the pipeline is only serialized the first time this version of it is executed in a worker (its file is
+        # touched when it is reused so the pipelines still in use do not expire)
+        try:
+            os.utime(pipeline_file)
+        except FileNotFoundError:
+            with open(pipeline_file + '.tmp', 'wb') as serialized_pipeline:
+                serialized_pipeline.write(pickle.dumps(pipeline))
+            os.replace(pipeline_file + '.tmp', pipeline_file)
+        job_id = uuid.uuid4().hex
+        _write_json(self._job_path(job_id), {'job_status': JobStatus.queued.value})
+        self._task_queue.put((job_id, pipeline_file, {
+            'pipeline_name': pipeline.name,
+            'pipeline_versions_key': versions_key,
+            'pipeline_input': pipeline_input,
+            'runner': app.runner,
+            'op_store_client': app.op_store_client,
+            # the trace of the request (if any) is continued by the worker
+            'trace_context': trace_context,
+        }))
+        return job_id
+
+    def get_pipeline_response_json_for_id(self, job_id: str) -> str:
+        try:
+            with open(self._job_path(job_id)) as job_file:
+                job = json.load(job_file)
+        except FileNotFoundError:
+            raise ValueError('job {} was not found (or has expired), are you sure you submited it using '
+                             'workers'.format(job_id))
+        job_status = JobStatus(job['job_status'])
+        return json.dumps(
+            pipelines.PipelineResponse(json.loads(job['result']) if job_status is JobStatus.done else None,
+                                       {}, job_id=job_id, job_status=job_status).json())
+
+    def wait_for_job(self, job_id: str, timeout: float) -> str:
+        deadline = time.time() + timeout
+        with self._job_done:
+            while True:
+                response_json = self.get_pipeline_response_json_for_id(job_id)
+                remaining_time = deadline - time.time()
+                if JobStatus(json.loads(response_json)['job_status']).is_finished or remaining_time <= 0:
+                    return response_json
+                self._job_done.wait(remaining_time)
+
+    def _remove_expired_jobs(self):
+        """
+        removes the jobs and the pipelines that were not used for longer than the ttl of the pool (checking at most
+        once a minute)
+        """
+        now = time.time()
+        if now - self._last_cleanup < 60:
+            return
+        self._last_cleanup = now
+        for sub_directory in ['jobs', 'pipelines']:
+            directory = os.path.join(self._job_directory, sub_directory)
+            for file_name in os.listdir(directory):
+                path = os.path.join(directory, file_name)
+                try:
+                    if now - os.path.getmtime(path) > self._job_ttl:
+                        os.remove(path)
+                except FileNotFoundError:
+                    continue
+
+    def close(self, timeout: float = 5.):
+        """
+        stops the workers of the pool (once they are done with their current job) and removes the job directory if the
+        pool created it
+
+        :param timeout: the time (in seconds) to wait for each worker to stop before terminating it
+        """
+        for worker in self._workers:
+            if worker.is_alive():
+                self._task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+        if self._owns_job_directory:
+            shutil.rmtree(self._job_directory, ignore_errors=True)
@@ -1,21 +1,103 @@
 """"RQ implementation of the Workers API"""
 import json
+import math
+import pickle
+import time
+import uuid
 from _sha1 import sha1
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from redis import Redis
-from rq import Queue, Connection, Worker
+from rq import Queue, Connection, SimpleWorker, Worker, get_current_job
+from rq.exceptions import NoSuchJobError
+from rq.job import Job
 
 from .. import pipelines, op_store  # pylint: disable=unused-import; # noqa
+from .._helpers import tracing
 from . import BaseWorkerPool, JobStatus
+from . import _warm_pipelines
 
 
-def _inner_pipe_execution(pipeline: 'pipelines.Pipeline', pipeline_input: Any, runner: pipelines.runners.BaseRunner,
-                          op_store_client: 'op_store.OpStoreClient'):
-    pipeline.load(op_store_client)
-    res = json.dumps(runner.run(pipeline, pipeline_input))
-    pipeline.save(op_store_client)
-    return res
+DEFAULT_QUEUE = 'chariots_workers'
+
+
+def _pipeline_key(pipeline_name: str, versions_key: str) -> str:
+    return 'chariots:pipelines:{}:{}'.format(pipeline_name, versions_key)
+
+
+def _job_key(job_id: str) -> str:
+    return 'chariots:jobs:{}'.format(job_id)
+
+
+def _done_key(job_id: str) -> str:
+    return 'chariots:done:{}'.format(job_id)
+
+
+def _running_jobs_key(pipeline_name: str) -> str:
+    return 'chariots:running:{}'.format(pipeline_name)
+
+
+def _acquire_slot(rq_job: Job, pipeline_name: str, concurrency_limit: int) -> bool:
+    """
+    tries to register a job as running in the (redis) set of the running jobs of its pipeline. The jobs that started
+    before the timeout of the job are considered dead (RQ would have stopped them) and are removed from the set
+
+    :return: whether the job can run (the set was not full)
+    """
+    now = time.time()
+    running_jobs_key = _running_jobs_key(pipeline_name)
+    transaction = rq_job.connection.pipeline()
+    transaction.zremrangebyscore(running_jobs_key, 0, now - (rq_job.timeout or Queue.DEFAULT_TIMEOUT))
+    transaction.zadd(running_jobs_key, {rq_job.id: now})
+    transaction.zcard(running_jobs_key)
+    n_running_jobs = transaction.execute()[-1]
+    if n_running_jobs <= concurrency_limit:
+        return True
+    rq_job.connection.zrem(running_jobs_key, rq_job.id)
+    return False
+
+
+def _defer(rq_job: Job, chariots_job_id: str):
+    """
+    enqueues the job again (at the end of its queue), points its chariots id to the new job and has the worker delete
+    the current job once it returns (it would otherwise keep its kwargs, the input of the pipeline included, in redis
+    for the whole result ttl)
+    """
+    # avoids busy looping on the queue when it only contains jobs of pipelines at their concurrency limit
+    time.sleep(0.1)
+    result_ttl = rq_job.result_ttl
+    new_job = Queue(rq_job.origin, connection=rq_job.connection).enqueue(
+        rq_job.func, kwargs=rq_job.kwargs, result_ttl=result_ttl, failure_ttl=rq_job.failure_ttl,
+        job_timeout=rq_job.timeout
+    )
+    rq_job.connection.set(_job_key(chariots_job_id), new_job.id, ex=result_ttl)
+    # `get_current_job` is the instance the worker is executing: a null result ttl makes it delete the job right away
+    rq_job.result_ttl = 0
+
+
+def _inner_pipe_execution(pipeline_name: str, versions_key: str,  # pylint: disable=too-many-arguments
+                          pipeline_input: Any, runner: pipelines.runners.BaseRunner,
+                          op_store_client: 'op_store.OpStoreClient', trace_context: Optional[Dict[str, Any]] = None,
+                          chariots_job_id: Optional[str] = None, concurrency_limit: Optional[int] = None):
+    rq_job = get_current_job()
+    if concurrency_limit is not None and not _acquire_slot(rq_job, pipeline_name, concurrency_limit):
+        _defer(rq_job, chariots_job_id)
+        return None
+    try:
+        return _warm_pipelines.execute_warm_pipeline(
+            pipeline_name, versions_key,
+            lambda: rq_job.connection.get(_pipeline_key(pipeline_name, versions_key)),
+            pipeline_input, runner, op_store_client, trace_context
+        )
+    finally:
+        if concurrency_limit is not None:
+            rq_job.connection.zrem(_running_jobs_key(pipeline_name), rq_job.id)
+        if chariots_job_id is not None:
+            # wakes up the requests waiting for the job (see `RQWorkerPool.wait_for_job`)
+            transaction = rq_job.connection.pipeline()
+            transaction.rpush(_done_key(chariots_job_id), 1)
+            transaction.expire(_done_key(chariots_job_id), rq_job.result_ttl)
+            transaction.execute()
 
 
 class RQWorkerPool(BaseWorkerPool):
@@ -56,48 +138,135 @@ class RQWorkerPool(BaseWorkerPool):
                          if the redis argument is unset
     :param queue_kwargs: additional keyword arguments that will get passed to the `rq.Queue` object at init
                          be aware that the `connection` and `name` arguments will be overridden.
+    :param job_ttl: the time (in seconds) the jobs and their results are kept in redis. The ids of the jobs are
+                    registered in redis (rather than in the server process) so the results of a job can be fetched from
+                    any replica of the server (behind a load balancer, with several gunicorn workers, ...)
+    :param queues: the names of the RQ queues of the pool by decreasing priority: the workers always execute the jobs
+                   of the first queue (that has jobs) they listen to. The default queue (`chariots_workers`) is added
+                   (with the lowest priority) if it is not in the list
+    :param pipeline_queues: the queue each pipeline is executed in (by pipeline name), the pipelines that are not in
+                            this mapping are executed in the default queue. This allows to keep the latency sensitive
+                            pipelines (inference) isolated from the long ones (training).
+    :param concurrency_limits: the maximum number of jobs of a pipeline (by pipeline name) that can run at the same time
+                               (across all the workers). The jobs that would exceed this limit are put back at the end
+                               of their queue
+
+    for instance to give the priority to the predictions and to never train more than one model at a time:
+
+    .. doctest::
+
+        >>> worker_pool = workers.RQWorkerPool(
+        ...     redis=Redis(),
+        ...     queues=['inference', 'training'],
+        ...     pipeline_queues={'predict': 'inference', 'train': 'training'},
+        ...     concurrency_limits={'train': 1}
+        ... )
+
+    you can than start workers that only execute the inference jobs (`worker_pool.spawn_worker(['inference'])` or
+    `rq worker --worker-class rq.SimpleWorker inference`) and workers that execute all the jobs, the inference ones
+    first (`worker_pool.spawn_worker()` or `rq worker --worker-class rq.SimpleWorker inference training
+    chariots_workers`).
+
+    The jobs only reference their pipeline by name and by the versions of its nodes: the pipeline itself is only sent to
+    redis when the server uses a new version of it and the workers keep the pipelines they loaded until the server
+    uses newer versions (so small inference jobs do not reload their models at each call). This cache lives in the
+    process executing the jobs, so it is only effective with workers that do not fork a new process for each job
+    (`rq worker --worker-class rq.SimpleWorker chariots_workers`, which is what `spawn_worker` uses).
     """
 
-    def __init__(self, redis_kwargs: Optional[Dict[str, Any]] = None, redis: Optional[Redis] = None,
-                 queue_kwargs: Optional[Dict[str, Any]] = None):
-        self._queue_name = 'chariots_workers'
+    def __init__(self, redis_kwargs: Optional[Dict[str, Any]] = None,  # pylint: disable=too-many-arguments
+                 redis: Optional[Redis] = None, queue_kwargs: Optional[Dict[str, Any]] = None,
+                 job_ttl: int = 24 * 3600, queues: Optional[List[str]] = None,
+                 pipeline_queues: Optional[Mapping[str, str]] = None,
+                 concurrency_limits: Optional[Mapping[str, int]] = None):
         redis_kwargs = redis_kwargs or {}
         self._redis = redis or Redis(**redis_kwargs)
+        self._queue_names = list(queues or [])
+        if DEFAULT_QUEUE not in self._queue_names:
+            self._queue_names.append(DEFAULT_QUEUE)
+        self._pipeline_queues = dict(pipeline_queues or {})
+        unknown_queues = set(self._pipeline_queues.values()) - set(self._queue_names)
+        if unknown_queues:
+            raise ValueError('the pipelines are routed to unknown queues: {}'.format(', '.join(sorted(unknown_queues))))
+        self._concurrency_limits = dict(concurrency_limits or {})
         queue_kwargs = queue_kwargs or {}
         queue_kwargs['connection'] = self._redis
-        queue_kwargs['name'] = self._queue_name
-        self._queue = Queue(**queue_kwargs)
-        self._jobs = {}
+        self._queues = {}
+        for queue_name in self._queue_names:
+            queue_kwargs['name'] = queue_name
+            self._queues[queue_name] = Queue(**queue_kwargs)
+        self._job_ttl = job_ttl
+
+    def spawn_worker(self, queues: Optional[List[str]] = None):  # pylint: disable=arguments-differ
+        """
+        starts a worker (in the current process)
 
-    def spawn_worker(self):
+        :param queues: the queues the worker should listen to (by decreasing priority), all the queues of the pool if
+                       `None`
+        """
         with Connection(self._redis):
 
-            worker = Worker(self._queue_name)
+            # the jobs are executed in the worker process (rather than in a fork) to keep the loaded pipelines warm
+            worker = SimpleWorker(queues or self._queue_names)
             worker.work()
 
     def execute_pipeline_async(self, pipeline: 'pipelines.Pipeline', pipeline_input: Any,
                                app: pipelines.PipelinesServer) -> str:
-        if not self.n_workers:
-            raise ValueError('async job requested but it seems no workers are available')
-        rq_job = self._queue.enqueue(_inner_pipe_execution, kwargs={
-            'pipeline': pipeline,
+        queue = self._queues[self._pipeline_queues.get(pipeline.name, DEFAULT_QUEUE)]
+        if not Worker.count(connection=self._redis, queue=queue):
+            raise ValueError('async job requested but it seems no workers are available (listening to the {} '
+                             'queue)'.format(queue.name))
+        trace_context = tracing.current_context()
+        if trace_context is not None:
+            trace_context['enqueued_at'] = time.time()
+        versions_key = _warm_pipelines.versions_key(pipeline)
+        pipeline_key = _pipeline_key(pipeline.name, versions_key)
+        # the pipeline is only serialized if this version of it is not in redis yet (or has expired)
+        if not self._redis.expire(pipeline_key, self._job_ttl):
+            self._redis.set(pipeline_key, pickle.dumps(pipeline), ex=self._job_ttl)
+        rq_job_id = uuid.uuid4().hex
+        chariots_job_id = sha1(rq_job_id.encode('utf-8')).hexdigest()
+        # registering the job before enqueuing it as the worker might move it to another rq job (see `_defer`)
+        self._redis.set(_job_key(chariots_job_id), rq_job_id, ex=self._job_ttl)
+        queue.enqueue(_inner_pipe_execution, kwargs={
+            'pipeline_name': pipeline.name,
+            'versions_key': versions_key,
             'pipeline_input': pipeline_input,
             'runner': app.runner,
-            'op_store_client': app.op_store_client
-        })
-        chariots_job_id = sha1(rq_job.id.encode('utf-8')).hexdigest()
-        self._jobs[chariots_job_id] = rq_job
+            'op_store_client': app.op_store_client,
+            # the trace of the request (if any) is continued by the worker
+            'trace_context': trace_context,
+            'chariots_job_id': chariots_job_id,
+            'concurrency_limit': self._concurrency_limits.get(pipeline.name),
+        }, result_ttl=self._job_ttl, failure_ttl=self._job_ttl, job_id=rq_job_id)
         return chariots_job_id
 
     def get_pipeline_response_json_for_id(self, job_id: str) -> str:
-        rq_job = self._jobs.get(job_id)
+        rq_job_id = self._redis.get(_job_key(job_id))
+        try:
+            rq_job = Job.fetch(rq_job_id.decode('utf-8'), connection=self._redis) if rq_job_id is not None else None
+        except NoSuchJobError:
+            rq_job = None
         if rq_job is None:
-            raise ValueError('job {} was not found, are you sure you submited it using workers'.format(job_id))
+            raise ValueError('job {} was not found (or has expired), are you sure you submited it using '
+                             'workers'.format(job_id))
         job_status = JobStatus.from_rq(rq_job.get_status())
         return json.dumps(
             pipelines.PipelineResponse(json.loads(rq_job.result) if job_status is JobStatus.done else None,
                                        {}, job_id=job_id, job_status=job_status).json())
 
+    def wait_for_job(self, job_id: str, timeout: float) -> str:
+        deadline = time.time() + timeout
+        response_json = self.get_pipeline_response_json_for_id(job_id)
+        if JobStatus(json.loads(response_json)['job_status']).is_finished or timeout <= 0:
+            return response_json
+        # the worker pushes a token in this list once the job is over, the token is pushed back (rather than consumed)
+        # so the other requests waiting for this job (on any replica of the server) are woken up as well
+        if self._redis.brpoplpush(_done_key(job_id), _done_key(job_id), timeout=max(1, math.ceil(timeout))) is None:
+            return self.get_pipeline_response_json_for_id(job_id)
+        # RQ only marks the job as over after its function returned (or raised), polling it until the deadline
+        return super().wait_for_job(job_id, timeout=max(deadline - time.time(), 0))
+
     @property
     def n_workers(self):
         return Worker.count(connection=self._redis)
@@ -0,0 +1,64 @@
+"""
+module that executes the pipelines inside the workers, keeping the pipelines each worker process loaded warm between
+its jobs (so small inference jobs do not reload their models from the op store at each call)
+"""
+import hashlib
+import json
+import pickle
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .. import pipelines, op_store  # pylint: disable=unused-import; # noqa
+from .._helpers import tracing
+
+# the pipelines loaded by this worker process: pipeline name -> (versions key, loaded pipeline)
+_WARM_PIPELINES = {}  # type: Dict[str, Tuple[str, pipelines.Pipeline]]
+
+
+def versions_key(pipeline: 'pipelines.Pipeline') -> str:
+    """a key identifying the versions of all the nodes of a pipeline"""
+    versions = sorted((node.name, str(version)) for node, version in pipeline.get_pipeline_versions().items())
+    return hashlib.sha1(json.dumps(versions).encode('utf-8')).hexdigest()
+
+
+def execute_warm_pipeline(pipeline_name: str, pipeline_versions_key: str,  # pylint: disable=too-many-arguments
+                          load_serialized_pipeline: Callable[[], Optional[bytes]], pipeline_input: Any,
+                          runner: 'pipelines.runners.BaseRunner', op_store_client: 'op_store.OpStoreClient',
+                          trace_context: Optional[Dict[str, Any]] = None) -> str:
+    """
+    executes a pipeline in a worker. The pipeline is only deserialized if this process has not loaded these versions of
+    it yet and it is only saved if the run changed its versions (trained some ops). The pipeline is not reloaded from
+    the op store: it is pickled with the ops (and the data nodes' manifests) the server loaded, so the worker runs
+    exactly the versions identified by `pipeline_versions_key` (the op store may hold newer ones the server has not
+    loaded yet)
+
+    :param pipeline_name: the name of the pipeline to execute
+    :param pipeline_versions_key: the `versions_key` of the pipeline (as served by the server)
+    :param load_serialized_pipeline: a function that returns the pickled pipeline (only called if the pipeline is not
+                                     warm), `None` if it cannot be found
+    :param pipeline_input: the input of the pipeline
+    :param runner: the runner to execute the pipeline with
+    :param op_store_client: the op store to save the pipeline to (if the run trained some of its ops)
+    :param trace_context: the context of the trace of the request that submitted the job (if any)
+
+    :return: the output of the pipeline as json
+    """
+    cached_versions_key, pipeline = _WARM_PIPELINES.get(pipeline_name, (None, None))
+    is_warm = cached_versions_key == pipeline_versions_key
+    if not is_warm:
+        serialized_pipeline = load_serialized_pipeline()
+        if serialized_pipeline is None:
+            raise ValueError('pipeline {} was not found (or has expired)'.format(pipeline_name))
+        pipeline = pickle.loads(serialized_pipeline)
+    with pipelines.callbacks.TracingCallback.trace_pipeline(pipeline, 'worker_job', category='worker',
+                                                            parent_context=trace_context, warm=is_warm) as span:
+        if span is not None and trace_context is not None:
+            span.tracer.record_span('worker_queue', trace_context['enqueued_at'], span.start, category='worker')
+        if not is_warm:
+            _WARM_PIPELINES[pipeline_name] = pipeline_versions_key, pipeline
+        versions_before_run = versions_key(pipeline)
+        res = json.dumps(runner.run(pipeline, pipeline_input))
+        # only the pipelines that trained (changed the version of) some of their ops need to be saved
+        if versions_key(pipeline) != versions_before_run:
+            with tracing.child_span('save_pipeline', 'worker'):
+                pipeline.save(op_store_client)
+    return res
@@ -39,3 +39,56 @@ def test_command_line_interface(cookiecutter_config):  # pylint: disable=redefin
         except subprocess.CalledProcessError as err:
             print(err.output.decode('utf-8'))
             raise
+
+
+def test_load_test_command():
+    """tests that the load test command reports the failed requests (no server is listening on the url)"""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['load-test', 'http://127.0.0.1:1', 'some_pipeline', '--qps', '50',
+                                      '--duration', '0.1', '--json'])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert (report['n_requests'], report['n_errors'], report['p50_s']) == (5, 5, None)
+
+
+def test_bench_command(tmpdir):
+    """tests that the bench command reports the latencies of the nodes of the pipeline"""
+    input_path = str(tmpdir.join('input.json'))
+    with open(input_path, 'w') as input_file:
+        json.dump(3, input_file)
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['bench', 'chariots._helpers.doc_utils:is_odd_pipeline', '--input', input_path,
+                                      '--iterations', '3', '--json'])
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report['pipeline']['iterations'] == 3
+    assert list(report['nodes']) == ['isoddop']
+    assert report['nodes']['isoddop']['p50_s'] <= report['pipeline']['max_s']
+
+
+def test_bench_command_bad_reference():
+    """tests that the bench command fails on references that are not pipelines"""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['bench', 'chariots._helpers.doc_utils'])
+    assert result.exit_code != 0
+    result = runner.invoke(cli.main, ['bench', 'chariots._helpers.doc_utils:IsOddOp'])
+    assert isinstance(result.exception, TypeError)
+
+
+def test_profile_command(tmpdir):
+    """tests the cProfile and sampling modes of the profile command"""
+    input_path = str(tmpdir.join('input.json'))
+    with open(input_path, 'w') as input_file:
+        json.dump(3, input_file)
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ['profile', 'chariots._helpers.doc_utils:is_odd_pipeline', '--input', input_path,
+                                      '--mode', 'cprofile'])
+    assert result.exit_code == 0, result.output
+    assert 'function calls' in result.output
+
+    output_path = str(tmpdir.join('profile.json'))
+    result = runner.invoke(cli.main, ['profile', 'chariots._helpers.doc_utils:is_odd_pipeline', '--input', input_path,
+                                      '--mode', 'sampling', '--format', 'speedscope', '--output', output_path])
+    assert result.exit_code == 0, result.output
+    with open(output_path) as profile_file:
+        assert 'profiles' in json.load(profile_file)
@@ -0,0 +1,80 @@
+"""module to test the metrics recorded by the `MetricsCallback` and served by the servers"""
+import pickle
+
+import pytest
+
+from chariots.pipelines import PipelinesServer, Pipeline
+from chariots.pipelines.callbacks import MetricsCallback
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner
+from chariots.testing import TestPipelinesClient
+from chariots._helpers.metrics import MetricsRegistry, REGISTRY
+
+
+class FailingOp(BaseOp):
+    """op that fails on negative inputs"""
+
+    def execute(self, data):  # pylint: disable=arguments-differ
+        if min(data) < 0:
+            raise ValueError('negative input')
+        return data
+
+
+def test_metrics_callback(IsPair):  # pylint: disable=invalid-name
+    """tests the metrics recorded for each node of a pipeline"""
+    registry = MetricsRegistry()
+    pipe = Pipeline([
+        Node(FailingOp(), input_nodes=['__pipeline_input__'], output_nodes='checked'),
+        Node(IsPair(), input_nodes=['checked'], output_nodes='__pipeline_output__')
+    ], name='metered_pipe', pipeline_callbacks=[MetricsCallback(track_memory=True, registry=registry)])
+    runner = SequentialRunner()
+
+    for size in [1, 10, 100]:
+        runner.run(pipe, list(range(size)))
+    with pytest.raises(ValueError):
+        runner.run(pipe, [-1])
+
+    failing_labels = (('node', 'failingop'), ('pipeline', 'metered_pipe'))
+    pair_labels = (('node', 'ispairinner'), ('pipeline', 'metered_pipe'))
+    assert registry.get('chariots_node_duration_seconds', failing_labels).count == 4
+    assert registry.get('chariots_node_duration_seconds', pair_labels).count == 3
+    assert registry.get('chariots_node_rss_increase_bytes', pair_labels).count == 3
+    assert registry.get('chariots_pipeline_duration_seconds', (('pipeline', 'metered_pipe'),)).count == 3
+    output_sizes = registry.get('chariots_node_output_size', pair_labels)
+    assert (output_sizes.count, output_sizes.sum) == (3, 111)
+    assert registry.get('chariots_node_errors_total', failing_labels + (('error', 'ValueError'),)).value == 1
+
+    rendered = registry.render()
+    assert '# TYPE chariots_node_duration_seconds histogram' in rendered
+    assert 'chariots_node_output_size_bucket{node="ispairinner",pipeline="metered_pipe",le="128"} 3' in rendered
+    assert 'chariots_node_output_size_bucket{node="ispairinner",pipeline="metered_pipe",le="+Inf"} 3' in rendered
+
+    unpickled_callback = pickle.loads(pickle.dumps(pipe.callbacks[0]))
+    assert unpickled_callback.registry is REGISTRY
+    assert unpickled_callback.track_memory
+
+
+def test_metrics_routes(IsPair, tmpdir, opstore_func):  # pylint: disable=invalid-name
+    """tests the `/metrics` route of the pipelines and op store servers"""
+    REGISTRY.clear()
+    pipe = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='served_pipe')
+    op_store_client = opstore_func(tmpdir)
+    app = PipelinesServer([pipe], op_store_client=op_store_client, import_name='some_app',
+                          default_pipeline_callbacks=[MetricsCallback()])
+    test_client = TestPipelinesClient(app)
+    assert test_client.call_pipeline(pipe, pipeline_input=list(range(20))).value == [not i % 2 for i in range(20)]
+
+    response = app.test_client().get('/metrics')
+    assert response.status_code == 200
+    metrics = response.data.decode('utf-8')
+    assert 'chariots_node_duration_seconds_count{node="ispairinner",pipeline="served_pipe"} 1' in metrics
+    assert ('chariots_http_request_duration_seconds_count{server="pipelines",endpoint="serve_pipeline",'
+            'status="200"} 1') in metrics
+    assert 'server="op_store"' in metrics
+
+    op_store_metrics = op_store_client.server.flask.test_client().get('/metrics')
+    assert op_store_metrics.status_code == 200
+    assert 'server="op_store",endpoint="pipeline_exists"' in op_store_metrics.data.decode('utf-8')
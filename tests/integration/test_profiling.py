@@ -0,0 +1,100 @@
+"""module to test the profiles recorded by the `ProfilingCallback` and served by the pipelines server"""
+import json
+import pickle
+import threading
+import time
+
+from chariots.pipelines import PipelinesServer, Pipeline
+from chariots.pipelines.callbacks import ProfilingCallback
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner
+from chariots.testing import TestPipelinesClient
+from chariots._helpers import profiling
+
+
+class SleepOp(BaseOp):
+    """op that sleeps before returning its input"""
+
+    def execute(self, data):  # pylint: disable=arguments-differ
+        time.sleep(0.05)
+        return data
+
+
+def test_profiling_callback():
+    """tests the sampling of the runs of a pipeline"""
+    sampler = profiling.Sampler(interval=0.001)
+    pipe = Pipeline([
+        Node(SleepOp(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='profiled_pipe', pipeline_callbacks=[ProfilingCallback(sample_rate=0., slow_threshold=10.,
+                                                                   sampler=sampler)])
+    runner = SequentialRunner()
+
+    # the run is faster than the threshold
+    assert runner.run(pipe, 1) == 1
+    assert not sampler.get_samples()
+
+    pipe.callbacks[0].slow_threshold = 0.01
+    assert runner.run(pipe, 1) == 1
+    samples = sampler.get_samples()
+    assert ('profiled_pipe', 'sleepop') in samples
+    collapsed = profiling.render_collapsed(samples).splitlines()
+    assert any(line.startswith('profiled_pipe;sleepop;') and ';execute (' in line for line in collapsed)
+    assert all(int(line.rsplit(' ', 1)[1]) > 0 for line in collapsed)
+
+    sampler.clear()
+    assert not sampler.get_samples()
+    unpickled_callback = pickle.loads(pickle.dumps(pipe.callbacks[0]))
+    assert unpickled_callback.sampler is profiling.SAMPLER
+    assert unpickled_callback.slow_threshold == 0.01
+
+
+def test_sampler_waits_for_slow_runs():
+    """tests that the sampler does not sample the stacks of the runs that did not reach their delay yet"""
+    sampler = profiling.Sampler(interval=0.001)
+    sample_calls = []
+    sample = sampler._sample  # pylint: disable=protected-access
+    sampler._sample = lambda runs: sample_calls.append(len(runs)) or sample(runs)  # pylint: disable=protected-access
+
+    sampler.start_run('slow_pipe', delay=10.)
+    time.sleep(0.1)
+    assert not sample_calls
+    sampler.end_run('slow_pipe')
+
+    # a run without delay wakes the sampling thread up
+    sampler.start_run('slow_pipe', delay=10.)
+    threading.Thread(target=lambda: (sampler.start_run('fast_pipe'), time.sleep(0.1),
+                                     sampler.end_run('fast_pipe'))).start()
+    time.sleep(0.2)
+    sampler.end_run('slow_pipe')
+    assert sample_calls and set(sample_calls) == {1}
+
+
+def test_profile_route(tmpdir, opstore_func):
+    """tests the `/debug/profile` route of the pipelines server"""
+    profiling.SAMPLER.clear()
+    pipe = Pipeline([
+        Node(SleepOp(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='served_pipe')
+    app = PipelinesServer([pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                          default_pipeline_callbacks=[ProfilingCallback(sample_rate=1.)], profile_route=True)
+    test_client = TestPipelinesClient(app)
+    assert test_client.call_pipeline(pipe, pipeline_input=3).value == 3
+
+    flask_client = app.test_client()
+    speedscope = json.loads(flask_client.get('/debug/profile?format=speedscope').data.decode('utf-8'))
+    profile, = speedscope['profiles']
+    assert profile['name'] == 'served_pipe'
+    assert len(profile['samples']) == len(profile['weights'])
+    frame_names = {speedscope['shared']['frames'][index]['name'] for sample in profile['samples'] for index in sample}
+    assert {'served_pipe', 'sleepop', 'execute'} <= frame_names
+
+    assert flask_client.get('/debug/profile').data.decode('utf-8').startswith('served_pipe;')
+    assert flask_client.get('/debug/profile/clear').status_code == 405
+    assert flask_client.post('/debug/profile/clear').status_code == 204
+    assert flask_client.get('/debug/profile').data.decode('utf-8') == ''
+    assert flask_client.get('/debug/profile?format=pprof').status_code == 400
+
+    # the route is opt-in
+    other_app = PipelinesServer([pipe], op_store_client=opstore_func(tmpdir.mkdir('other')), import_name='other_app')
+    assert other_app.test_client().get('/debug/profile').status_code == 404
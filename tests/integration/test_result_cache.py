@@ -0,0 +1,92 @@
+"""module to test the result caches of the pipelines server"""
+import time
+
+from chariots.pipelines import PipelinesServer, Pipeline
+from chariots.pipelines.caches import InMemoryResultCache
+from chariots.pipelines.callbacks import PipelineCallback
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.testing import TestPipelinesClient
+
+
+class CountingIsPair(BaseOp):
+    """op that counts the number of times it got executed"""
+
+    n_calls = 0
+
+    def execute(self, data):  # pylint: disable=arguments-differ
+        CountingIsPair.n_calls += 1
+        return [not i % 2 for i in data]
+
+
+class CacheLogger(PipelineCallback):
+    """callback that records all the cache lookups"""
+
+    def __init__(self):
+        self.lookups = []
+
+    def after_cache_lookup(self, pipeline, args, cache, is_hit):
+        self.lookups.append((is_hit, cache.hits, cache.misses))
+
+
+def test_in_memory_cache_lru():
+    """tests the least recently used eviction of the in memory cache"""
+    cache = InMemoryResultCache(max_entries=2)
+    cache.set('foo', 1)
+    cache.set('bar', 2)
+    assert cache.get('foo') == (True, 1)
+    cache.set('blu', 3)
+    assert cache.get('bar') == (False, None)
+    assert cache.get('foo') == (True, 1)
+    assert cache.get('blu') == (True, 3)
+    assert len(cache) == 2
+    assert cache.stats == {'hits': 3, 'misses': 1}
+
+
+def test_in_memory_cache_ttl():
+    """tests the expiry of the entries of the in memory cache"""
+    cache = InMemoryResultCache(ttl=0.1)
+    cache.set('foo', 1)
+    assert cache.get('foo') == (True, 1)
+    time.sleep(0.2)
+    assert cache.get('foo') == (False, None)
+    assert not cache
+
+
+def test_app_result_cache(tmpdir, opstore_func):
+    """tests that the app does not re-execute a pipeline it already has a result for"""
+    CountingIsPair.n_calls = 0
+    cache_logger = CacheLogger()
+    pipe = Pipeline([
+        Node(CountingIsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='cached_pipe', pipeline_callbacks=[cache_logger])
+
+    app = PipelinesServer([pipe], op_store_client=opstore_func(tmpdir), result_cache=InMemoryResultCache(),
+                          import_name='some_app')
+    test_client = TestPipelinesClient(app)
+
+    for _ in range(3):
+        response = test_client.call_pipeline(pipe, pipeline_input=list(range(20)))
+        assert response.value == [not i % 2 for i in range(20)]
+    assert CountingIsPair.n_calls == 1
+
+    response = test_client.call_pipeline(pipe, pipeline_input=list(range(10)))
+    assert response.value == [not i % 2 for i in range(10)]
+    assert CountingIsPair.n_calls == 2
+    assert cache_logger.lookups == [(False, 0, 1), (True, 1, 1), (True, 2, 1), (False, 2, 2)]
+
+
+def test_result_cache_key_versions(savable_op_generator, Range10):  # pylint: disable=invalid-name
+    """tests that the cache key changes with the version of the nodes of the pipeline"""
+    first_pipe = Pipeline([
+        Node(Range10(), output_nodes='my_list'),
+        Node(savable_op_generator(1)(), input_nodes=['my_list'], output_nodes='__pipeline_output__')
+    ], name='my_pipe')
+    second_pipe = Pipeline([
+        Node(Range10(), output_nodes='my_list'),
+        Node(savable_op_generator(2)(), input_nodes=['my_list'], output_nodes='__pipeline_output__')
+    ], name='my_pipe')
+
+    assert InMemoryResultCache.build_key(first_pipe, [1, 2]) == InMemoryResultCache.build_key(first_pipe, [1, 2])
+    assert InMemoryResultCache.build_key(first_pipe, [1, 2]) != InMemoryResultCache.build_key(first_pipe, [2, 1])
+    assert InMemoryResultCache.build_key(first_pipe, [1, 2]) != InMemoryResultCache.build_key(second_pipe, [1, 2])
@@ -0,0 +1,65 @@
+"""module to test the synthetic pipelines and op store histories of `chariots.testing`"""
+import json
+
+from chariots.op_store.models import DBValidatedLink
+from chariots.pipelines import PipelinesServer
+from chariots.pipelines.runners import SequentialRunner
+from chariots.testing import (TestOpStoreClient, TestPipelinesClient, build_synthetic_pipeline, run_load_test,
+                              seed_op_store)
+from chariots._helpers import benchmarking
+
+
+def test_synthetic_pipeline():
+    """tests that synthetic pipelines are valid and reproducible"""
+    pipeline = build_synthetic_pipeline(300, name='large_pipeline', max_inputs=4, seed=1)
+    assert len(pipeline.pipeline_nodes) == 300
+    assert len({node.name for node in pipeline.pipeline_nodes}) == 300
+    assert max(len(node.input_nodes) for node in pipeline.pipeline_nodes[:-1]) <= 4
+    assert SequentialRunner().run(pipeline, 0) == 300
+
+    same_pipeline = build_synthetic_pipeline(300, name='large_pipeline', max_inputs=4, seed=1)
+    assert ([[str(input_node) for input_node in node.input_nodes] for node in pipeline.pipeline_nodes] ==
+            [[str(input_node) for input_node in node.input_nodes] for node in same_pipeline.pipeline_nodes])
+
+
+def test_seeded_op_store(tmpdir):
+    """tests loading and serving a synthetic pipeline against a large op store history"""
+    op_store_client = TestOpStoreClient(str(tmpdir))
+    op_store_client.server.db.create_all()
+    pipeline = build_synthetic_pipeline(50, name='seeded_pipeline', state_size=16, seed=0)
+    op_names = seed_op_store(op_store_client.server, n_ops=0, n_versions=200, n_links=5,
+                             op_names=[node.name for node in pipeline.pipeline_nodes], seed=0)
+    seed_op_store(op_store_client.server, n_ops=100, n_versions=10, n_links=2, seed=0)
+
+    all_versions = op_store_client.get_all_versions_of_op(pipeline.pipeline_nodes[0]._op)  # pylint: disable=protected-access
+    assert len(all_versions) == 200
+    assert len({version.major for version in all_versions}) == 2
+    assert (max(all_versions).creation_time - min(all_versions).creation_time).days > 3 * 360
+
+    assert DBValidatedLink.query.count() == len(op_names) * 5 + 100 * 2
+
+    app = PipelinesServer([pipeline], op_store_client=op_store_client, import_name='synthetic_app')
+    test_client = TestPipelinesClient(app)
+    test_client.save_pipeline(pipeline)
+    test_client.load_pipeline(pipeline)
+    flask_client = app.test_client()
+
+    def send_request():
+        response = flask_client.post('/pipelines/seeded_pipeline/main', data=json.dumps({'pipeline_input': 1}),
+                                     content_type='application/json')
+        assert json.loads(response.data.decode('utf-8'))['pipeline_output'] == 51
+
+    report = run_load_test(send_request, qps=100, duration=0.2, concurrency=1)
+    assert (report.n_requests, report.n_errors) == (20, 0)
+    assert report.percentile(50) <= report.percentile(99) <= report.summary()['max_s']
+
+
+def test_percentile():
+    """tests the nearest rank percentiles of the load test and benchmark reports"""
+    assert benchmarking.percentile([], 50) is None
+    assert benchmarking.percentile([1, 2, 3, 4, 5], 50) == 3
+    assert benchmarking.percentile([1, 2, 3, 4, 5, 6, 7], 50) == 4
+    assert benchmarking.percentile([1, 2, 3, 4], 50) == 2
+    assert benchmarking.percentile([1, 2, 3, 4, 5, 6], 50) == 3
+    assert [benchmarking.percentile(list(range(1, 11)), percent) for percent in [0, 10, 11, 90, 99, 100]] == [
+        1, 1, 2, 9, 10, 10]
@@ -0,0 +1,113 @@
+"""module to test the traces recorded by the `TracingCallback`"""
+import json
+import os
+import pickle
+
+import pytest
+
+from chariots.pipelines import PipelinesServer, Pipeline
+from chariots.pipelines.callbacks import TracingCallback
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner
+from chariots.testing import TestPipelinesClient
+from chariots._helpers import tracing
+
+
+class FailingOp(BaseOp):
+    """op that fails on negative inputs"""
+
+    def execute(self, data):  # pylint: disable=arguments-differ
+        if min(data) < 0:
+            raise ValueError('negative input')
+        return data
+
+
+def _read_traces(trace_directory):
+    traces = {}
+    for file_name in os.listdir(str(trace_directory)):
+        with open(os.path.join(str(trace_directory), file_name)) as trace_file:
+            # the traces are written in the JSON array format (without closing bracket)
+            traces[file_name[:-len('.json')]] = json.loads(trace_file.read().rstrip().rstrip(',') + ']')
+    return traces
+
+
+def test_tracing_callback(IsPair, tmpdir):  # pylint: disable=invalid-name
+    """tests the spans recorded for a pipeline and its nodes"""
+    pipe = Pipeline([
+        Node(FailingOp(), input_nodes=['__pipeline_input__'], output_nodes='checked'),
+        Node(IsPair(), input_nodes=['checked'], output_nodes='__pipeline_output__')
+    ], name='traced_pipe', pipeline_callbacks=[TracingCallback(trace_directory=str(tmpdir))])
+    runner = SequentialRunner()
+
+    assert runner.run(pipe, list(range(4))) == [True, False, True, False]
+    traces = _read_traces(tmpdir)
+    assert len(traces) == 1
+    events = {event['name']: event for event in next(iter(traces.values()))}
+    assert set(events) == {'traced_pipe', 'failingop', 'ispairinner'}
+    assert events['traced_pipe']['args']['parent_id'] is None
+    for node_name in ['failingop', 'ispairinner']:
+        assert events[node_name]['cat'] == 'node'
+        assert events[node_name]['args']['parent_id'] == events['traced_pipe']['args']['span_id']
+        assert events[node_name]['ts'] >= events['traced_pipe']['ts']
+    assert events['failingop']['ts'] + events['failingop']['dur'] <= events['ispairinner']['ts']
+
+    with pytest.raises(ValueError):
+        runner.run(pipe, [-1])
+    assert tracing.current_span() is None
+    error_trace = next(events for trace_id, events in _read_traces(tmpdir).items() if trace_id not in traces)
+    assert {event['name']: event['args'].get('error') for event in error_trace} == {
+        'traced_pipe': 'ValueError', 'failingop': 'ValueError'
+    }
+
+    unpickled_callback = pickle.loads(pickle.dumps(pipe.callbacks[0]))
+    assert unpickled_callback.tracer.exporters[0].directory == str(tmpdir)
+
+
+def test_served_pipeline_tracing(IsPair, tmpdir, opstore_func):  # pylint: disable=invalid-name
+    """tests that the serving of the pipeline and the calls to the op store are traced"""
+    trace_directory = os.path.join(str(tmpdir), 'traces')
+    pipe = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='served_pipe')
+    app = PipelinesServer([pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                          default_pipeline_callbacks=[TracingCallback(trace_directory=trace_directory)])
+    test_client = TestPipelinesClient(app)
+    test_client.save_pipeline(pipe)
+    assert test_client.call_pipeline(pipe, pipeline_input=list(range(4))).value == [True, False, True, False]
+
+    traces = list(_read_traces(trace_directory).values())
+    save_trace = next(events for events in traces if events[-1]['name'] == 'save_pipeline')
+    assert {(event['cat'], event['name']) for event in save_trace} == {
+        ('server', 'save_pipeline'), ('op_store', 'register_valid_link')
+    }
+
+    serve_trace = next(events for events in traces if events[-1]['name'] == 'serve_pipeline')
+    spans = {event['name']: event['args'] for event in serve_trace}
+    assert set(spans) == {'serve_pipeline', 'served_pipe', 'ispairinner', 'json_encode'}
+    assert spans['served_pipe']['parent_id'] == spans['serve_pipeline']['span_id']
+    assert spans['json_encode']['parent_id'] == spans['serve_pipeline']['span_id']
+
+
+def test_otlp_export():
+    """tests the conversion of the spans to the OTLP format"""
+    tracer = tracing.Tracer([])
+    with tracer.span('parent', 'pipeline', rows=3) as parent:
+        with pytest.raises(KeyError):
+            with tracer.span('child', 'node'):
+                raise KeyError()
+
+    otlp_parent = tracing.OTLPExporter._to_otlp(parent)  # pylint: disable=protected-access
+    assert otlp_parent['traceId'] == parent.trace_id and len(otlp_parent['traceId']) == 32
+    assert 'parentSpanId' not in otlp_parent
+    assert {'key': 'rows', 'value': {'intValue': '3'}} in otlp_parent['attributes']
+    assert int(otlp_parent['endTimeUnixNano']) >= int(otlp_parent['startTimeUnixNano'])
+
+    child = tracer.start_span('child', parent_context=parent.context)
+    tracer.end_span(child, error='KeyError')
+    otlp_child = tracing.OTLPExporter._to_otlp(child)  # pylint: disable=protected-access
+    assert (otlp_child['traceId'], otlp_child['parentSpanId']) == (parent.trace_id, parent.span_id)
+    assert otlp_child['status'] == {'code': 2, 'message': 'KeyError'}
+
+    with pytest.raises(ValueError):
+        TracingCallback()
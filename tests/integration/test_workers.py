@@ -1,18 +1,23 @@
 """
 this is a test module testing the workers api of Chariots
 """
+import json
+import pickle
 import time
 
 import pytest
 from flaky import flaky
 from redis import Redis
 
-from chariots.pipelines import PipelinesServer, Pipeline
+from chariots.pipelines import PipelinesServer, Pipeline, pipelines_server
+from chariots.pipelines.runners import SequentialRunner
 from chariots.pipelines.nodes import Node
 from chariots.testing import TestPipelinesClient
-from chariots.workers import JobStatus, RQWorkerPool
+from chariots.workers import (  # pylint: disable=no-name-in-module
+    JobStatus, LocalWorkerPool, RQWorkerPool, _warm_pipelines
+)
 from chariots.errors import VersionError
-from chariots._helpers.test_helpers import IsPair, RQWorkerContext, build_keras_pipeline, \
+from chariots._helpers.test_helpers import IsPair, RQWorkerContext, SlowIsPair, build_keras_pipeline, \
     do_keras_pipeline_predictions_test
 
 
@@ -68,6 +73,250 @@ def test_app_async_request(tmpdir, opstore_func):
         do_async_pipeline_test(test_client, pipe1, use_worker=True)
 
 
+def test_app_async_warm_pipeline(tmpdir, opstore_func):
+    """tests executing a pipeline several times in the same worker (which keeps the pipeline loaded)"""
+    with RQWorkerContext():
+        pipe1 = Pipeline([
+            Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='inner_pipe', use_worker=True)
+
+        app = PipelinesServer([pipe1], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=RQWorkerPool(redis=Redis()))
+        test_client = TestPipelinesClient(app)
+
+        for _ in range(3):
+            do_async_pipeline_test(test_client, pipe1)
+
+
+def test_app_async_fetch_from_other_replica(tmpdir, opstore_func):
+    """tests fetching the results of a job from another server than the one that submitted it"""
+    with RQWorkerContext():
+        pipe1 = Pipeline([
+            Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='inner_pipe', use_worker=True)
+
+        submitting_client, fetching_client = [
+            TestPipelinesClient(PipelinesServer([pipe1], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                                                worker_pool=RQWorkerPool(redis=Redis())))
+            for _ in range(2)
+        ]
+        response = submitting_client.call_pipeline(pipe1, pipeline_input=list(range(20)))
+        assert response.job_status == JobStatus.queued
+        time.sleep(5)
+        response = fetching_client.fetch_job(response.job_id, pipe1)
+        assert response.job_status == JobStatus.done
+        assert response.value == [not i % 2 for i in range(20)]
+
+        with pytest.raises(ValueError):
+            RQWorkerPool(redis=Redis()).get_pipeline_response_json_for_id('unknown_job')
+
+
+def test_app_async_queues(tmpdir, opstore_func):
+    """tests routing the pipelines to different queues with concurrency limits"""
+    with RQWorkerContext(queues=['inference', 'chariots_workers']):
+        inference_pipe = Pipeline([
+            Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='inference_pipe', use_worker=True)
+        training_pipe = Pipeline([
+            Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='training_pipe', use_worker=True)
+
+        worker_pool = RQWorkerPool(redis=Redis(), queues=['inference', 'training'],
+                                   pipeline_queues={'inference_pipe': 'inference', 'training_pipe': 'training'},
+                                   concurrency_limits={'inference_pipe': 1})
+        app = PipelinesServer([inference_pipe, training_pipe], op_store_client=opstore_func(tmpdir),
+                              import_name='some_app', worker_pool=worker_pool)
+        test_client = TestPipelinesClient(app)
+
+        # no worker listens to the training queue
+        with pytest.raises(ValueError):
+            test_client.call_pipeline(training_pipe, pipeline_input=list(range(20)))
+
+        responses = [test_client.call_pipeline(inference_pipe, pipeline_input=list(range(20))) for _ in range(3)]
+        time.sleep(5)
+        for response in responses:
+            response = test_client.fetch_job(response.job_id, inference_pipe)
+            assert response.job_status == JobStatus.done
+            assert response.value == [not i % 2 for i in range(20)]
+
+
+def test_app_async_concurrency_limit(tmpdir, opstore_func):
+    """tests that two workers do not run more jobs of a pipeline at once than its concurrency limit"""
+    with RQWorkerContext(), RQWorkerContext():
+        slow_pipe = Pipeline([
+            Node(SlowIsPair(duration=1.), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='slow_pipe', use_worker=True)
+        redis = Redis()
+        app = PipelinesServer([slow_pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=RQWorkerPool(redis=redis, concurrency_limits={'slow_pipe': 1}))
+        test_client = TestPipelinesClient(app)
+        rq_jobs_before = set(redis.keys('rq:job:*'))
+
+        start = time.time()
+        responses = [test_client.call_pipeline(slow_pipe, pipeline_input=list(range(20))) for _ in range(2)]
+        for response in responses:
+            response = test_client.wait_for_job(response.job_id, slow_pipe, timeout=10.)
+            assert response.job_status == JobStatus.done
+            assert response.value == [not i % 2 for i in range(20)]
+        # each worker took a job but the second one was deferred until the first one was over
+        assert time.time() - start >= 2.
+        # the deferred jobs were deleted, only the jobs that ran (and hold the results) are left
+        assert len(set(redis.keys('rq:job:*')) - rq_jobs_before) == len(responses)
+
+
+def test_app_async_wait_for_job(tmpdir, opstore_func):
+    """tests long polling (`/jobs/wait`) the jobs executed by the rq workers"""
+    with RQWorkerContext():
+        slow_pipe = Pipeline([
+            Node(SlowIsPair(duration=1.), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+        ], name='slow_pipe', use_worker=True)
+        app = PipelinesServer([slow_pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=RQWorkerPool(redis=Redis()))
+        test_client = TestPipelinesClient(app)
+        response = test_client.call_pipeline(slow_pipe, pipeline_input=list(range(20)))
+
+        start = time.time()
+        assert test_client.wait_for_job(response.job_id, slow_pipe, timeout=0.2).job_status in {
+            JobStatus.queued, JobStatus.running}
+        assert time.time() - start < 1.5
+
+        # the request is woken up (by the worker) as soon as the job is over rather than at the timeout
+        response = test_client.wait_for_job(response.job_id, slow_pipe, timeout=30.)
+        assert time.time() - start < 10.
+        assert response.job_status == JobStatus.done
+        assert response.value == [not i % 2 for i in range(20)]
+
+
+def test_rq_worker_pool_unknown_queue():
+    """tests that the pipelines can only be routed to the queues of the pool"""
+    with pytest.raises(ValueError):
+        RQWorkerPool(redis=Redis(), queues=['inference'], pipeline_queues={'train': 'training'})
+
+
+def test_warm_pipeline_does_not_reload_ops():
+    """tests that the workers run the pipeline they were sent (with the ops the server loaded) without the op store"""
+    pipe1 = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='warm_pipe')
+    versions_key = _warm_pipelines.versions_key(pipe1)
+    serialized_pipeline = pickle.dumps(pipe1)
+    for _ in range(2):
+        # the pipeline is not trained so the op store is never needed (neither to load nor to save it)
+        result = _warm_pipelines.execute_warm_pipeline('warm_pipe', versions_key, lambda: serialized_pipeline,
+                                                       list(range(4)), SequentialRunner(), op_store_client=None)
+        assert json.loads(result) == [True, False, True, False]
+
+
+def test_app_local_workers(tmpdir, opstore_func):
+    """tests executing pipelines asynchronously in a local worker pool (without redis)"""
+    pipe1 = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='inner_pipe', use_worker=True)
+    worker_pool = LocalWorkerPool(n_workers=2, job_directory=str(tmpdir.join('jobs')))
+    try:
+        app = PipelinesServer([pipe1], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=worker_pool)
+        test_client = TestPipelinesClient(app)
+        responses = [test_client.call_pipeline(pipe1, pipeline_input=list(range(i))) for i in range(1, 5)]
+        failed_response = test_client.call_pipeline(pipe1, pipeline_input=['not a number'])
+        assert {response.job_status for response in responses} <= {JobStatus.queued, JobStatus.running}
+
+        for i, response in enumerate(responses, start=1):
+            response = test_client.wait_for_job(response.job_id, pipe1, timeout=5.)
+            assert response.job_status == JobStatus.done
+            assert response.value == [not j % 2 for j in range(i)]
+
+        assert test_client.wait_for_job(failed_response.job_id, pipe1, timeout=5.).job_status == JobStatus.failed
+    finally:
+        worker_pool.close()
+    assert worker_pool.n_workers == 0
+
+
+def test_local_workers_expire_jobs_and_pipelines(tmpdir, opstore_func):
+    """tests that the jobs and the pipelines sent to the local workers are removed once they expire"""
+    pipe1 = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='inner_pipe', use_worker=True)
+    job_directory = str(tmpdir.join('jobs'))
+    worker_pool = LocalWorkerPool(n_workers=1, job_directory=job_directory, job_ttl=60)
+    try:
+        app = PipelinesServer([pipe1], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=worker_pool)
+        test_client = TestPipelinesClient(app)
+        response = test_client.call_pipeline(pipe1, pipeline_input=list(range(4)))
+        assert test_client.wait_for_job(response.job_id, pipe1, timeout=5.).job_status == JobStatus.done
+        (pipeline_file,) = tmpdir.join('jobs', 'pipelines').listdir()
+        (job_file,) = tmpdir.join('jobs', 'jobs').listdir()
+
+        # the files used within the ttl are kept
+        worker_pool._last_cleanup = 0  # pylint: disable=protected-access
+        worker_pool._remove_expired_jobs()  # pylint: disable=protected-access
+        assert pipeline_file.exists() and job_file.exists()
+
+        expired_at = time.time() - 120
+        for path in [pipeline_file, job_file]:
+            path.setmtime(expired_at)
+        worker_pool._last_cleanup = 0  # pylint: disable=protected-access
+        worker_pool._remove_expired_jobs()  # pylint: disable=protected-access
+        assert not tmpdir.join('jobs', 'pipelines').listdir()
+        assert not tmpdir.join('jobs', 'jobs').listdir()
+    finally:
+        worker_pool.close()
+
+
+def test_app_local_workers_wait_and_events(tmpdir, opstore_func):
+    """tests long polling a job (`/jobs/wait`) and following it through its event stream"""
+    slow_pipe = Pipeline([
+        Node(IsPair(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='slow_pipe', use_worker=True)
+    worker_pool = LocalWorkerPool(n_workers=1, job_directory=str(tmpdir.join('jobs')))
+    try:
+        app = PipelinesServer([slow_pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=worker_pool)
+        test_client = TestPipelinesClient(app)
+        # the only worker is busy with the first job so the second one is still queued after the timeout
+        first_response = test_client.call_pipeline(slow_pipe, pipeline_input=list(range(200000)))
+        second_response = test_client.call_pipeline(slow_pipe, pipeline_input=list(range(10)))
+        start = time.time()
+        assert test_client.wait_for_job(second_response.job_id, slow_pipe, timeout=0.).job_status in {
+            JobStatus.queued, JobStatus.running}
+        assert time.time() - start < 1.
+
+        events = app.test_client().get('/jobs/events/{}'.format(first_response.job_id)).data.decode('utf-8')
+        statuses = [json.loads(event[len('data: '):])['job_status'] for event in events.split('\n\n') if event]
+        assert statuses[-1] == JobStatus.done.value
+        assert len(statuses) == len(set(statuses))
+
+        response = test_client.wait_for_job(second_response.job_id, slow_pipe, timeout=5.)
+        assert response.job_status == JobStatus.done
+        assert response.value == [not i % 2 for i in range(10)]
+    finally:
+        worker_pool.close()
+
+
+def test_app_local_workers_events_are_bounded(tmpdir, opstore_func, monkeypatch):
+    """tests that the event stream of a job is closed after `MAX_JOB_WAIT` seconds even if the job is not over"""
+    monkeypatch.setattr(pipelines_server, 'MAX_JOB_WAIT', 0.5)
+    slow_pipe = Pipeline([
+        Node(SlowIsPair(duration=3.), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], name='slow_pipe', use_worker=True)
+    worker_pool = LocalWorkerPool(n_workers=1, job_directory=str(tmpdir.join('jobs')))
+    try:
+        app = PipelinesServer([slow_pipe], op_store_client=opstore_func(tmpdir), import_name='some_app',
+                              worker_pool=worker_pool)
+        test_client = TestPipelinesClient(app)
+        response = test_client.call_pipeline(slow_pipe, pipeline_input=list(range(10)))
+
+        start = time.time()
+        events = app.test_client().get('/jobs/events/{}'.format(response.job_id)).data.decode('utf-8')
+        assert time.time() - start < 2.
+        statuses = [json.loads(event[len('data: '):])['job_status'] for event in events.split('\n\n') if event]
+        assert statuses
+        assert not JobStatus(statuses[-1]).is_finished
+    finally:
+        worker_pool.close()
+
+
 def test_app_async_conflicting_config(tmpdir, opstore_func):
     """
     tests the behavior when their are conflicts in the `use_workers` config (there is at least one True and one False)
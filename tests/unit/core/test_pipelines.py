@@ -1,10 +1,17 @@
 """module to test the behavior of the `Pipeline` class"""
+import os
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from chariots.ml.serializers import NumpySerializer, ParquetSerializer
+from chariots.op_store.savers import FileSaver
 from chariots.pipelines import Pipeline
+from chariots.pipelines.caches import NodeMemoizer
 from chariots.pipelines.ops import BaseOp
-from chariots.pipelines.nodes import ReservedNodes, Node
-from chariots.pipelines.runners import SequentialRunner
+from chariots.pipelines.nodes import ReservedNodes, Node, DataLoadingNode, DataSavingNode
+from chariots.pipelines.runners import SequentialRunner, StreamingRunner
 
 
 @pytest.fixture
@@ -105,3 +112,249 @@ def test_splited_outputs(SplitOnes, AddOne, Sum):  # pylint: disable=invalid-nam
     res = runner.run(pipe)
     assert len(res) == 1
     assert res == [4]
+
+
+def test_memoized_nodes(tmpdir, AddOne, IsPair):  # pylint: disable=invalid-name
+    """tests that memoized nodes are only re-executed when their inputs change"""
+
+    class CountingRange(BaseOp):
+        """op that counts the number of time it was executed"""
+
+        def __init__(self):
+            super().__init__()
+            self.n_calls = 0
+
+        def execute(self, max_value):  # pylint: disable=arguments-differ
+            self.n_calls += 1
+            return list(range(max_value))
+
+    range_op = CountingRange()
+    runner = SequentialRunner(memoizer=NodeMemoizer(FileSaver(str(tmpdir))))
+    pipe = Pipeline([
+        Node(range_op, input_nodes=['__pipeline_input__'], output_nodes='my_list', memoize=True),
+        Node(AddOne(), input_nodes=['my_list'], output_nodes='added'),
+        Node(IsPair(), input_nodes=['added'], output_nodes='__pipeline_output__')
+    ], name='my_pipe')
+
+    assert runner.run(pipe, 10) == [bool(i % 2) for i in range(10)]
+    assert runner.run(pipe, 10) == [bool(i % 2) for i in range(10)]
+    assert range_op.n_calls == 1
+    assert runner.run(pipe, 5) == [bool(i % 2) for i in range(5)]
+    assert range_op.n_calls == 2
+    assert (runner.memoizer.hits, runner.memoizer.misses) == (1, 2)
+
+
+def test_memoized_node_unpicklable_inputs(tmpdir):
+    """tests that the nodes whose inputs cannot be pickled (generators) are executed without memoization"""
+
+    class Chunks(BaseOp):
+        """op that streams its input in chunks"""
+
+        def execute(self, max_value):  # pylint: disable=arguments-differ
+            return (list(range(i, min(i + 2, max_value))) for i in range(0, max_value, 2))
+
+    class SumChunks(BaseOp):
+        """op that sums a stream of chunks"""
+
+        def execute(self, chunks):  # pylint: disable=arguments-differ
+            return sum(sum(chunk) for chunk in chunks)
+
+    runner = SequentialRunner(memoizer=NodeMemoizer(FileSaver(str(tmpdir))))
+    pipe = Pipeline([
+        Node(Chunks(), input_nodes=['__pipeline_input__'], output_nodes='chunks'),
+        Node(SumChunks(), input_nodes=['chunks'], output_nodes='__pipeline_output__', memoize=True)
+    ], name='chunks_pipe')
+    assert runner.run(pipe, 5) == 10
+    assert runner.run(pipe, 5) == 10
+    assert (runner.memoizer.hits, runner.memoizer.misses) == (0, 0)
+
+
+def test_memoized_node_unpicklable_output(tmpdir):
+    """tests that the outputs that cannot be pickled (generators) are not memoized"""
+
+    class Chunks(BaseOp):
+        """op that streams its input in chunks"""
+
+        def execute(self, max_value):  # pylint: disable=arguments-differ
+            return (list(range(i, min(i + 2, max_value))) for i in range(0, max_value, 2))
+
+    runner = SequentialRunner(memoizer=NodeMemoizer(FileSaver(str(tmpdir))))
+    pipe = Pipeline([
+        Node(Chunks(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__', memoize=True)
+    ], name='chunks_pipe')
+    assert list(runner.run(pipe, 5)) == [[0, 1], [2, 3], [4]]
+    assert list(runner.run(pipe, 5)) == [[0, 1], [2, 3], [4]]
+    assert (runner.memoizer.hits, runner.memoizer.misses) == (0, 2)
+    assert not tmpdir.join('memoized_nodes').exists()
+
+
+def test_partial_execution(SplitOnes, AddOne, Sum):  # pylint: disable=invalid-name, redefined-outer-name
+    """tests that only the nodes needed to compute the requested outputs are executed"""
+
+    class FailingOp(BaseOp):
+        """op that should never be executed"""
+
+        def execute(self, *args):  # pylint: disable=arguments-differ
+            raise AssertionError('node should not have been executed')
+
+    runner = SequentialRunner()
+    pipe = Pipeline([
+        Node(SplitOnes(), output_nodes=['left', 'right']),
+        Node(AddOne(), input_nodes=['left'], output_nodes=['new_left']),
+        Node(AddOne(), input_nodes=['right'], output_nodes=['new_right']),
+        Node(Sum(), input_nodes=['new_left', 'new_right'], output_nodes='sum'),
+        Node(FailingOp(), input_nodes=['sum'], output_nodes='__pipeline_output__')
+    ], 'partial_pipeline')
+
+    assert runner.run(pipe, outputs=['new_left']) == {'new_left': [2]}
+    assert runner.run(pipe, outputs=['new_right', 'sum']) == {'new_right': [2], 'sum': [4]}
+    with pytest.raises(ValueError):
+        runner.run(pipe, outputs=['foo'])
+
+
+def test_streaming_runner(AddOne, Sum, IsPair):  # pylint: disable=invalid-name, redefined-outer-name
+    """tests that the streaming runner executes the pipeline on each chunk and the static nodes only once"""
+
+    class CountingSplitOnes(BaseOp):
+        """op that counts the number of times it got executed"""
+        n_calls = 0
+
+        def execute(self):  # pylint: disable=arguments-differ
+            CountingSplitOnes.n_calls += 1
+            return [1], [1]
+
+    runner = StreamingRunner(queue_size=1)
+    pipe = Pipeline([
+        Node(CountingSplitOnes(), output_nodes=['left', 'right']),
+        Node(Sum(), input_nodes=['left', 'right'], output_nodes='two'),
+        Node(AddOne(), input_nodes=['__pipeline_input__'], output_nodes='added'),
+        Node(Sum(), input_nodes=['added', 'two'], output_nodes='summed'),
+        Node(IsPair(), input_nodes=['summed'], output_nodes='__pipeline_output__')
+    ], 'streamed_pipeline')
+
+    chunks = ([i] for i in range(10))
+    assert list(runner.run(pipe, chunks)) == [[bool(i % 2)] for i in range(10)]
+    assert CountingSplitOnes.n_calls == 1
+    assert list(runner.run(pipe, iter([[1], [2]]), outputs=['two', 'summed'])) == [
+        {'two': [2], 'summed': [4]}, {'two': [2], 'summed': [5]}
+    ]
+
+
+def test_streaming_runner_errors(AddOne, IsPair):  # pylint: disable=invalid-name
+    """tests that the streaming runner propagates errors and refuses nodes that need the whole dataset"""
+
+    class FittingOp(BaseOp):
+        """op that needs all the data at once"""
+
+        requires_full_dataset = True
+
+        def execute(self, data):  # pylint: disable=arguments-differ
+            return data
+
+    runner = StreamingRunner()
+    pipe = Pipeline([
+        Node(AddOne(), input_nodes=['__pipeline_input__'], output_nodes='added'),
+        Node(IsPair(), input_nodes=['added'], output_nodes='__pipeline_output__')
+    ], 'streamed_pipeline')
+    with pytest.raises(TypeError):
+        list(runner.run(pipe, iter([[1], ['foo'], [3]])))
+
+    fitting_pipe = Pipeline([
+        Node(FittingOp(), input_nodes=['__pipeline_input__'], output_nodes='__pipeline_output__')
+    ], 'fitting_pipeline')
+    with pytest.raises(ValueError):
+        runner.run(fitting_pipe, iter([[1]]))
+
+
+def test_data_nodes(tmpdir, AddOne):  # pylint: disable=invalid-name, redefined-outer-name
+    """tests saving and loading datasets (in chunks and partitions) with the data nodes"""
+    saver = FileSaver(str(tmpdir))
+    runner = SequentialRunner(memoizer=NodeMemoizer(FileSaver(str(tmpdir.join('memoizer')))))
+
+    save_lists = Pipeline([DataSavingNode('/lists', input_nodes=['__pipeline_input__'], chunk_size=3)], 'save_lists')
+    load_lists = Pipeline([
+        DataLoadingNode('/lists', output_nodes='my_list', n_jobs=2),
+        Node(AddOne(), input_nodes=['my_list'], output_nodes='__pipeline_output__', memoize=True)
+    ], 'load_lists')
+    save_lists.pipeline_nodes[0].attach_saver(saver)
+    load_lists.pipeline_nodes[0].attach_saver(saver)
+
+    runner.run(save_lists, list(range(10)))
+    assert runner.run(load_lists) == list(range(1, 11))
+    version = load_lists.pipeline_nodes[0].node_version
+    assert runner.run(load_lists) == list(range(1, 11))
+    runner.run(save_lists, iter([[1, 2], [3]]))
+    # the loading node sticks to the version it loaded until it is reloaded
+    assert load_lists.pipeline_nodes[0].node_version == version
+    assert runner.run(load_lists) == list(range(1, 11))
+    load_lists.pipeline_nodes[0].load_latest_version(None)
+    assert load_lists.pipeline_nodes[0].node_version > version
+    assert save_lists.pipeline_nodes[0].node_version == load_lists.pipeline_nodes[0].node_version
+    assert runner.run(load_lists) == [2, 3, 4]
+    assert (runner.memoizer.hits, runner.memoizer.misses) == (2, 2)
+
+    array = np.arange(20).reshape(10, 2)
+    runner.run(Pipeline([DataSavingNode('/arrays', saver, NumpySerializer(), input_nodes=['__pipeline_input__'],
+                                        chunk_size=4)], 'save_arrays'), array)
+    loaded = runner.run(Pipeline([DataLoadingNode('/arrays', saver, NumpySerializer(mmap_mode='r'),
+                                                  output_nodes='__pipeline_output__')], 'load_arrays'))
+    np.testing.assert_array_equal(loaded, array)
+    array_writes = tmpdir.join('arrays', 'writes')
+    assert len(os.listdir(str(array_writes))) == 1
+    assert len(os.listdir(str(array_writes.join(os.listdir(str(array_writes))[0])))) == 4  # the parts and the manifest
+
+    with pytest.raises(FileNotFoundError):
+        runner.run(Pipeline([DataLoadingNode('/missing', saver, output_nodes='__pipeline_output__')], 'missing'))
+    with pytest.raises(ValueError):
+        DataLoadingNode('/arrays', saver, NumpySerializer(), columns=['foo'])
+    with pytest.raises(TypeError):
+        runner.run(Pipeline([DataSavingNode('/arrays', saver, NumpySerializer(), partition_by='foo',
+                                            input_nodes=['__pipeline_input__'])], 'partition_arrays'), array)
+
+
+def test_data_node_version_is_cached(tmpdir):
+    """tests that the version of a data node does not read the manifest from the saver at each access"""
+
+    class CountingSaver(FileSaver):
+        """file saver that counts the loads"""
+
+        def __init__(self, root_path):
+            super().__init__(root_path)
+            self.n_loads = 0
+
+        def load(self, path):
+            self.n_loads += 1
+            return super().load(path)
+
+    saver = CountingSaver(str(tmpdir))
+    save_node = DataSavingNode('/lists', saver, input_nodes=['__pipeline_input__'])
+    SequentialRunner().run(Pipeline([save_node], 'save_lists'), [1, 2, 3])
+    load_node = DataLoadingNode('/lists', saver, output_nodes='__pipeline_output__')
+    versions = [load_node.node_version for _ in range(10)] + [save_node.node_version for _ in range(10)]
+    assert all(version == versions[0] for version in versions)
+    assert saver.n_loads == 1
+    # executing the node does not read the manifest again either (the parts are read from their local files)
+    assert SequentialRunner().run(Pipeline([load_node], 'load_lists')) == [1, 2, 3]
+    assert saver.n_loads == 1
+
+
+def test_partitioned_data_nodes(tmpdir):
+    """tests loading some of the partitions and columns of a data frame"""
+    pytest.importorskip('pyarrow')
+    saver = FileSaver(str(tmpdir))
+    runner = SequentialRunner()
+    data_frame = pd.DataFrame({'country': ['fr', 'us', 'fr', 'de', 'us'], 'amount': np.arange(5)})
+
+    runner.run(Pipeline([DataSavingNode('/sales', saver, ParquetSerializer(), partition_by='country',
+                                        input_nodes=['__pipeline_input__'])], 'save_sales'), data_frame)
+    assert sorted(os.listdir(str(tmpdir.join('sales')))) == ['_manifest.json', 'writes']
+    sales_write = tmpdir.join('sales', 'writes', os.listdir(str(tmpdir.join('sales', 'writes')))[0])
+    assert sorted(os.listdir(str(sales_write))) == ['_manifest.json', 'country=de', 'country=fr', 'country=us']
+
+    def load(**kwargs):
+        return runner.run(Pipeline([DataLoadingNode('/sales', saver, ParquetSerializer(),
+                                                    output_nodes='__pipeline_output__', **kwargs)], 'load_sales'))
+
+    assert sorted(load()['amount']) == list(range(5))
+    pd.testing.assert_frame_equal(load(partitions=['fr', 'de'], columns=['amount']),
+                                  pd.DataFrame({'amount': [3, 0, 2]}, index=[3, 0, 2]))
@@ -5,9 +5,15 @@ import os
 import random
 
 import dill
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
 
 from chariots.op_store.savers import FileSaver
-from chariots.ml.serializers import DillSerializer, JSONSerializer
+from chariots.ml.serializers import _mmap_file
+from chariots.ml.serializers import (DillSerializer, JSONSerializer, PickleSerializer, JoblibSerializer,
+                                     NumpySerializer, ParquetSerializer, FeatherSerializer)
 
 
 def test_file_saver(tmpdir):
@@ -56,3 +62,96 @@ def test_json_serialisation():
 
     deserialized = json_serializer.deserialize_object(serialised_bytes)
     assert deserialized == mapping
+
+
+def test_array_serializers(tmpdir):
+    """tests the serializers optimized for objects holding large numpy arrays"""
+    model = LinearRegression().fit(np.arange(10).reshape(-1, 1), np.arange(10) + 1)
+    arrays = {'x': np.arange(1000, dtype=np.float64).reshape(-1, 10), 'y': np.ones(3, dtype=np.int32)}
+
+    for serializer in [PickleSerializer(), PickleSerializer(protocol=4), JoblibSerializer(),
+                       JoblibSerializer(compress=3), JoblibSerializer(mmap_mode='r', mmap_directory=str(tmpdir))]:
+        loaded_model = serializer.deserialize_object(serializer.serialize_object(model))
+        np.testing.assert_allclose(loaded_model.predict([[20]]), [21])
+        loaded_arrays = serializer.deserialize_object(serializer.serialize_object(arrays))
+        for name, array in arrays.items():
+            np.testing.assert_array_equal(loaded_arrays[name], array)
+            assert loaded_arrays[name].dtype == array.dtype
+
+    loaded_arrays = PickleSerializer().deserialize_object(PickleSerializer().serialize_object(arrays))
+    loaded_arrays['x'][0, 0] = 42
+    assert len(os.listdir(str(tmpdir))) == 2
+
+    with pytest.raises(ValueError):
+        JoblibSerializer(compress=3, mmap_mode='r')
+
+
+def test_mmap_files_are_bounded(tmpdir, monkeypatch):
+    """tests that only the most recently loaded memory mapped files are kept"""
+    monkeypatch.setattr(_mmap_file, 'MAX_MMAP_FILES', 3)
+    serializer = JoblibSerializer(mmap_mode='r', mmap_directory=str(tmpdir))
+    loaded_arrays = [serializer.deserialize_object(serializer.serialize_object(np.arange(i + 1))) for i in range(5)]
+    assert len(os.listdir(str(tmpdir))) == 3
+    # the arrays of the removed files are still mapped
+    for i, array in enumerate(loaded_arrays):
+        np.testing.assert_array_equal(array, np.arange(i + 1))
+    # loading an object again marks its file as recently used
+    serialized_object = serializer.serialize_object(np.arange(3))
+    serializer.deserialize_object(serialized_object)
+    serializer.deserialize_object(serializer.serialize_object(np.arange(10)))
+    assert len(os.listdir(str(tmpdir))) == 3
+    assert 'chariots_{}.joblib'.format(hashlib.sha1(serialized_object).hexdigest()) in os.listdir(str(tmpdir))
+
+
+def test_numpy_serialisation():
+    """tests the `NumpySerializer` class"""
+    for serializer in [NumpySerializer(), NumpySerializer(compress=True)]:
+        array = np.arange(12).reshape(3, 4)
+        np.testing.assert_array_equal(serializer.deserialize_object(serializer.serialize_object(array)), array)
+        arrays = {'x': array, 'y': np.zeros(2)}
+        deserialized = serializer.deserialize_object(serializer.serialize_object(arrays))
+        assert set(deserialized) == {'x', 'y'}
+        np.testing.assert_array_equal(deserialized['x'], array)
+
+    with pytest.raises(TypeError):
+        NumpySerializer().serialize_object([1, 2, 3])
+
+
+def test_columnar_serializers(tmpdir):
+    """tests the `ParquetSerializer` and `FeatherSerializer` classes"""
+    pytest.importorskip('pyarrow')
+    data_frame = pd.DataFrame({
+        'int': np.arange(5, dtype=np.int16),
+        'float': np.linspace(0, 1, 5),
+        'date': pd.date_range('2020-01-01', periods=5),
+        'category': pd.Categorical(['a', 'b', 'a', 'c', 'b']),
+    })
+
+    for serializer in [ParquetSerializer(), ParquetSerializer(compression='gzip'), FeatherSerializer(),
+                       FeatherSerializer(memory_map=True, mmap_directory=str(tmpdir))]:
+        pd.testing.assert_frame_equal(serializer.deserialize_object(serializer.serialize_object(data_frame)),
+                                      data_frame)
+        with pytest.raises(TypeError):
+            serializer.serialize_object(np.arange(5))
+
+    for serializer in [ParquetSerializer(columns=['int', 'date']),
+                       FeatherSerializer(columns=['int', 'date'], memory_map=True, mmap_directory=str(tmpdir))]:
+        pd.testing.assert_frame_equal(serializer.deserialize_object(serializer.serialize_object(data_frame)),
+                                      data_frame[['int', 'date']])
+    assert len(os.listdir(str(tmpdir))) == 1
+
+    indexed_frames = [
+        data_frame.set_index('date'),
+        data_frame.set_index(['category', 'int']),
+        data_frame.set_index(pd.Index(['a', 'b', 'c', 'd', 'e'])),
+        data_frame.iloc[2:],
+    ]
+    for serializer in [ParquetSerializer(), FeatherSerializer(),
+                       FeatherSerializer(memory_map=True, mmap_directory=str(tmpdir.mkdir('mmap')))]:
+        for indexed_frame in indexed_frames:
+            pd.testing.assert_frame_equal(serializer.deserialize_object(serializer.serialize_object(indexed_frame)),
+                                          indexed_frame)
+    indexed_frame = data_frame.set_index(['category', 'int'])
+    serializer = FeatherSerializer(columns=['float'])
+    pd.testing.assert_frame_equal(serializer.deserialize_object(serializer.serialize_object(indexed_frame)),
+                                  indexed_frame[['float']])
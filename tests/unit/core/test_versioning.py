@@ -1,4 +1,10 @@
 """tests versioning and the `VersionableMeta` meta-class"""
+import datetime as dt
+import hashlib
+import pickle
+
+import pytest
+
 from chariots.versioning import Version, VersionType, VersionableMeta, VersionedField, VersionedFieldDict
 
 
@@ -117,3 +123,24 @@ def test_versioned_field_dict_only_overrides():
     assert versioned_dict.version_dict['bar'].major == empty_version.major
     assert versioned_dict.version_dict['bar'].minor == empty_version.minor
     assert versioned_dict.version_dict['bar'].patch != empty_version.patch
+
+
+def test_version_parse_and_finalize():
+    """tests that versions get finalized when read and can be parsed back from their string representation"""
+    version = Version().update_major(b'foo').update_patch(b'bar')
+    assert not version.is_finalized
+    assert version.major == hashlib.sha1(b'foo').hexdigest()
+    assert version.is_finalized
+    with pytest.raises(ValueError):
+        version.update_minor(b'baz')
+
+    parsed = Version.parse(str(version))
+    assert parsed == version
+    assert hash(parsed) == hash(version)
+    assert parsed.creation_time == version.creation_time
+    assert not hasattr(parsed, '__dict__')
+
+    no_microseconds = Version.parse('{}.{}.{}_2020-01-01 10:00:00'.format(version.major, version.minor, version.patch))
+    assert no_microseconds.creation_time == dt.datetime(2020, 1, 1, 10)
+    assert pickle.loads(pickle.dumps(parsed)) == parsed
+    assert str(pickle.loads(pickle.dumps(Version().update_major(b'foo')))).startswith(version.major)
@@ -1,14 +1,16 @@
 """module that tests the Keras integration"""
 import numpy as np
+import pytest
 from flaky import flaky
-from keras import models, layers, optimizers, callbacks
+from keras import models, layers, optimizers, callbacks, utils
 
 from chariots.pipelines import Pipeline, PipelinesServer
 from chariots.pipelines.nodes import Node
 from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner
 from chariots.ml import MLMode
 from chariots.ml.keras import KerasOp
-from chariots.versioning import VersionedFieldDict, VersionType
+from chariots.versioning import VersionedFieldDict, VersionedField, VersionType
 from chariots.testing import TestPipelinesClient
 from chariots._helpers.test_helpers import FromArray, ToArray, LinearDataSet, KerasLogistic
 
@@ -109,3 +111,79 @@ def test_keras_multiple_datasets(tmpdir, opstore_func):
     for batch_predictions, batch_inputs in zip(pred, inputs):
         assert len(batch_predictions) == 1
         assert batch_inputs[0][0] < batch_predictions[0] < batch_inputs[0][0] + 2
+
+
+class LinearSequence(utils.Sequence):
+    """keras sequence of batches with a linear relationship between X and y"""
+
+    def __len__(self):
+        return 10
+
+    def __getitem__(self, index):
+        return LinearDataSet().execute()
+
+
+def linear_chunks(n_chunks=5):
+    """generator of chunks with a linear relationship between X and y"""
+    for _ in range(n_chunks):
+        yield LinearDataSet().execute()
+
+
+@flaky(5, 1)
+def test_keras_generator_training():
+    """tests training a keras op on an iterator of chunks and on a keras sequence"""
+    runner = SequentialRunner()
+
+    for mode, input_data in [(MLMode.FIT, linear_chunks(200)), (MLMode.FIT_INCREMENTAL, linear_chunks(200)),
+                             (MLMode.FIT, LinearSequence())]:
+        train_op = KerasLogistic(mode, verbose=0, max_queue_size=2)
+        initial_version = train_op.op_version
+        train = Pipeline([Node(train_op, input_nodes=['__pipeline_input__'])], 'train')
+        runner.run(train, input_data)
+        assert train_op.op_version > initial_version
+
+        pred_op = KerasLogistic(MLMode.PREDICT)
+        pred_op.load(train_op.serialize())
+        prediction = pred_op.predict(np.array([[5]]))
+        assert 5 < prediction[0][0] < 7
+
+
+def test_keras_chunks_single_epoch():
+    """tests that a stream of chunks is a single epoch (each chunk is fitted once whatever the `epochs` parameter)"""
+    train_op = KerasLogistic(MLMode.FIT, verbose=0)
+    fit_calls = []
+    model_fit = train_op._model.fit  # pylint: disable=protected-access
+
+    def recording_fit(*args, **kwargs):
+        fit_calls.append(kwargs['epochs'])
+        return model_fit(*args, **kwargs)
+
+    train_op._model.fit = recording_fit  # pylint: disable=protected-access
+    train_op.fit(linear_chunks(3))
+    assert fit_calls == [1, 1, 1]
+
+
+def test_keras_prefetch_errors():
+    """tests that the errors raised while preparing the chunks are propagated to the training"""
+
+    def failing_chunks():
+        yield np.array([[1]]), np.array([2])
+        raise RuntimeError('could not read chunk')
+
+    train_op = KerasLogistic(MLMode.FIT, verbose=0)
+    with pytest.raises(RuntimeError):
+        train_op.fit(failing_chunks())
+
+
+def test_keras_batched_prediction():
+    """tests the batched predictions of a keras model with multiple inputs"""
+
+    class BatchedMultiInputKeras(MultiInputKeras):
+        """batched version of the multiple input op"""
+        predict_batch_size = VersionedField(3, VersionType.PATCH)
+
+    pred_op = BatchedMultiInputKeras(MLMode.PREDICT)
+    inputs = [np.arange(10).reshape(-1, 1), -np.arange(10).reshape(-1, 1)]
+    batched_predictions = pred_op.execute(inputs)
+    assert batched_predictions.shape == (10, 1)
+    np.testing.assert_allclose(batched_predictions, pred_op.predict(inputs), rtol=1e-5)
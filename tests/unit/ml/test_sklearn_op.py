@@ -1,5 +1,18 @@
 """module that tests the sci-kit learn MLOp API"""
-from chariots.pipelines.runners import SequentialRunner
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import SGDRegressor, Ridge
+
+from chariots.ml import MLMode
+from chariots.ml.sklearn import SKSupervisedOp, SKSearchOp
+from chariots.pipelines import Pipeline
+from chariots.pipelines.callbacks import OpCallBack
+from chariots.pipelines.nodes import Node
+from chariots.pipelines.ops import BaseOp
+from chariots.pipelines.runners import SequentialRunner, StreamingRunner
+from chariots.versioning import VersionedFieldDict, VersionedField, VersionType
+from chariots._helpers.test_helpers import SKLROp, YOp
 
 
 def test_sk_training_pipeline(basic_sk_pipelines):  # pylint: disable=invalid-name
@@ -14,3 +27,200 @@ def test_sk_training_pipeline(basic_sk_pipelines):  # pylint: disable=invalid-na
 
     for i, individual_value in enumerate(response):
         assert abs(101 + i - individual_value) < 1e-5
+
+
+class ChunkedLinearDataSet(BaseOp):
+    """op that returns a linear dataset as generators of chunks"""
+
+    def execute(self):  # pylint: disable=arguments-differ
+        x_chunks = (np.arange(i, i + 10).reshape(-1, 1) / 100 for i in range(0, 100, 10))
+        y_chunks = (np.arange(i, i + 10) / 100 + 1 for i in range(0, 100, 10))
+        return x_chunks, y_chunks
+
+
+class SGDOp(SKSupervisedOp):
+    """incremental linear regression op"""
+    model_class = SGDRegressor
+    model_parameters = VersionedFieldDict(VersionType.MAJOR, {'max_iter': 1000, 'tol': None})
+
+
+def test_sk_incremental_training():
+    """tests training a scikit-learn op chunk by chunk with `partial_fit`"""
+    train_op = SGDOp(mode=MLMode.FIT_INCREMENTAL)
+    train_pipe = Pipeline([
+        Node(ChunkedLinearDataSet(), output_nodes=['x_chunks', 'y_chunks']),
+        Node(train_op, input_nodes=['x_chunks', 'y_chunks'])
+    ], name='train_incremental')
+
+    runner = SequentialRunner()
+    initial_version = train_op.op_version
+    for _ in range(20):
+        runner.run(train_pipe)
+    trained_version = train_op.op_version
+    assert trained_version > initial_version
+    assert trained_version.major == initial_version.major
+    assert trained_version.minor == initial_version.minor
+
+    pred_op = SGDOp(mode=MLMode.PREDICT)
+    pred_op.load(train_op.serialize())
+    assert pred_op.op_version.patch == trained_version.patch
+    prediction = pred_op.predict(np.array([[0.5]]))
+    assert abs(prediction[0] - 1.5) < 0.1
+
+    with pytest.raises(ValueError):
+        SKLROp(mode=MLMode.FIT_INCREMENTAL)
+
+    x_chunks, y_chunks = ChunkedLinearDataSet().execute()
+    with pytest.raises(ValueError):
+        SGDOp(mode=MLMode.FIT_INCREMENTAL).partial_fit(x_chunks, (y_chunk for y_chunk in list(y_chunks)[:-1]))
+
+
+class SplitChunk(BaseOp):
+    """op that splits an `(X, y)` chunk"""
+
+    def execute(self, chunk):  # pylint: disable=arguments-differ
+        return chunk
+
+
+def test_sk_streaming_incremental_training():
+    """tests training a scikit-learn op in the `FIT_INCREMENTAL` mode with the streaming runner"""
+    train_op = SGDOp(mode=MLMode.FIT_INCREMENTAL)
+    train_pipe = Pipeline([
+        Node(SplitChunk(), input_nodes=['__pipeline_input__'], output_nodes=['x_chunk', 'y_chunk']),
+        Node(train_op, input_nodes=['x_chunk', 'y_chunk'])
+    ], name='train_streaming')
+
+    runner = StreamingRunner()
+    for _ in range(20):
+        list(runner.run(train_pipe, zip(*ChunkedLinearDataSet().execute())))
+    assert abs(train_op.predict(np.array([[0.5]]))[0] - 1.5) < 0.1
+
+
+class VersionRecorder(OpCallBack):
+    """callback that records the version of the op after each of its executions"""
+
+    def __init__(self):
+        self.versions = []
+
+    def after_execution(self, callback_op, args, output):
+        self.versions.append(callback_op.op_version)
+
+
+def test_sk_streaming_version_updated_once():
+    """tests that the streaming runner only updates the version of an incremental op once per stream"""
+    recorder = VersionRecorder()
+    train_op = SGDOp(mode=MLMode.FIT_INCREMENTAL, op_callbacks=[recorder])
+    train_pipe = Pipeline([
+        Node(SplitChunk(), input_nodes=['__pipeline_input__'], output_nodes=['x_chunk', 'y_chunk']),
+        Node(train_op, input_nodes=['x_chunk', 'y_chunk'])
+    ], name='train_streaming')
+    initial_version = train_op.op_version
+
+    list(StreamingRunner().run(train_pipe, zip(*ChunkedLinearDataSet().execute())))
+    # the op was updated with each chunk but its version did not change until the end of the stream
+    assert len(recorder.versions) == 10
+    assert all(version is initial_version for version in recorder.versions)
+    trained_version = train_op.op_version
+    assert trained_version != initial_version
+
+    # a second stream is a second training pass
+    list(StreamingRunner().run(train_pipe, zip(*ChunkedLinearDataSet().execute())))
+    assert train_op.op_version != trained_version
+
+
+def test_sk_cached_op_version():
+    """tests that the version of an ML op is only rebuilt when it gets trained or loaded"""
+    x_train, y_train = np.arange(10).reshape(-1, 1), np.arange(10)
+    train_op = SKLROp(mode=MLMode.FIT)
+    initial_version = train_op.op_version
+    assert train_op.op_version is initial_version
+    assert isinstance(initial_version.major, str)
+
+    # calling `fit` directly (outside of a pipeline) does not change the version of the op
+    train_op.fit(x_train, y_train)
+    assert train_op.op_version is initial_version
+    train_op.execute(x_train, y_train)
+    trained_version = train_op.op_version
+    assert trained_version > initial_version
+    assert train_op.op_version is trained_version
+
+    pred_op = SKLROp(mode=MLMode.PREDICT)
+    pred_version = pred_op.op_version
+    pred_op.load(train_op.serialize())
+    assert pred_op.op_version is not pred_version
+    assert pred_op.op_version == trained_version
+
+
+def test_sk_batched_prediction(basic_sk_pipelines):  # pylint: disable=invalid-name
+    """tests that predicting batch by batch gives the same results as predicting all the rows at once"""
+    train_pipe, _ = basic_sk_pipelines
+    SequentialRunner().run(train_pipe)
+    op_bytes = train_pipe.node_for_name['sklrop']._op.serialize()  # pylint: disable=protected-access
+
+    class BatchedSKLROp(SKLROp):
+        """batched version of the linear regression op"""
+        predict_batch_size = VersionedField(7, VersionType.PATCH)
+        predict_n_jobs = 2
+
+    x_pred = np.arange(100).reshape(-1, 1)
+    pred_op = SKLROp(mode=MLMode.PREDICT)
+    pred_op.load(op_bytes)
+    batched_op = BatchedSKLROp(mode=MLMode.PREDICT)
+    batched_op.load(op_bytes)
+
+    batched_predictions = batched_op.execute(x_pred)
+    assert isinstance(batched_predictions, np.ndarray)
+    np.testing.assert_allclose(batched_predictions, pred_op.execute(x_pred))
+    np.testing.assert_allclose(batched_op.execute(x_pred[:5]), pred_op.execute(x_pred[:5]))
+    assert batched_op.op_version.patch != pred_op.op_version.patch
+
+    class SeriesSKLROp(BatchedSKLROp):  # pylint: disable=too-many-ancestors
+        """batched linear regression op predicting pandas series"""
+
+        def predict(self, X):
+            return pd.Series(super().predict(X), index=X.index)
+
+    series_op = SeriesSKLROp(mode=MLMode.PREDICT)
+    series_op.load(op_bytes)
+    x_frame = pd.DataFrame({'x': np.arange(100)}, index=np.arange(100) * 2)
+    series_predictions = series_op.execute(x_frame)
+    assert isinstance(series_predictions, pd.Series)
+    assert list(series_predictions.index) == list(x_frame.index)
+    np.testing.assert_allclose(series_predictions.values, pred_op.execute(x_pred))
+
+
+class RidgeSearchOp(SKSearchOp):
+    """hyper parameter search over a ridge regression"""
+    model_class = Ridge
+    search_parameters = VersionedFieldDict(VersionType.MAJOR, {'alpha': [1e-3, 1e3, 1e6],
+                                                               'fit_intercept': [True, False]})
+    n_jobs = 2
+
+
+def test_sk_search_op(XTrainOp):  # pylint: disable=invalid-name
+    """tests that the search op keeps the best candidate and versions the chosen parameters"""
+    x_train, y_train = np.arange(100).reshape(-1, 1), np.arange(100) + 1
+    search_op = RidgeSearchOp(mode=MLMode.FIT)
+    search_op.fit(x_train, y_train)
+    assert search_op.best_parameters == {'alpha': 1e-3, 'fit_intercept': True}
+
+    pred_op = RidgeSearchOp(mode=MLMode.PREDICT)
+    untrained_version = pred_op.op_version
+    pred_op.load(search_op.serialize())
+    assert pred_op.best_parameters == search_op.best_parameters
+    assert pred_op.op_version != untrained_version
+    np.testing.assert_allclose(pred_op.execute(np.array([[200]])), [201], rtol=1e-3)
+
+    class RandomRidgeSearchOp(RidgeSearchOp):  # pylint: disable=too-many-ancestors
+        """randomized version of the ridge search"""
+        n_candidates = VersionedField(2, VersionType.MAJOR)
+        search_random_state = VersionedField(0, VersionType.MAJOR)
+
+    random_op = RandomRidgeSearchOp(mode=MLMode.FIT)
+    train_pipe = Pipeline([
+        Node(XTrainOp(), output_nodes='x_train'),
+        Node(YOp(), output_nodes='y_train'),
+        Node(random_op, input_nodes=['x_train', 'y_train'])
+    ], name='train_search')
+    SequentialRunner().run(train_pipe)
+    assert set(random_op.best_parameters) == {'alpha', 'fit_intercept'}
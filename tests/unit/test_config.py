@@ -94,6 +94,15 @@ def test_workers_config_worker_type_str():
         test_config = config.WorkersConfig(**config_dict)
         assert isinstance(test_config.get_worker_pool(), workers.RQWorkerPool)
 
+    for type_str in ['local', 'LocalWorkerPool']:
+        config_dict['worker_type'] = type_str
+        config_dict['worker_pool_kwargs'] = {'n_workers': 1}
+        worker_pool = config.WorkersConfig(**config_dict).get_worker_pool()
+        assert isinstance(worker_pool, workers.LocalWorkerPool)
+        assert worker_pool.n_workers == 1
+        worker_pool.close()
+    del config_dict['worker_pool_kwargs']
+
     config_dict['worker_type'] = 'wrong-config-str'
     with pytest.raises(ValueError):
         config.WorkersConfig(**config_dict)
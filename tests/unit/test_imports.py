@@ -0,0 +1,40 @@
+"""tests that importing chariots stays fast (the heavy optional integrations are only imported when used)"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+# generous budget (a cold `import chariots` takes about half a second): importing keras alone takes more than that
+IMPORT_TIME_BUDGET_S = 2.
+
+HEAVY_MODULES = ['keras', 'tensorflow', 'sklearn', 'pandas', 'numpy', 'google.cloud.storage', 'rq', 'redis', 'alembic']
+
+
+def _import_in_subprocess(statement):
+    script = (
+        'import json, sys, time\n'
+        'start = time.perf_counter()\n'
+        '{}\n'
+        'print(json.dumps({{"import_time_s": time.perf_counter() - start, "modules": list(sys.modules)}}))'
+    ).format(statement)
+    output = subprocess.check_output([sys.executable, '-c', script], stderr=subprocess.DEVNULL)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='lazy imports need module level `__getattr__` (python 3.7)')
+def test_import_chariots_is_lazy():
+    """tests that `import chariots` does not import the heavy integrations and stays within its time budget"""
+    result = _import_in_subprocess('import chariots')
+    assert [module for module in HEAVY_MODULES if module in result['modules']] == []
+    assert result['import_time_s'] < IMPORT_TIME_BUDGET_S
+
+
+def test_lazy_attributes_are_importable():
+    """tests that the lazy attributes are imported on access"""
+    result = _import_in_subprocess('import chariots\n'
+                                   'chariots.ml.sklearn.SKSupervisedOp, chariots.workers.RQWorkerPool\n'
+                                   'from chariots.pipelines.caches import RedisResultCache\n'
+                                   'from chariots.op_store.savers import GoogleStorageSaver')
+    assert {'sklearn', 'rq', 'redis', 'google.cloud.storage'} <= set(result['modules'])
+    assert 'keras' not in result['modules']